@@ -8,15 +8,19 @@ from flask import Flask, request, jsonify, send_from_directory
 from flask_cors import CORS
 import os
 import asyncio
+import signal
+import sys
 import threading
 from typing import Dict, Optional
 import json
 
+from continuous.buffered_logging import configure_buffered_logging
 from continuous.state_manager import StateManager
 from continuous.llm_generator import LLMGenerator
 from continuous.connections.asana_connection import AsanaClientPool
 from continuous.connections.okta_connection import OktaClientPool
 from continuous.connections.salesforce_connection import SalesforceClientPool
+from continuous.rate_limiter import AsyncRateLimiter
 from continuous.services.asana_service import AsanaService, ContinuousService
 from continuous.services.okta_service import OktaService
 from continuous.services.salesforce_service import SalesforceService
@@ -25,8 +29,14 @@ from continuous.prospect_context_analyzer import ProspectContextAnalyzer
 app = Flask(__name__)
 CORS(app)  # Enable CORS for local development
 
+# Route service log output through the shared background log writer, before
+# any service (including ones rebuilt without __init__) starts logging
+configure_buffered_logging()
+
 # Global state
-state_manager = StateManager(".")
+# PERSIST_ACTIVITY_LOG=0 keeps activity entries out of the job files (the
+# dashboard's activity feed stays empty), and services skip building them
+state_manager = StateManager(".", persist_activity_log=os.environ.get('PERSIST_ACTIVITY_LOG', '1') != '0')
 running_services: Dict[str, ContinuousService] = {}
 service_threads: Dict[str, threading.Thread] = {}
 
@@ -106,6 +116,19 @@ def restart_running_jobs():
                         service.paused = (job_summary['status'] in ['paused', 'stopped'])
                         service.deleted = False  # Initialize deleted flag
 
+                        # Instance state normally set up by AsanaService.__init__
+                        service.workspace_custom_fields = {}
+                        service.workspace_tags = {}
+                        service.workspace_portfolios = {}
+                        service._tasks_by_assignee = {}
+                        service._assignee_index_source = None
+                        service._limiter = AsyncRateLimiter(max_rate=ContinuousService.CLEANUP_REQUESTS_PER_SECOND,
+                                                            time_period=1)
+                        service._state_dirty = False
+                        service._pending_state_ops = []
+                        service._state_ops_lock = threading.Lock()
+                        service._flush_task = None
+
                     elif connection_type == 'okta':
                         # Create Okta client pool
                         okta_pool = OktaClientPool(config['user_tokens'])
@@ -771,6 +794,13 @@ def cleanup_job(job_id):
             service.workspace_custom_fields = {}
             service.workspace_tags = {}
             service.workspace_portfolios = {}
+            service._tasks_by_assignee = {}
+            service._assignee_index_source = None
+            service._limiter = AsyncRateLimiter(max_rate=ContinuousService.CLEANUP_REQUESTS_PER_SECOND,
+                                                time_period=1)
+
+            # State was loaded just above, no need to re-read it before cleanup
+            service._state_dirty = False
 
             # Run cleanup synchronously in this thread
             loop = asyncio.new_event_loop()
@@ -2035,6 +2065,18 @@ if __name__ == '__main__':
     print("Press Ctrl+C to stop")
     print("=" * 60)
 
+    # Service threads create their loops with asyncio.new_event_loop(), so installing
+    # the uvloop policy here gives every job a libuv-based loop (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # Exit normally on SIGTERM, so the services' atexit hooks save their unsaved
+    # data (service threads are daemons and are never joined)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     # Restart any jobs that were running
     restart_running_jobs()
 
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Queued logging for continuous generation services.
+
+Activity handlers emit several status lines per activity. Routing them through a
+QueueHandler means the service coroutines only enqueue records - a QueueListener
+thread does the stdout writes, so slow console I/O never blocks the event loop.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+# Parent logger for every module in the continuous package
+LOGGER_NAME = "continuous"
+
+_log_queue: Optional[queue.Queue] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_buffered_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route the continuous package logger through a background writer thread.
+
+    Safe to call more than once - the handler and listener are only set up the first time.
+
+    Args:
+        level: Minimum level to emit
+
+    Returns:
+        The running QueueListener
+    """
+    global _log_queue, _listener
+
+    if _listener is not None:
+        return _listener
+
+    # Plain message format keeps output identical to the previous print() calls
+    target = logging.StreamHandler(sys.stdout)
+    target.setFormatter(logging.Formatter("%(message)s"))
+
+    _log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(_log_queue, target)
+    listener.start()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+
+    # Write out anything still queued when the interpreter exits
+    atexit.register(_stop_listener)
+
+    _listener = listener
+    return listener
+
+
+def _stop_listener():
+    """Write out queued records and stop the writer thread."""
+    global _log_queue
+    # Nothing drains the queue once the listener stops, so flush_logs must
+    # not wait on it after this
+    queue_to_drain, _log_queue = _log_queue, None
+    if _listener is not None and queue_to_drain is not None:
+        _listener.stop()
+
+
+def flush_logs():
+    """
+    Block until every queued log record has been written.
+
+    Returns immediately once the writer thread has stopped. Coroutines should
+    call this through asyncio.to_thread so the wait doesn't block their loop.
+    """
+    log_queue = _log_queue
+    if log_queue is not None:
+        log_queue.join()
@@ -6,8 +6,10 @@ Provides all Asana-specific functionality for the data generator.
 
 import requests
 import time
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from continuous.connections.base_connection import (
     BaseConnection,
@@ -17,6 +19,39 @@ from continuous.connections.base_connection import (
 )
 
 
+# Connection pool size shared by every AsanaConnection
+HTTP_POOL_SIZE = 50
+
+_shared_session: Optional[requests.Session] = None
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session used for Asana API calls.
+
+    All clients share one keep-alive connection pool, so back-to-back requests
+    (including ones made by different users' clients) reuse open TLS connections
+    instead of handshaking for every call.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        # Retry transient server errors on reads only. urllib3's default methods
+        # include DELETE and PUT, and replaying a write the server already
+        # applied fails (e.g. a 404 for a delete). 429 and 401 are handled by
+        # _make_request.
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=frozenset({"GET"}), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                              max_retries=retry)
+        session.mount("https://", adapter)
+        _shared_session = session
+    return _shared_session
+
+
 # Asana-specific exceptions (for backwards compatibility)
 class AsanaAPIError(BaseConnectionError):
     """Custom exception for Asana API errors."""
@@ -33,15 +68,24 @@ class AsanaConnection(BaseConnection):
 
     BASE_URL = "https://app.asana.com/api/1.0"
 
-    def __init__(self, api_key: str, user_name: str = "Unknown"):
+    # Maximum number of actions Asana accepts in a single /batch request
+    BATCH_MAX_ACTIONS = 10
+
+    def __init__(self, api_key: str, user_name: str = "Unknown",
+                 session: Optional[requests.Session] = None,
+                 on_invalidated: Optional[Callable[[], None]] = None):
         """
         Initialize Asana connection.
 
         Args:
             api_key: Asana Personal Access Token
             user_name: Name of the user (for logging)
+            session: HTTP session to send requests through (defaults to the shared session)
+            on_invalidated: Called when a 401 response marks the token invalid
         """
         super().__init__(api_key, user_name)
+        self.session = session or get_shared_session()
+        self.on_invalidated = on_invalidated
 
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with authorization."""
@@ -75,25 +119,28 @@ class AsanaConnection(BaseConnection):
 
         try:
             if method.upper() == "GET":
-                response = requests.get(url, headers=self._get_headers(), params=params)
+                response = self.session.get(url, headers=self._get_headers(), params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=self._get_headers(), json=data,
-                                       params=params)
+                response = self.session.post(url, headers=self._get_headers(), json=data,
+                                           params=params)
             elif method.upper() == "PUT":
-                response = requests.put(url, headers=self._get_headers(), json=data)
+                response = self.session.put(url, headers=self._get_headers(), json=data)
             elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=self._get_headers())
+                response = self.session.delete(url, headers=self._get_headers())
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
             # Check for rate limiting
             if response.status_code == 429:
                 retry_after = int(response.headers.get("Retry-After", 60))
-                raise AsanaRateLimitError(f"Rate limit exceeded. Retry after {retry_after}s")
+                raise AsanaRateLimitError(f"Rate limit exceeded. Retry after {retry_after}s",
+                                          retry_after=retry_after)
 
             # Check for authentication errors
             if response.status_code == 401:
                 self.is_valid = False
+                if self.on_invalidated:
+                    self.on_invalidated()
                 raise AsanaAPIError("Invalid or expired API token")
 
             # Check for other errors
@@ -325,6 +372,43 @@ class AsanaConnection(BaseConnection):
         """
         self._make_request("DELETE", f"tasks/{task_gid}")
 
+    def batch_delete_tasks(self, task_gids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Delete several tasks with Asana's Batch API.
+
+        Sends one /batch request per BATCH_MAX_ACTIONS tasks instead of one
+        DELETE per task. Individual actions can fail independently.
+
+        Args:
+            task_gids: Task GIDs to delete
+
+        Returns:
+            One result per GID, in order: {"gid", "status_code", "ok"}
+        """
+        results = []
+
+        for start in range(0, len(task_gids), self.BATCH_MAX_ACTIONS):
+            chunk = task_gids[start:start + self.BATCH_MAX_ACTIONS]
+            data = {
+                "data": {
+                    "actions": [
+                        {"method": "delete", "relative_path": f"/tasks/{gid}"}
+                        for gid in chunk
+                    ]
+                }
+            }
+            response = self._make_request("POST", "batch", data=data)
+
+            for gid, action_result in zip(chunk, response.get("data", [])):
+                status_code = action_result.get("status_code", 0)
+                results.append({
+                    "gid": gid,
+                    "status_code": status_code,
+                    "ok": 200 <= status_code < 300
+                })
+
+        return results
+
     def get_task_subtasks(self, task_gid: str) -> List[Dict[str, Any]]:
         """
         Get all subtasks for a task (handles pagination).
@@ -1043,6 +1127,9 @@ class AsanaConnection(BaseConnection):
 class AsanaClientPool(BaseClientPool):
     """Pool of Asana clients for multi-user simulation."""
 
+    # Seconds the valid client/user lists are reused before being rebuilt
+    VALID_CLIENTS_TTL = 60.0
+
     def __init__(self, user_tokens: Dict[str, str]):
         """
         Initialize client pool.
@@ -1052,8 +1139,18 @@ class AsanaClientPool(BaseClientPool):
         """
         super().__init__(user_tokens)
 
+        # All clients in the pool reuse one keep-alive connection pool
+        self.session = get_shared_session()
+
+        # Cached valid clients/user names, rebuilt after VALID_CLIENTS_TTL or
+        # as soon as any client's token is rejected
+        self._valid_clients: List[AsanaConnection] = []
+        self._valid_user_names: List[str] = []
+        self._valid_expires_at = 0.0
+
         for user_name, api_key in user_tokens.items():
-            client = AsanaConnection(api_key, user_name)
+            client = AsanaConnection(api_key, user_name, session=self.session,
+                                     on_invalidated=self.invalidate)
             try:
                 # Validate token on initialization
                 if client.validate_token():
@@ -1091,9 +1188,25 @@ class AsanaClientPool(BaseClientPool):
             Random AsanaConnection or None if no valid clients
         """
         import random
-        valid_clients = [c for c in self.clients.values() if c.is_valid]
+        self._refresh_valid_cache()
+        valid_clients = self._valid_clients
         return random.choice(valid_clients) if valid_clients else None
 
+    def invalidate(self):
+        """Drop the cached valid client lists so the next lookup rebuilds them."""
+        self._valid_expires_at = 0.0
+
+    def _refresh_valid_cache(self):
+        """Rebuild the valid client/user name lists if the cache has expired."""
+        now = time.monotonic()
+        if now < self._valid_expires_at:
+            return
+
+        valid_items = [(name, client) for name, client in self.clients.items() if client.is_valid]
+        self._valid_user_names = [name for name, _ in valid_items]
+        self._valid_clients = [client for _, client in valid_items]
+        self._valid_expires_at = now + self.VALID_CLIENTS_TTL
+
     def get_valid_clients(self) -> List[AsanaConnection]:
         """
         Get all valid clients.
@@ -1101,7 +1214,8 @@ class AsanaClientPool(BaseClientPool):
         Returns:
             List of valid AsanaConnections
         """
-        return [c for c in self.clients.values() if c.is_valid]
+        self._refresh_valid_cache()
+        return list(self._valid_clients)
 
     def get_valid_user_names(self) -> List[str]:
         """
@@ -1110,7 +1224,8 @@ class AsanaClientPool(BaseClientPool):
         Returns:
             List of user names
         """
-        return [name for name, client in self.clients.items() if client.is_valid]
+        self._refresh_valid_cache()
+        return list(self._valid_user_names)
 
     def get_user_gid(self, user_name: str) -> Optional[str]:
         """
@@ -16,7 +16,15 @@ class ConnectionError(Exception):
 
 class RateLimitError(Exception):
     """Custom exception for rate limit errors."""
-    pass
+
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Error message
+            retry_after: Seconds the server asked us to wait, if it said
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class BaseConnection(ABC):
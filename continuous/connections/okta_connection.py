@@ -11,11 +11,15 @@ This implementation maps Okta concepts to the BaseConnection abstraction:
 API Reference: https://developer.okta.com/docs/reference/core-okta-api/
 """
 
+import itertools
 import requests
+import threading
 import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from continuous.connections.base_connection import (
     BaseConnection,
@@ -25,6 +29,44 @@ from continuous.connections.base_connection import (
 )
 
 
+# Connection pool size shared by every OktaConnection (matches the default
+# number of concurrent requests OktaService allows in flight)
+HTTP_POOL_SIZE = 20
+
+_shared_session: Optional[requests.Session] = None
+
+# Caps the number of Okta requests in flight across all clients, so parallel
+# callers respect the org's concurrency limit without sleeping between calls
+_request_slots = threading.BoundedSemaphore(HTTP_POOL_SIZE)
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session used for Okta API calls.
+
+    Every admin client sends through one keep-alive connection pool, so the
+    concurrent requests made during org setup reuse open TLS connections
+    instead of handshaking for every call.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        # Retry transient server errors on reads only. urllib3's default methods
+        # include DELETE and PUT, and replaying a write the server already
+        # applied fails (e.g. a 404 for a delete). 429 and 401 are handled by
+        # _make_request.
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=frozenset({"GET"}), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                              max_retries=retry)
+        session.mount("https://", adapter)
+        _shared_session = session
+    return _shared_session
+
+
 # Okta-specific exceptions (for backwards compatibility)
 class OktaAPIError(BaseConnectionError):
     """Custom exception for Okta API errors."""
@@ -69,7 +111,8 @@ class OktaConnection(BaseConnection):
         ...     print(f"Created user: {user['id']}")
     """
 
-    def __init__(self, token: str, org_url: str, user_name: str = "Unknown"):
+    def __init__(self, token: str, org_url: str, user_name: str = "Unknown",
+                 session: Optional[requests.Session] = None):
         """
         Initialize Okta connection.
 
@@ -77,8 +120,10 @@ class OktaConnection(BaseConnection):
             token: Okta SSWS API token
             org_url: Okta organization URL (e.g., https://dev-123456.okta.com)
             user_name: Name of the user (for logging)
+            session: HTTP session to send requests through (defaults to the shared session)
         """
         super().__init__(token, user_name)
+        self.session = session or get_shared_session()
         self.org_url = org_url.rstrip('/')  # Remove trailing slash if present
         self.rate_limit_remaining = None
         self.rate_limit_reset = None
@@ -119,29 +164,30 @@ class OktaConnection(BaseConnection):
         endpoint = endpoint.lstrip('/')
         url = f"{self.org_url}/api/v1/{endpoint}"
 
-        # Rate limiting
-        self._handle_rate_limiting()
+        self.request_count += 1
 
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=self._get_headers(), params=params)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=self._get_headers(), json=data, params=params)
-            elif method.upper() == "PUT":
-                response = requests.put(url, headers=self._get_headers(), json=data, params=params)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=self._get_headers(), params=params)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            with _request_slots:
+                if method.upper() == "GET":
+                    response = self.session.get(url, headers=self._get_headers(), params=params)
+                elif method.upper() == "POST":
+                    response = self.session.post(url, headers=self._get_headers(), json=data, params=params)
+                elif method.upper() == "PUT":
+                    response = self.session.put(url, headers=self._get_headers(), json=data, params=params)
+                elif method.upper() == "DELETE":
+                    response = self.session.delete(url, headers=self._get_headers(), params=params)
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
 
             # Track rate limit headers
             self._track_rate_limits(response)
 
             # Check for rate limiting (429)
             if response.status_code == 429:
-                retry_after = int(response.headers.get("X-Rate-Limit-Reset", 60))
+                reset_at = int(response.headers.get("X-Rate-Limit-Reset", time.time() + 60))
                 raise OktaRateLimitError(
-                    f"Rate limit exceeded. Reset at epoch: {retry_after}"
+                    f"Rate limit exceeded. Reset at epoch: {reset_at}",
+                    retry_after=max(1.0, reset_at - time.time())
                 )
 
             # Check for authentication errors (401)
@@ -233,7 +279,8 @@ class OktaConnection(BaseConnection):
     # ========== OKTA USERS API ==========
 
     def create_user(self, profile: Dict[str, Any], activate: bool = True,
-                   credentials: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                   credentials: Optional[Dict[str, Any]] = None,
+                   group_ids: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Create a new user in Okta.
 
@@ -249,6 +296,8 @@ class OktaConnection(BaseConnection):
                 - mobilePhone, secondEmail, etc.
             activate: Whether to activate user immediately (default True)
             credentials: Optional credentials dict with password/recovery_question
+            group_ids: Optional IDs of groups to add the user to as part of the same
+                request (saves one add_user_to_group call per group)
 
         Returns:
             Created user data dictionary with 'id' field
@@ -266,6 +315,9 @@ class OktaConnection(BaseConnection):
         if credentials:
             data["credentials"] = credentials
 
+        if group_ids:
+            data["groupIds"] = group_ids
+
         params = {"activate": str(activate).lower()}
 
         return self._make_request("POST", "users", data=data, params=params)
@@ -1084,6 +1136,8 @@ class OktaClientPool(BaseClientPool):
         """
         # Call parent with empty dict (we'll populate clients manually)
         super().__init__({})
+        self.session = get_shared_session()
+        self._rotation = itertools.count()
 
         for user_config in user_tokens:
             user_name = user_config.get("name")
@@ -1094,7 +1148,8 @@ class OktaClientPool(BaseClientPool):
                 print(f"✗ Invalid config for user: {user_config}")
                 continue
 
-            client = OktaConnection(token=token, org_url=org_url, user_name=user_name)
+            client = OktaConnection(token=token, org_url=org_url, user_name=user_name,
+                                    session=self.session)
             try:
                 # Validate token on initialization
                 if client.validate_token():
@@ -1135,6 +1190,21 @@ class OktaClientPool(BaseClientPool):
         valid_clients = [c for c in self.clients.values() if c.is_valid]
         return random.choice(valid_clients) if valid_clients else None
 
+    def get_next_client(self) -> Optional[OktaConnection]:
+        """
+        Get the next valid client in round-robin order.
+
+        Spreads bulk work evenly across the admin tokens, each of which has its
+        own rate limit.
+
+        Returns:
+            OktaConnection or None if no valid clients
+        """
+        valid_clients = [c for c in self.clients.values() if c.is_valid]
+        if not valid_clients:
+            return None
+        return valid_clients[next(self._rotation) % len(valid_clients)]
+
     def get_valid_clients(self) -> List[OktaConnection]:
         """
         Get all valid clients.
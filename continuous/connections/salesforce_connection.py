@@ -19,9 +19,10 @@ We intelligently map concepts to maintain compatibility with BaseConnection
 while respecting CRM domain semantics.
 """
 
+import itertools
 import time
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone
 
 try:
@@ -80,6 +81,9 @@ class SalesforceConnection(BaseConnection):
     We track usage and provide warnings as limits approach.
     """
 
+    # Most records the sObject Collections (composite/sobjects) endpoint accepts per call
+    COMPOSITE_MAX_RECORDS = 200
+
     def __init__(
         self,
         api_key: str,  # Not used for Salesforce, kept for interface compatibility
@@ -198,10 +202,10 @@ class SalesforceConnection(BaseConnection):
         Make a Salesforce API request with error handling.
 
         Args:
-            operation: Operation type (query, create, update, delete, get)
+            operation: Operation type (query, create, update, delete, get, composite)
             sobject: Salesforce object type (Account, Opportunity, etc.)
             record_id: Record ID for get/update/delete operations
-            data: Data for create/update operations
+            data: Data for create/update/composite operations
             method: HTTP method override
 
         Returns:
@@ -233,6 +237,9 @@ class SalesforceConnection(BaseConnection):
                 obj = getattr(self.sf, sobject)
                 result = obj.get(record_id)
                 return result
+            elif operation == "composite":
+                result = self.sf.restful("composite/sobjects", method="POST", json=data)
+                return result
             else:
                 raise ValueError(f"Unsupported operation: {operation}")
 
@@ -1521,6 +1528,199 @@ class SalesforceConnection(BaseConnection):
         else:
             raise SalesforceAPIError(f"Failed to create contact: {result}")
 
+    def _create_composite(self, sobject: str, records: List[Dict[str, Any]],
+                          field_names: Dict[str, str], required: Tuple[str, ...]) -> List[Optional[str]]:
+        """
+        Create several records of one type in a single sObject Collections request.
+
+        Args:
+            sobject: Salesforce object type (e.g. 'Contact')
+            records: Field dicts keyed like the matching create_* method,
+                at most COMPOSITE_MAX_RECORDS
+            field_names: Mapping of record keys to Salesforce field names
+            required: Record keys every record must have
+
+        Returns:
+            New record ID for each record, in input order - None for records
+            Salesforce rejected
+        """
+        if len(records) > self.COMPOSITE_MAX_RECORDS:
+            raise SalesforceAPIError(
+                f"At most {self.COMPOSITE_MAX_RECORDS} {sobject} records per composite request, "
+                f"got {len(records)}"
+            )
+
+        sobjects = []
+        for record in records:
+            missing = [key for key in required if key not in record]
+            if missing:
+                raise SalesforceAPIError(f"Missing required {sobject} fields: {', '.join(missing)}")
+            sobject_data = {'attributes': {'type': sobject}}
+            for key, field in field_names.items():
+                if key in record:
+                    sobject_data[field] = record[key]
+            sobjects.append(sobject_data)
+
+        # allOrNone=False keeps one bad record from failing the whole batch
+        results = self._make_request(
+            "composite",
+            data={'allOrNone': False, 'records': sobjects}
+        )
+
+        if not isinstance(results, list) or len(results) != len(records):
+            raise SalesforceAPIError(f"Failed to create {sobject} records: {results}")
+
+        record_ids = []
+        for record, result in zip(records, results):
+            if result.get('success'):
+                record_ids.append(result['id'])
+            else:
+                label = record.get('last_name') or record.get('name')
+                logger.warning(f"{sobject} {label} rejected: {result.get('errors')}")
+                record_ids.append(None)
+        return record_ids
+
+    def create_accounts_composite(self, records: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several accounts in one sObject Collections request.
+
+        Args:
+            records: Account field dicts (name, notes and the create_project
+                keyword fields), at most COMPOSITE_MAX_RECORDS
+
+        Returns:
+            Created account data for each record, in input order - None for
+            records Salesforce rejected
+        """
+        field_names = {
+            'name': 'Name',
+            'notes': 'Description',
+            'industry': 'Industry',
+            'annual_revenue': 'AnnualRevenue',
+            'phone': 'Phone',
+            'website': 'Website',
+            'billing_city': 'BillingCity',
+            'billing_state': 'BillingState',
+            'billing_country': 'BillingCountry'
+        }
+        record_ids = self._create_composite("Account", records, field_names, ('name',))
+
+        return [
+            {
+                'gid': record_id,
+                'id': record_id,
+                'name': record['name'],
+                'notes': record.get('notes', '')
+            } if record_id else None
+            for record, record_id in zip(records, record_ids)
+        ]
+
+    def create_opportunities_composite(self, records: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several opportunities in one sObject Collections request.
+
+        Args:
+            records: Opportunity field dicts (account_id, name, close_date,
+                stage, plus optional notes, assignee, amount, probability, type,
+                lead_source), at most COMPOSITE_MAX_RECORDS
+
+        Returns:
+            Created opportunity data for each record, in input order - None for
+            records Salesforce rejected
+        """
+        field_names = {
+            'account_id': 'AccountId',
+            'name': 'Name',
+            'notes': 'Description',
+            'close_date': 'CloseDate',
+            'stage': 'StageName',
+            'assignee': 'OwnerId',
+            'amount': 'Amount',
+            'probability': 'Probability',
+            'type': 'Type',
+            'lead_source': 'LeadSource'
+        }
+        record_ids = self._create_composite(
+            "Opportunity", records, field_names, ('account_id', 'name', 'close_date', 'stage')
+        )
+
+        return [
+            {
+                'gid': record_id,
+                'id': record_id,
+                'name': record['name'],
+                'notes': record.get('notes', ''),
+                'assignee': {'gid': record['assignee']} if record.get('assignee') else None
+            } if record_id else None
+            for record, record_id in zip(records, record_ids)
+        ]
+
+    def create_contacts_composite(self, records: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several contacts in one sObject Collections request.
+
+        Args:
+            records: Contact field dicts (same keys as create_contact, including
+                account_id), at most COMPOSITE_MAX_RECORDS
+
+        Returns:
+            Created contact data for each record, in input order - None for
+            records Salesforce rejected
+        """
+        field_names = {
+            'account_id': 'AccountId',
+            'last_name': 'LastName',
+            'first_name': 'FirstName',
+            'email': 'Email',
+            'phone': 'Phone',
+            'title': 'Title'
+        }
+        record_ids = self._create_composite("Contact", records, field_names, ('last_name',))
+
+        return [
+            {
+                'gid': record_id,
+                'id': record_id,
+                'name': f"{record.get('first_name', '')} {record['last_name']}".strip(),
+                'email': record.get('email')
+            } if record_id else None
+            for record, record_id in zip(records, record_ids)
+        ]
+
+    def create_leads_composite(self, records: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Create several leads in one sObject Collections request.
+
+        Args:
+            records: Lead field dicts (same keys as create_lead), at most
+                COMPOSITE_MAX_RECORDS
+
+        Returns:
+            Created lead data for each record, in input order - None for
+            records Salesforce rejected
+        """
+        field_names = {
+            'last_name': 'LastName',
+            'company': 'Company',
+            'status': 'Status',
+            'first_name': 'FirstName',
+            'email': 'Email',
+            'phone': 'Phone',
+            'lead_source': 'LeadSource'
+        }
+        records = [{'status': 'Open - Not Contacted', **record} for record in records]
+        record_ids = self._create_composite("Lead", records, field_names, ('last_name', 'company'))
+
+        return [
+            {
+                'gid': record_id,
+                'id': record_id,
+                'name': f"{record.get('first_name', '')} {record['last_name']}".strip(),
+                'company': record['company']
+            } if record_id else None
+            for record, record_id in zip(records, record_ids)
+        ]
+
     def log_activity(self, related_to_id: str, **kwargs) -> Dict[str, Any]:
         """
         Log an activity (Task) related to a record.
@@ -1622,6 +1822,9 @@ class SalesforceClientPool(BaseClientPool):
         """
         super().__init__({})  # Pass empty dict since we don't use api_key
 
+        # Position in the round-robin rotation (see get_next_client)
+        self._rotation = itertools.count()
+
         for user_name, credentials in user_credentials.items():
             try:
                 client = SalesforceConnection(
@@ -1674,6 +1877,21 @@ class SalesforceClientPool(BaseClientPool):
         valid_clients = [c for c in self.clients.values() if c.is_valid]
         return random.choice(valid_clients) if valid_clients else None
 
+    def get_next_client(self) -> Optional[SalesforceConnection]:
+        """
+        Get the next valid client in round-robin order.
+
+        Spreads bulk work evenly across the users without drawing from the RNG
+        on every request.
+
+        Returns:
+            SalesforceConnection or None if no valid clients
+        """
+        valid_clients = [c for c in self.clients.values() if c.is_valid]
+        if not valid_clients:
+            return None
+        return valid_clients[next(self._rotation) % len(valid_clients)]
+
     def get_valid_clients(self) -> List[SalesforceConnection]:
         """
         Get all valid clients.
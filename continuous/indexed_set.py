@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Set with constant-time random sampling.
+
+The services keep indexes of record IDs (users by status, users eligible for an
+activity, ...) and draw one at random on every activity. random.choice needs a
+sequence, so drawing from a plain set means copying it to a tuple first - O(n)
+per draw. IndexedSet keeps its members in a list alongside a position map, so
+add, discard and choice are all O(1).
+"""
+
+import random
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class IndexedSet(Generic[T]):
+    """
+    Unordered set of hashable items that supports O(1) random choice.
+
+    Removal swaps the item with the last member and pops it, so iteration order
+    is not insertion order.
+    """
+
+    __slots__ = ("_items", "_positions")
+
+    def __init__(self, items: Iterable[T] = ()):
+        """
+        Initialize the set.
+
+        Args:
+            items: Initial members
+        """
+        self._items: List[T] = []
+        self._positions: Dict[T, int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: T):
+        """Add an item if it is not already a member."""
+        if item not in self._positions:
+            self._positions[item] = len(self._items)
+            self._items.append(item)
+
+    def discard(self, item: T):
+        """Remove an item if it is a member."""
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+        last = self._items.pop()
+        if position < len(self._items):
+            # Fill the gap with the former last member
+            self._items[position] = last
+            self._positions[last] = position
+
+    def choice(self, rng: random.Random = random) -> T:
+        """
+        Pick a random member.
+
+        Args:
+            rng: Random generator to draw with (defaults to the random module)
+
+        Returns:
+            A member chosen uniformly at random
+
+        Raises:
+            IndexError: If the set is empty
+        """
+        if not self._items:
+            raise IndexError("Cannot choose from an empty IndexedSet")
+        return self._items[rng.randrange(len(self._items))]
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._positions
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"IndexedSet({self._items!r})"
@@ -5,6 +5,7 @@ Generates industry-specific project names, task names, comments, and more.
 """
 
 import os
+import threading
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import anthropic
@@ -49,6 +50,10 @@ class LLMGenerator:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
 
+        # Tokens used since the last pop_tokens_since_last() call
+        self._tokens_since_last = 0
+        self._usage_lock = threading.Lock()
+
     def _get_time_context(self, current_time: Optional[datetime] = None) -> str:
         """
         Generate time-aware context string for more realistic content.
@@ -104,9 +109,11 @@ class LLMGenerator:
             )
 
             # Track usage
-            self.api_calls_count += 1
-            self.total_input_tokens += message.usage.input_tokens
-            self.total_output_tokens += message.usage.output_tokens
+            with self._usage_lock:
+                self.api_calls_count += 1
+                self.total_input_tokens += message.usage.input_tokens
+                self.total_output_tokens += message.usage.output_tokens
+                self._tokens_since_last += message.usage.input_tokens + message.usage.output_tokens
 
             return message.content[0].text.strip()
 
@@ -728,11 +735,25 @@ Return the subtasks as a numbered list:
             "total_tokens": self.total_input_tokens + self.total_output_tokens
         }
 
+    def pop_tokens_since_last(self) -> int:
+        """
+        Get tokens used since the previous call and reset the counter.
+
+        Returns:
+            Total (input + output) tokens used since the last pop
+        """
+        with self._usage_lock:
+            tokens = self._tokens_since_last
+            self._tokens_since_last = 0
+        return tokens
+
     def reset_usage_stats(self):
         """Reset usage statistics counters."""
-        self.api_calls_count = 0
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
+        with self._usage_lock:
+            self.api_calls_count = 0
+            self.total_input_tokens = 0
+            self.total_output_tokens = 0
+            self._tokens_since_last = 0
 
     # ============================================================================
     # OKTA-SPECIFIC CONTENT GENERATION METHODS
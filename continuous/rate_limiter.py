@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Async rate limiting and retry helpers shared by the platform services.
+
+AsyncRateLimiter is a token bucket: callers proceed immediately while tokens are
+available and only wait once the configured rate is exhausted, instead of
+sleeping a fixed interval after every request. retry_with_backoff retries
+rate-limited and transient server errors with jittered exponential backoff.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from continuous.connections.base_connection import RateLimitError
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: rate limited or transient server errors
+_RETRYABLE_STATUS = re.compile(r"\b(429|500|502|503|504)\b")
+_RATE_LIMIT_STATUS = re.compile(r"\b429\b")
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter usable as ``async with limiter:``.
+
+    Allows bursts of up to max_rate requests, refilling at max_rate per
+    time_period. The bucket state is guarded by a thread lock rather than an
+    asyncio lock, so one limiter can be shared by services running on different
+    event loops.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_rate: Requests allowed per time_period (also the burst size)
+            time_period: Length of the rate window in seconds
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._fill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_take(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, otherwise seconds until the next token
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(self.max_rate, self._tokens + elapsed * self._fill_rate)
+            self._last_refill = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._fill_rate
+
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        while True:
+            wait = self._try_take()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Check whether an API error is worth retrying.
+
+    Args:
+        error: Exception raised by a connection call
+
+    Returns:
+        True for rate limits (429) and transient server errors (5xx)
+    """
+    if isinstance(error, RateLimitError):
+        return True
+    return bool(_RETRYABLE_STATUS.search(str(error)))
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Check whether an API error is a rate limit.
+
+    The API rejects a rate-limited request before acting on it, so unlike a
+    server error this is safe to retry for calls that create data.
+
+    Args:
+        error: Exception raised by a connection call
+
+    Returns:
+        True for rate limits (429)
+    """
+    if isinstance(error, RateLimitError):
+        return True
+    return bool(_RATE_LIMIT_STATUS.search(str(error)))
+
+
+def backoff_delay(error: Exception, attempt: int, base_delay: float = 1.0,
+                  max_delay: float = 30.0) -> float:
+    """
+    Compute how long to wait before the next retry.
+
+    Uses "full jitter" exponential backoff so concurrent callers spread out
+    their retries, and never waits less than a server-provided Retry-After.
+
+    Args:
+        error: Exception that triggered the retry
+        attempt: Zero-based attempt number that just failed
+        base_delay: Delay ceiling for the first retry in seconds
+        max_delay: Maximum delay ceiling in seconds
+
+    Returns:
+        Seconds to sleep
+    """
+    delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+    retry_after: Optional[float] = getattr(error, "retry_after", None)
+    if retry_after:
+        delay = max(delay, float(retry_after))
+    return delay
+
+
+async def retry_with_backoff(operation: Callable[[], Awaitable[T]], max_attempts: int = 4,
+                             base_delay: float = 1.0, max_delay: float = 30.0,
+                             retry_if: Callable[[Exception], bool] = is_retryable_error) -> T:
+    """
+    Await an operation, retrying rate-limit and transient server errors.
+
+    Args:
+        operation: Zero-argument callable returning a fresh awaitable per attempt
+        max_attempts: Total attempts before the last error is re-raised
+        base_delay: Delay ceiling for the first retry in seconds
+        max_delay: Maximum delay ceiling in seconds
+        retry_if: Decides which errors are retried (pass is_rate_limit_error for
+            calls that aren't safe to repeat after a server error)
+
+    Returns:
+        Result of the operation
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await operation()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not retry_if(e):
+                raise
+            await asyncio.sleep(backoff_delay(e, attempt, base_delay, max_delay))
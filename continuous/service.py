@@ -1787,6 +1787,13 @@ if __name__ == "__main__":
     # Create and run service
     service = ContinuousService(config, state_manager, llm_generator, client_pool)
 
+    # Use uvloop's libuv-based event loop when it is installed (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run async
     try:
         asyncio.run(service.run())
@@ -4,9 +4,12 @@ Asana Continuous Generation Service - Asana-specific implementation of continuou
 """
 
 import asyncio
+import logging
 import random
+import threading
+from collections import defaultdict, deque
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from continuous.services.base_service import BaseService
 from continuous.llm_generator import LLMGenerator
@@ -14,11 +17,27 @@ from continuous.state_manager import StateManager
 from continuous.scheduler import ActivityScheduler, ActivityType
 from continuous.connections.asana_connection import AsanaClientPool, AsanaConnection, AsanaAPIError, AsanaRateLimitError
 from continuous.templates.asana_templates import INDUSTRY_TEMPLATES, get_random_use_case
+from continuous.buffered_logging import configure_buffered_logging, flush_logs
+from continuous.rate_limiter import AsyncRateLimiter, is_rate_limit_error, retry_with_backoff
+
+logger = logging.getLogger(__name__)
 
 
 class AsanaService(BaseService):
     """Asana-specific implementation of continuous data generation service."""
 
+    # Maximum number of Asana requests in flight during cleanup
+    CLEANUP_CONCURRENCY = 10
+
+    # Sustained Asana request rate during cleanup (token bucket, burst of the same size)
+    CLEANUP_REQUESTS_PER_SECOND = 10
+
+    # Maximum number of OOO comments posted at once during a rate-limit pause
+    OOO_CONCURRENCY = 5
+
+    # Seconds between batched writes of queued comment/activity/usage updates
+    STATE_FLUSH_INTERVAL = 2
+
     def __init__(self, config: Dict[str, Any], state_manager: StateManager,
                  llm_generator: LLMGenerator, client_pool: AsanaClientPool):
         """
@@ -37,12 +56,38 @@ class AsanaService(BaseService):
         self.workspace_tags = {}  # {tag_name: tag_gid}
         self.workspace_portfolios = {}  # {portfolio_name: portfolio_gid}
 
-        print(f"✓ Asana service initialized - Job ID: {self.job_id}")
+        # Index of state tasks by assignee name, rebuilt lazily whenever
+        # self.state["projects"] is replaced (e.g. after a reload from disk)
+        self._tasks_by_assignee: Dict[str, List[Dict[str, Any]]] = {}
+        self._assignee_index_source = None
+
+        # Paces cleanup requests to Asana's per-second budget
+        self._limiter = AsyncRateLimiter(max_rate=self.CLEANUP_REQUESTS_PER_SECOND, time_period=1)
+
+        # True once self.state may lag the job file on disk. State was just
+        # loaded, so cleanup can use it as-is until the service starts running.
+        self._state_dirty = False
+
+        # Comment, activity and API-usage updates queued by the activity handlers.
+        # They are written to the job file in one batch every STATE_FLUSH_INTERVAL
+        # seconds, and on pause/stop.
+        self._pending_state_ops: List[Tuple[str, tuple]] = []
+        self._state_ops_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        logger.info(f"✓ Asana service initialized - Job ID: {self.job_id}")
 
     async def run(self):
         """Main loop - runs continuously until stopped."""
         self.running = True
 
+        # The running service writes through the state manager and sleeps while
+        # others (API server, deletion) edit the job file, so its in-memory copy
+        # is only a periodic snapshot from here on
+        self._state_dirty = True
+
+        self._flush_task = asyncio.create_task(self._periodic_state_flush())
+
         # IMPROVED: Set status to "initializing" during initial data generation
         # This will be changed to "running" after bootstrap completes
         initial_generation = len(self.state["projects"]) == 0
@@ -51,8 +96,8 @@ class AsanaService(BaseService):
         else:
             self.state_manager.update_job_status(self.job_id, "running")
 
-        print(f"Starting continuous generation for {self.config.get('industry')} workspace...")
-        print(f"Duration: {self.config.get('duration_days', 'indefinite')} days")
+        logger.info(f"Starting continuous generation for {self.config.get('industry')} workspace...")
+        logger.info(f"Duration: {self.config.get('duration_days', 'indefinite')} days")
 
         # Initialize with initial projects if none exist
         if initial_generation:
@@ -68,7 +113,8 @@ class AsanaService(BaseService):
             self.state.pop("initialization_plan", None)
             self.state_manager.save_state(self.job_id, self.state)
             self.state_manager.update_job_status(self.job_id, "running")
-            print("✓ Initial generation complete - job is now running")
+            logger.info("✓ Initial generation complete - job is now running")
+            await asyncio.to_thread(flush_logs)
         else:
             # Check if we missed any scheduled activities (catch-up logic)
             await self._catch_up_missed_activities()
@@ -98,20 +144,27 @@ class AsanaService(BaseService):
                 # Reload state from disk to respect external changes (like deletion)
                 # DO NOT save after reloading - this would overwrite deletion markers!
                 if not self.deleted:
+                    # Write queued updates first so the reload doesn't drop them
+                    self._flush_state_ops()
                     disk_state = self.state_manager.load_state(self.job_id)
 
                     # CRITICAL: Check for deletion marker FIRST (atomic flag beats all other checks)
                     if disk_state is None or disk_state.get("_deleting"):
-                        print(f"[Job {self.job_id}] Deletion marker detected - exiting immediately")
+                        logger.info(f"[Job {self.job_id}] Deletion marker detected - exiting immediately")
                         self.running = False
                         self.deleted = True
+                        await self._stop_state_flush()
+                        await asyncio.to_thread(flush_logs)
                         return
 
                     # Then check for stopped status (manual stop operation)
                     if disk_state.get("status") == "stopped":
-                        print(f"[Job {self.job_id}] Job stopped - exiting")
+                        logger.info(f"[Job {self.job_id}] Job stopped - exiting")
                         self.running = False
+                        # Flush before setting the flag - _flush_state_ops skips deleted jobs
+                        await self._stop_state_flush()
                         self.deleted = True
+                        await asyncio.to_thread(flush_logs)
                         return
 
                     # Update our in-memory state with the disk version
@@ -125,7 +178,7 @@ class AsanaService(BaseService):
                 await asyncio.sleep(random.randint(30, 90))  # 30-90 seconds
 
             except AsanaRateLimitError as e:
-                print(f"⚠ Rate limit hit: {e}")
+                logger.warning(f"⚠ Rate limit hit: {e}")
                 self.state_manager.log_error(self.job_id, "rate_limit", str(e))
 
                 # Generate OOO message
@@ -135,25 +188,16 @@ class AsanaService(BaseService):
                 await asyncio.sleep(3600)  # 1 hour
 
             except Exception as e:
-                print(f"✗ Error in main loop: {e}")
+                logger.error(f"✗ Error in main loop: {e}")
                 self.state_manager.log_error(self.job_id, "general", str(e))
                 await asyncio.sleep(300)  # 5 minutes before retry
 
         # Clean shutdown
+        await self._stop_state_flush()
         self.state_manager.update_job_status(self.job_id, "stopped")
-        print(f"Continuous generation stopped for job {self.job_id}")
-
-    def _should_continue(self) -> bool:
-        """Check if job should continue running."""
-        if self.config.get("duration_days") == "indefinite":
-            return True
+        logger.info(f"Continuous generation stopped for job {self.job_id}")
+        await asyncio.to_thread(flush_logs)
 
-        # Check duration
-        started_at = datetime.fromisoformat(self.state["started_at"])
-        duration_days = self.config.get("duration_days", 30)
-        elapsed_days = (datetime.now(timezone.utc) - started_at).days
-
-        return elapsed_days < duration_days
     async def _plan_initialization(self):
         """
         Pre-compute initialization totals BEFORE creating any objects.
@@ -228,28 +272,28 @@ class AsanaService(BaseService):
 
         self.state_manager.save_state(self.job_id, self.state)
 
-        print(f"\n{'='*60}")
-        print(f"📋 INITIALIZATION PLAN")
-        print(f"{'='*60}")
-        print(f"  Projects: {num_projects}")
-        print(f"  Tasks: {total_tasks}")
-        print(f"  Subtasks: {total_subtasks}")
-        print(f"  Comments: {total_comments}")
-        print(f"  Estimated duration: {int(estimated_duration)}s")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"📋 INITIALIZATION PLAN")
+        logger.info(f"{'='*60}")
+        logger.info(f"  Projects: {num_projects}")
+        logger.info(f"  Tasks: {total_tasks}")
+        logger.info(f"  Subtasks: {total_subtasks}")
+        logger.info(f"  Comments: {total_comments}")
+        logger.info(f"  Estimated duration: {int(estimated_duration)}s")
+        logger.info(f"{'='*60}\n")
 
     async def _create_initial_projects(self):
         """Create initial projects to start with."""
         num_projects = self.config.get("initial_projects", 3)
 
-        print(f"Creating {num_projects} initial projects...")
+        logger.info(f"Creating {num_projects} initial projects...")
 
         for i in range(num_projects):
             try:
                 await self._create_project()
                 await asyncio.sleep(2)  # Space out creations
             except Exception as e:
-                print(f"Error creating initial project {i+1}: {e}")
+                logger.info(f"Error creating initial project {i+1}: {e}")
 
     async def _bootstrap_initial_activity(self):
         """
@@ -257,10 +301,10 @@ class AsanaService(BaseService):
         Subtasks and initial comments are now created during project setup (depth-first).
         This adds a few more comments and task state changes for variety.
         """
-        print("Bootstrapping additional activity...")
+        logger.info("Bootstrapping additional activity...")
 
         # Reload state to get latest tasks
-        self.state = self.state_manager.load_state(self.job_id)
+        self._reload_state()
 
         # Generate a few additional activities across tasks (3-6 activities)
         num_activities = random.randint(3, 6)
@@ -284,13 +328,13 @@ class AsanaService(BaseService):
                 await asyncio.sleep(1)
 
             except Exception as e:
-                print(f"Error in bootstrap activity {i+1}: {e}")
+                logger.info(f"Error in bootstrap activity {i+1}: {e}")
 
-        print(f"✓ Bootstrapped {num_activities} additional activities")
+        logger.info(f"✓ Bootstrapped {num_activities} additional activities")
 
         # Log the next scheduled activity time
         next_time = self.scheduler.get_next_activity_time(datetime.now(timezone.utc))
-        print(f"Next scheduled activity: {next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
+        logger.info(f"Next scheduled activity: {next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
 
         # Store next activity time in state
         self.state_manager.update_next_activity_time(self.job_id, next_time.isoformat())
@@ -306,7 +350,7 @@ class AsanaService(BaseService):
             # No scheduled time set, calculate it now
             next_time = self.scheduler.get_next_activity_time(datetime.now(timezone.utc))
             self.state_manager.update_next_activity_time(self.job_id, next_time.isoformat())
-            print(f"No scheduled time found. Next activity: {next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
+            logger.info(f"No scheduled time found. Next activity: {next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
             return
 
         next_activity_time = datetime.fromisoformat(next_activity_time_str)
@@ -320,7 +364,7 @@ class AsanaService(BaseService):
             time_diff = current_time - next_activity_time
             hours_late = time_diff.total_seconds() / 3600
 
-            print(f"⚠ Missed scheduled activity by {hours_late:.1f} hours - catching up now...")
+            logger.warning(f"⚠ Missed scheduled activity by {hours_late:.1f} hours - catching up now...")
 
             # Generate the missed activity
             await self._generate_activity()
@@ -328,18 +372,18 @@ class AsanaService(BaseService):
             # Calculate and set next activity time
             next_time = self.scheduler.get_next_activity_time(current_time)
             self.state_manager.update_next_activity_time(self.job_id, next_time.isoformat())
-            print(f"✓ Catch-up complete. Next activity: {next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
+            logger.info(f"✓ Catch-up complete. Next activity: {next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
         else:
             # We're on schedule
             time_until = next_activity_time - current_time
             minutes_until = time_until.total_seconds() / 60
-            print(f"✓ On schedule. Next activity in {minutes_until:.0f} minutes at {next_activity_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
+            logger.info(f"✓ On schedule. Next activity in {minutes_until:.0f} minutes at {next_activity_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
 
     async def _create_project(self) -> Optional[Dict[str, Any]]:
         """Create a new project with initial tasks using industry templates."""
         client = self.client_pool.get_random_client()
         if not client:
-            print("✗ No valid clients available")
+            logger.error("✗ No valid clients available")
             return None
 
         industry = self.config.get("industry", "technology")
@@ -350,7 +394,7 @@ class AsanaService(BaseService):
 
         if not all_use_cases:
             # Fallback to old method if no template found
-            print(f"⚠ No templates found for industry '{industry}', using legacy generation")
+            logger.warning(f"⚠ No templates found for industry '{industry}', using legacy generation")
             return await self._create_project_legacy()
 
         # Get list of used scenario names
@@ -361,7 +405,7 @@ class AsanaService(BaseService):
 
         # If all scenarios have been used, generate a NEW project via LLM instead of cycling
         if not available_use_cases:
-            print(f"  ℹ All predefined scenarios exhausted - generating new project via LLM")
+            logger.info(f"  ℹ All predefined scenarios exhausted - generating new project via LLM")
             return await self._create_project_llm_generated()
 
         # Randomly select from available scenarios
@@ -387,11 +431,12 @@ class AsanaService(BaseService):
                 counter += 1
             project_name = f"{base_project_name} #{counter}"
 
-        print(f"Creating project: {project_name} (scenario: {use_case['name']})")
+        logger.info(f"Creating project: {project_name} (scenario: {use_case['name']})")
 
         try:
             # Create project in Asana
-            project = client.create_project(
+            project = await asyncio.to_thread(
+                client.create_project,
                 workspace_gid=self.config["workspace_gid"],
                 name=project_name,
                 notes=project_description,
@@ -403,7 +448,7 @@ class AsanaService(BaseService):
             )
 
             project_gid = project["gid"]
-            print(f"  ✓ Created project: {project_name}")
+            logger.info(f"  ✓ Created project: {project_name}")
 
             # NOTE: On Asana free tier, we cannot share projects between users:
             # - "private" projects can't add members (premium only)
@@ -432,9 +477,9 @@ class AsanaService(BaseService):
             # IMPORTANT: Wait for project to be available in Asana before adding tasks
             # This prevents "Unknown object" errors due to eventual consistency
             # Uses polling with exponential backoff (more mature than fixed delays)
-            print(f"    → Polling until project is available in Asana...")
+            logger.info(f"    → Polling until project is available in Asana...")
             if not await client.wait_until_project_available(project_gid):
-                print(f"    ⚠ Project may not be fully propagated, proceeding anyway...")
+                logger.warning(f"    ⚠ Project may not be fully propagated, proceeding anyway...")
 
             # Small delay for memberships to propagate (keep minimal)
             await asyncio.sleep(0.5)
@@ -486,41 +531,41 @@ class AsanaService(BaseService):
                 # Create the task
                 task = await self._create_task(project_gid, use_case=use_case, sections=sections)
                 if not task:
-                    print(f"      ⚠ Task creation failed for task_idx={task_idx}, skipping...")
+                    logger.warning(f"      ⚠ Task creation failed for task_idx={task_idx}, skipping...")
                     continue
 
                 tasks_created += 1
                 task_gid = task["gid"]
-                print(f"      → Task {task_idx+1}/{num_tasks} created: {task_gid}")
+                logger.info(f"      → Task {task_idx+1}/{num_tasks} created: {task_gid}")
 
                 # CRITICAL: Wait for task to be available before adding subtasks/comments
                 # Uses polling with exponential backoff (more mature than fixed delays)
-                print(f"      → Polling until task is available in Asana...")
+                logger.info(f"      → Polling until task is available in Asana...")
                 if not await client.wait_until_task_available(task_gid):
-                    print(f"      ⚠ Task may not be fully propagated, skipping subtasks/comments...")
+                    logger.warning(f"      ⚠ Task may not be fully propagated, skipping subtasks/comments...")
                     continue
 
                 # GUARANTEE: First THREE tasks always get subtasks (minimum guarantee across all volume levels)
                 # This ensures every job has at least some subtasks for realistic data
                 # After that, use activity-level probability
                 should_add_subtasks = (task_idx <= 2 and not has_subtask) or random.random() < subtask_probability
-                print(f"      → should_add_subtasks = {should_add_subtasks} (task_idx={task_idx}, has_subtask={has_subtask}, probability={subtask_probability})")
+                logger.info(f"      → should_add_subtasks = {should_add_subtasks} (task_idx={task_idx}, has_subtask={has_subtask}, probability={subtask_probability})")
 
                 if should_add_subtasks:
                     num_subtasks = random.randint(subtask_count[0], subtask_count[1])
-                    print(f"      → Attempting to create {num_subtasks} subtasks for task {task_gid}...")
+                    logger.info(f"      → Attempting to create {num_subtasks} subtasks for task {task_gid}...")
                     for subtask_idx in range(num_subtasks):
-                        print(f"        → Creating subtask {subtask_idx+1}/{num_subtasks}...")
+                        logger.info(f"        → Creating subtask {subtask_idx+1}/{num_subtasks}...")
                         subtask = await self._create_subtask(task_gid, project_gid)
                         if subtask:
                             subtasks_created += 1
                             has_subtask = True
-                            print(f"        ✓ Subtask created successfully (total: {subtasks_created})")
+                            logger.info(f"        ✓ Subtask created successfully (total: {subtasks_created})")
                         else:
-                            print(f"        ✗ Subtask creation returned None")
+                            logger.error(f"        ✗ Subtask creation returned None")
                         await asyncio.sleep(0.5)
                 else:
-                    print(f"      → Skipping subtasks for task {task_idx+1}")
+                    logger.info(f"      → Skipping subtasks for task {task_idx+1}")
 
                 # GUARANTEE: First TWO tasks always get comments (minimum guarantee)
                 # After that, use activity-level probability
@@ -530,7 +575,7 @@ class AsanaService(BaseService):
                     # IMPROVED: Create conversation-style comments scaled by activity level
                     # This ensures Alice and Joe have actual conversations, not just isolated comments
                     num_comments = random.randint(comment_count[0], comment_count[1])
-                    print(f"      → Adding {num_comments} conversational comments...")
+                    logger.info(f"      → Adding {num_comments} conversational comments...")
 
                     # FIX: Use in-memory cache to avoid stale disk reads
                     task_comments_cache = []
@@ -544,10 +589,10 @@ class AsanaService(BaseService):
                         if comment_added:
                             comments_created += 1
                             has_comment = True
-                            print(f"        ✓ Comment {comment_idx+1}/{num_comments} added")
+                            logger.info(f"        ✓ Comment {comment_idx+1}/{num_comments} added")
 
                         # Still reload state for other data (tasks, projects, etc.)
-                        self.state = self.state_manager.load_state(self.job_id)
+                        self._reload_state()
 
                         # INCREASED DELAY: Give more time between comments for natural pacing
                         # Increased from 1.5s to 2.5s to reduce race conditions
@@ -556,14 +601,14 @@ class AsanaService(BaseService):
                 # Note: No additional delay needed here since we already waited 2s after task creation
 
             # Reload state
-            self.state = self.state_manager.load_state(self.job_id)
+            self._reload_state()
 
-            print(f"  ✓ Project setup complete: {tasks_created} tasks, {subtasks_created} subtasks, {comments_created} comments")
+            logger.info(f"  ✓ Project setup complete: {tasks_created} tasks, {subtasks_created} subtasks, {comments_created} comments")
 
             return project
 
         except Exception as e:
-            print(f"✗ Error creating project: {e}")
+            logger.error(f"✗ Error creating project: {e}")
             self.state_manager.log_error(self.job_id, "project_creation", str(e))
             return None
 
@@ -581,7 +626,8 @@ class AsanaService(BaseService):
 
         try:
             # Create project in Asana
-            project = client.create_project(
+            project = await asyncio.to_thread(
+                client.create_project,
                 workspace_gid=self.config["workspace_gid"],
                 name=project_name,
                 notes=project_description,
@@ -602,7 +648,7 @@ class AsanaService(BaseService):
                 "user": client.user_name
             })
 
-            print(f"✓ Created project: {project_name}")
+            logger.info(f"✓ Created project: {project_name}")
 
             # Create initial tasks for this project
             num_tasks = random.randint(5, 12)
@@ -611,12 +657,12 @@ class AsanaService(BaseService):
                 await asyncio.sleep(1)
 
             # Reload state
-            self.state = self.state_manager.load_state(self.job_id)
+            self._reload_state()
 
             return project
 
         except Exception as e:
-            print(f"✗ Error creating project: {e}")
+            logger.error(f"✗ Error creating project: {e}")
             self.state_manager.log_error(self.job_id, "project_creation", str(e))
             return None
 
@@ -649,7 +695,7 @@ class AsanaService(BaseService):
                 project_description = self.llm.generate_project_description(industry, project_name)
                 break
             else:
-                print(f"    ⚠ Generated duplicate name '{generated_name}', retrying... ({attempt + 1}/{max_attempts})")
+                logger.warning(f"    ⚠ Generated duplicate name '{generated_name}', retrying... ({attempt + 1}/{max_attempts})")
 
         # If we couldn't generate a unique name after max attempts, add a suffix
         if not project_name:
@@ -660,11 +706,12 @@ class AsanaService(BaseService):
             project_name = f"{base_name} #{counter}"
             project_description = self.llm.generate_project_description(industry, project_name)
 
-        print(f"Creating LLM-generated project: {project_name}")
+        logger.info(f"Creating LLM-generated project: {project_name}")
 
         try:
             # Create project in Asana
-            project = client.create_project(
+            project = await asyncio.to_thread(
+                client.create_project,
                 workspace_gid=self.config["workspace_gid"],
                 name=project_name,
                 notes=project_description,
@@ -686,7 +733,7 @@ class AsanaService(BaseService):
                 "generation_method": "llm_generated"
             })
 
-            print(f"  ✓ Created LLM-generated project: {project_name}")
+            logger.info(f"  ✓ Created LLM-generated project: {project_name}")
 
             # Create initial tasks for this project
             num_tasks = random.randint(5, 12)
@@ -695,12 +742,12 @@ class AsanaService(BaseService):
                 await asyncio.sleep(1)
 
             # Reload state
-            self.state = self.state_manager.load_state(self.job_id)
+            self._reload_state()
 
             return project
 
         except Exception as e:
-            print(f"✗ Error creating LLM-generated project: {e}")
+            logger.error(f"✗ Error creating LLM-generated project: {e}")
             self.state_manager.log_error(self.job_id, "project_creation_llm", str(e))
             return None
 
@@ -721,7 +768,7 @@ class AsanaService(BaseService):
                 # Check if we already created this field
                 if field_name in self.workspace_custom_fields:
                     field_gid = self.workspace_custom_fields[field_name]
-                    print(f"    ↳ Using existing custom field: {field_name}")
+                    logger.info(f"    ↳ Using existing custom field: {field_name}")
                 else:
                     # Create the custom field
                     kwargs = {}
@@ -731,7 +778,8 @@ class AsanaService(BaseService):
                     if "options" in field_def:
                         kwargs["enum_options"] = [{"name": opt} for opt in field_def["options"]]
 
-                    field = client.create_custom_field(
+                    field = await asyncio.to_thread(
+                        client.create_custom_field,
                         workspace_gid=workspace_gid,
                         name=field_name,
                         field_type=field_type,
@@ -741,14 +789,14 @@ class AsanaService(BaseService):
                     field_gid = field["gid"]
                     self.workspace_custom_fields[field_name] = field_gid
                     self.state["stats"]["custom_fields_created"] += 1
-                    print(f"    ✓ Created custom field: {field_name} ({field_type})")
+                    logger.info(f"    ✓ Created custom field: {field_name} ({field_type})")
 
                 # Add field to project
-                client.add_custom_field_to_project(project_gid, field_gid)
+                await asyncio.to_thread(client.add_custom_field_to_project, project_gid, field_gid)
 
             except Exception as e:
                 # Graceful failure - log but continue
-                print(f"    ⚠ Could not create custom field '{field_name}': {e}")
+                logger.warning(f"    ⚠ Could not create custom field '{field_name}': {e}")
                 self.state_manager.log_activity(self.job_id, "custom_field_failed", {
                     "field_name": field_name,
                     "project_id": project_gid,
@@ -764,12 +812,12 @@ class AsanaService(BaseService):
 
         for section_name in section_names:
             try:
-                section = client.create_section(project_gid, section_name)
+                section = await asyncio.to_thread(client.create_section, project_gid, section_name)
                 self.state["stats"]["sections_created"] += 1
-                print(f"    ✓ Created section: {section_name}")
+                logger.info(f"    ✓ Created section: {section_name}")
             except Exception as e:
                 # Graceful failure
-                print(f"    ⚠ Could not create section '{section_name}': {e}")
+                logger.warning(f"    ⚠ Could not create section '{section_name}': {e}")
                 self.state_manager.log_activity(self.job_id, "section_failed", {
                     "section_name": section_name,
                     "project_id": project_gid,
@@ -788,11 +836,12 @@ class AsanaService(BaseService):
             try:
                 # Check if we already created this tag
                 if tag_name in self.workspace_tags:
-                    print(f"    ↳ Tag already exists: {tag_name}")
+                    logger.info(f"    ↳ Tag already exists: {tag_name}")
                     continue
 
                 # Create the tag
-                tag = client.create_tag(
+                tag = await asyncio.to_thread(
+                    client.create_tag,
                     workspace_gid=workspace_gid,
                     name=tag_name,
                     color=random.choice(["dark-pink", "dark-purple", "dark-blue",
@@ -800,11 +849,11 @@ class AsanaService(BaseService):
                 )
                 self.workspace_tags[tag_name] = tag["gid"]
                 self.state["stats"]["tags_created"] += 1
-                print(f"    ✓ Created tag: {tag_name}")
+                logger.info(f"    ✓ Created tag: {tag_name}")
 
             except Exception as e:
                 # Graceful failure
-                print(f"    ⚠ Could not create tag '{tag_name}': {e}")
+                logger.warning(f"    ⚠ Could not create tag '{tag_name}': {e}")
                 self.state_manager.log_activity(self.job_id, "tag_failed", {
                     "tag_name": tag_name,
                     "error": str(e)
@@ -823,10 +872,11 @@ class AsanaService(BaseService):
             # Check if we already created this portfolio
             if portfolio_name in self.workspace_portfolios:
                 portfolio_gid = self.workspace_portfolios[portfolio_name]
-                print(f"    ↳ Using existing portfolio: {portfolio_name}")
+                logger.info(f"    ↳ Using existing portfolio: {portfolio_name}")
             else:
                 # Create the portfolio
-                portfolio = client.create_portfolio(
+                portfolio = await asyncio.to_thread(
+                    client.create_portfolio,
                     workspace_gid=workspace_gid,
                     name=portfolio_name,
                     color=random.choice(["light-green", "light-blue", "light-purple"]),
@@ -835,15 +885,15 @@ class AsanaService(BaseService):
                 portfolio_gid = portfolio["gid"]
                 self.workspace_portfolios[portfolio_name] = portfolio_gid
                 self.state["stats"]["portfolios_created"] += 1
-                print(f"    ✓ Created portfolio: {portfolio_name}")
+                logger.info(f"    ✓ Created portfolio: {portfolio_name}")
 
             # Add project to portfolio
-            client.add_project_to_portfolio(portfolio_gid, project_gid)
-            print(f"    ✓ Added project to portfolio: {portfolio_name}")
+            await asyncio.to_thread(client.add_project_to_portfolio, portfolio_gid, project_gid)
+            logger.info(f"    ✓ Added project to portfolio: {portfolio_name}")
 
         except Exception as e:
             # Graceful failure
-            print(f"    ⚠ Could not create/add to portfolio '{portfolio_name}': {e}")
+            logger.warning(f"    ⚠ Could not create/add to portfolio '{portfolio_name}': {e}")
             self.state_manager.log_activity(self.job_id, "portfolio_failed", {
                 "portfolio_name": portfolio_name,
                 "project_id": project_gid,
@@ -898,7 +948,7 @@ class AsanaService(BaseService):
                     options = field_def.get("options", [])
                     if options:
                         # Get the full custom field data to get enum_options with GIDs
-                        workspace_fields = client.get_workspace_custom_fields(self.config["workspace_gid"])
+                        workspace_fields = await asyncio.to_thread(client.get_workspace_custom_fields, self.config["workspace_gid"])
                         for wf in workspace_fields:
                             if wf["gid"] == field_gid:
                                 enum_options = wf.get("enum_options", [])
@@ -912,7 +962,7 @@ class AsanaService(BaseService):
                     options = field_def.get("options", [])
                     if options:
                         # Get the full custom field data to get enum_options with GIDs
-                        workspace_fields = client.get_workspace_custom_fields(self.config["workspace_gid"])
+                        workspace_fields = await asyncio.to_thread(client.get_workspace_custom_fields, self.config["workspace_gid"])
                         for wf in workspace_fields:
                             if wf["gid"] == field_gid:
                                 enum_options = wf.get("enum_options", [])
@@ -929,11 +979,11 @@ class AsanaService(BaseService):
 
                 # Set the custom field value
                 if value is not None:
-                    client.create_custom_field_value(task_gid, field_gid, value)
+                    await asyncio.to_thread(client.create_custom_field_value, task_gid, field_gid, value)
 
             except Exception as e:
                 # Graceful failure - some fields might not be settable
-                print(f"    ⚠ Could not set custom field '{field_name}': {e}")
+                logger.warning(f"    ⚠ Could not set custom field '{field_name}': {e}")
 
     async def _create_task(self, project_id: str, use_case: Optional[Dict[str, Any]] = None,
                           sections: Optional[List[str]] = None, task_index: int = 0) -> Optional[Dict[str, Any]]:
@@ -1002,10 +1052,11 @@ class AsanaService(BaseService):
 
             # ATOMIC CREATION: Create task with ALL attributes from the start
             # This is more mature than create-then-update pattern which has race conditions
-            print(f"    → Creating task in project {project_id} for {assignee} (GID: {assignee_gid})")
+            logger.info(f"    → Creating task in project {project_id} for {assignee} (GID: {assignee_gid})")
 
             # Create task with assignee directly (atomic operation)
-            task = client.create_task(
+            task = await asyncio.to_thread(
+                client.create_task,
                 project_gid=project_id,
                 name=task_name,
                 notes=self.llm.generate_task_description(industry, project_name, task_name),
@@ -1017,25 +1068,25 @@ class AsanaService(BaseService):
             task_gid = task["gid"]
 
             if assignee_gid:
-                print(f"    ✓ Task created and assigned to {assignee}: {task_name[:40]}...")
+                logger.info(f"    ✓ Task created and assigned to {assignee}: {task_name[:40]}...")
             else:
-                print(f"    ⚠ Could not find Asana user for {assignee}, task created unassigned")
+                logger.warning(f"    ⚠ Could not find Asana user for {assignee}, task created unassigned")
 
             # Add task to a section if sections are available
             if sections:
                 try:
                     # Get project sections
-                    project_sections = client.get_project_sections(project_id)
+                    project_sections = await asyncio.to_thread(client.get_project_sections, project_id)
                     if project_sections:
                         # Pick a random section from the use case sections
                         target_section_name = random.choice(sections)
                         # Find matching section GID
                         for section in project_sections:
                             if section["name"] == target_section_name:
-                                client.add_task_to_section(task_gid, section["gid"])
+                                await asyncio.to_thread(client.add_task_to_section, task_gid, section["gid"])
                                 break
                 except Exception as e:
-                    print(f"    ⚠ Could not add task to section: {e}")
+                    logger.warning(f"    ⚠ Could not add task to section: {e}")
 
             # Add tags to task if available
             if use_case:
@@ -1049,9 +1100,9 @@ class AsanaService(BaseService):
                         for tag_name in selected_tags:
                             if tag_name in self.workspace_tags:
                                 tag_gid = self.workspace_tags[tag_name]
-                                client.add_tag_to_task(task_gid, tag_gid)
+                                await asyncio.to_thread(client.add_tag_to_task, task_gid, tag_gid)
                     except Exception as e:
-                        print(f"    ⚠ Could not add tags to task: {e}")
+                        logger.warning(f"    ⚠ Could not add tags to task: {e}")
 
             # Set custom field values if available
             if use_case and use_case.get("custom_fields"):
@@ -1059,26 +1110,28 @@ class AsanaService(BaseService):
 
             # Add to state
             self.state_manager.add_task(self.job_id, project_id, task)
-
-            # Log activity
-            self.state_manager.log_activity(self.job_id, "task_created", {
-                "task_id": task_gid,
-                "task_name": task_name,
-                "project_id": project_id,
-                "assignee": assignee,
-                "user": client.user_name
-            })
+            self._assignee_index_source = None  # New task - rebuild the assignee index on next use
+
+            # Log activity (skip building the details when nothing consumes them)
+            if self.state_manager.has_activity_listeners():
+                self.state_manager.log_activity(self.job_id, "task_created", {
+                    "task_id": task_gid,
+                    "task_name": task_name,
+                    "project_id": project_id,
+                    "assignee": assignee,
+                    "user": client.user_name
+                })
 
             # Track API usage
             self.state_manager.increment_api_usage(self.job_id, "asana", 1)
 
             # Reload state
-            self.state = self.state_manager.load_state(self.job_id)
+            self._reload_state()
 
             return task
 
         except Exception as e:
-            print(f"✗ Error creating task: {e}")
+            logger.error(f"✗ Error creating task: {e}")
             self.state_manager.log_error(self.job_id, "task_creation", str(e))
             return None
 
@@ -1103,7 +1156,8 @@ class AsanaService(BaseService):
 
             # Create subtask using the proper API endpoint
             # IMPROVED: If assignee lookup fails, still create subtask unassigned
-            subtask = client.create_subtask(
+            subtask = await asyncio.to_thread(
+                client.create_subtask,
                 parent_task_gid=parent_task_id,
                 name=subtask_name,
                 notes="",
@@ -1111,10 +1165,10 @@ class AsanaService(BaseService):
             )
 
             if assignee_gid:
-                print(f"      ✓ Created subtask assigned to {assignee}: {subtask_name[:35]}...")
+                logger.info(f"      ✓ Created subtask assigned to {assignee}: {subtask_name[:35]}...")
             else:
-                print(f"      ✓ Created subtask (unassigned): {subtask_name[:35]}...")
-                print(f"        ⚠ Could not find Asana user for {assignee}")
+                logger.info(f"      ✓ Created subtask (unassigned): {subtask_name[:35]}...")
+                logger.warning(f"        ⚠ Could not find Asana user for {assignee}")
 
             # Track in state - add to task's subtasks array and increment stats
             for proj in self.state.get("projects", []):
@@ -1146,7 +1200,7 @@ class AsanaService(BaseService):
             return subtask
 
         except Exception as e:
-            print(f"      ⚠ Error creating subtask: {e}")
+            logger.warning(f"      ⚠ Error creating subtask: {e}")
             self.state_manager.log_error(self.job_id, "subtask_creation", str(e))
             return None
 
@@ -1181,7 +1235,7 @@ class AsanaService(BaseService):
         for user in all_users:
             if user.lower() in last_comment_text.lower():
                 # This user was mentioned - they should respond!
-                print(f"      → {user} was mentioned in last comment, selecting them to respond")
+                logger.info(f"      → {user} was mentioned in last comment, selecting them to respond")
                 return user
 
         # RULE 2: If last comment was a question, someone OTHER than the asker must answer
@@ -1190,7 +1244,7 @@ class AsanaService(BaseService):
             other_users = [u for u in all_users if u != last_commenter]
             if other_users:
                 selected = random.choice(other_users)
-                print(f"      → Last comment was a question from {last_commenter}, selecting {selected} to answer")
+                logger.info(f"      → Last comment was a question from {last_commenter}, selecting {selected} to answer")
                 return selected
 
         # RULE 3: For realistic conversations, ALWAYS alternate users unless there are many comments
@@ -1281,30 +1335,31 @@ class AsanaService(BaseService):
                 comment_type = "conversation_response"
 
             # Add comment to Asana
-            commenter_client.add_comment(task_gid, comment_text)
+            await asyncio.to_thread(commenter_client.add_comment, task_gid, comment_text)
 
             # Update state
             self.state_manager.add_comment(self.job_id, task_gid, {"text": comment_text})
-            self.state_manager.log_activity(self.job_id, "comment_added", {
-                "task_id": task_gid,
-                "task_name": task_name,
-                "user": commenter,
-                "comment": comment_text,
-                "type": comment_type
-            })
+            if self.state_manager.has_activity_listeners():
+                self.state_manager.log_activity(self.job_id, "comment_added", {
+                    "task_id": task_gid,
+                    "task_name": task_name,
+                    "user": commenter,
+                    "comment": comment_text,
+                    "type": comment_type
+                })
 
             # Track API usage (Asana + LLM)
             self.state_manager.increment_api_usage(self.job_id, "asana", 1)
-            llm_stats = self.llm.get_usage_stats()
-            self.state_manager.increment_api_usage(self.job_id, "llm", 1, llm_stats["total_tokens"])
+            self.state_manager.increment_api_usage(self.job_id, "llm", 1,
+                                                   self.llm.pop_tokens_since_last())
 
             if comment_type == "initial":
-                print(f"      ✓ Added LLM-generated initial comment by {commenter}")
+                logger.info(f"      ✓ Added LLM-generated initial comment by {commenter}")
             elif comment_type == "progress_self":
-                print(f"      ✓ Added LLM-generated progress update by {commenter}")
+                logger.info(f"      ✓ Added LLM-generated progress update by {commenter}")
             else:
                 last_commenter = existing_comments[0].get("user") if existing_comments else "someone"
-                print(f"      ✓ Added LLM-generated response by {commenter} → {last_commenter}")
+                logger.info(f"      ✓ Added LLM-generated response by {commenter} → {last_commenter}")
 
             # IMPORTANT: Update in-memory cache if provided
             if in_memory_comments is not None:
@@ -1318,10 +1373,50 @@ class AsanaService(BaseService):
             return True
 
         except Exception as e:
-            print(f"      ⚠ Error adding comment: {e}")
+            logger.warning(f"      ⚠ Error adding comment: {e}")
             self.state_manager.log_error(self.job_id, "comment_creation", str(e))
             return False
 
+    def _queue_state_op(self, name: str, *args):
+        """
+        Queue a state manager update for the next batched write.
+
+        Args:
+            name: StateManager method name ('add_comment', 'log_activity' or 'increment_api_usage')
+            *args: Arguments to the method, without the job ID
+        """
+        with self._state_ops_lock:
+            self._pending_state_ops.append((name, args))
+
+    def _flush_state_ops(self):
+        """Write all queued state updates to the job file in one batch."""
+        with self._state_ops_lock:
+            ops, self._pending_state_ops = self._pending_state_ops, []
+        if ops and not self.deleted:
+            self.state_manager.apply_batch(self.job_id, ops)
+
+    def _reload_state(self):
+        """Write out queued state updates, then reload self.state from the job file."""
+        self._flush_state_ops()
+        self.state = self.state_manager.load_state(self.job_id)
+
+    async def _periodic_state_flush(self):
+        """Flush queued state updates every STATE_FLUSH_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(self.STATE_FLUSH_INTERVAL)
+            self._flush_state_ops()
+
+    async def _stop_state_flush(self):
+        """Stop the periodic flush and write out anything still queued."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        self._flush_state_ops()
+
     async def _generate_activity(self):
         """Generate a single activity based on current state."""
         # Check if we should create a new project
@@ -1384,17 +1479,17 @@ class AsanaService(BaseService):
 
         try:
             # Add comment to Asana
-            client.add_comment(task["id"], comment_text)
+            await asyncio.to_thread(client.add_comment, task["id"], comment_text)
 
             # Update task status to in_progress
-            client.update_task(task["id"], {"completed": False})
+            await asyncio.to_thread(client.update_task, task["id"], {"completed": False})
 
             # Update state
             self.state_manager.update_task_status(self.job_id, task["id"], "in_progress")
-            self.state_manager.add_comment(self.job_id, task["id"], {"text": comment_text})
+            self._queue_state_op("add_comment", task["id"], {"text": comment_text})
 
             # Log activity
-            self.state_manager.log_activity(self.job_id, "comment_added", {
+            self._queue_state_op("log_activity", "comment_added", {
                 "task_id": task["id"],
                 "task_name": task["name"],
                 "user": assignee,
@@ -1403,15 +1498,14 @@ class AsanaService(BaseService):
             })
 
             # Track API usage
-            self.state_manager.increment_api_usage(self.job_id, "asana", 2)
-            llm_stats = self.llm.get_usage_stats()
-            self.state_manager.increment_api_usage(self.job_id, "llm", 1,
-                                                   llm_stats["total_tokens"])
+            self._queue_state_op("increment_api_usage", "asana", 2)
+            self._queue_state_op("increment_api_usage", "llm", 1,
+                                 self.llm.pop_tokens_since_last())
 
-            print(f"  {assignee} started work on: {task['name'][:50]}...")
+            logger.info(f"  {assignee} started work on: {task['name'][:50]}...")
 
         except Exception as e:
-            print(f"✗ Error in start_work: {e}")
+            logger.error(f"✗ Error in start_work: {e}")
             self.state_manager.log_error(self.job_id, "start_work", str(e))
 
     async def _handle_progress_update(self):
@@ -1432,22 +1526,22 @@ class AsanaService(BaseService):
                                                                  industry, current_time)
 
         try:
-            client.add_comment(task["id"], comment_text)
+            await asyncio.to_thread(client.add_comment, task["id"], comment_text)
 
-            self.state_manager.add_comment(self.job_id, task["id"], {"text": comment_text})
-            self.state_manager.log_activity(self.job_id, "comment_added", {
+            self._queue_state_op("add_comment", task["id"], {"text": comment_text})
+            self._queue_state_op("log_activity", "comment_added", {
                 "task_id": task["id"],
                 "task_name": task.get("name", "Unknown task"),
                 "user": assignee,
                 "type": "progress"
             })
 
-            self.state_manager.increment_api_usage(self.job_id, "asana", 1)
+            self._queue_state_op("increment_api_usage", "asana", 1)
 
-            print(f"  {assignee} posted progress on: {task['name'][:50]}...")
+            logger.info(f"  {assignee} posted progress on: {task['name'][:50]}...")
 
         except Exception as e:
-            print(f"✗ Error in progress_update: {e}")
+            logger.error(f"✗ Error in progress_update: {e}")
 
     async def _handle_block_task(self):
         """Handle blocking a task."""
@@ -1465,24 +1559,24 @@ class AsanaService(BaseService):
         comment_text = self.llm.generate_comment_blocked(assignee, task["name"], industry)
 
         try:
-            client.add_comment(task["id"], comment_text)
+            await asyncio.to_thread(client.add_comment, task["id"], comment_text)
 
             self.state_manager.update_task_status(self.job_id, task["id"], "blocked",
                                                   {"blocker_reason": comment_text})
-            self.state_manager.add_comment(self.job_id, task["id"], {"text": comment_text})
-            self.state_manager.log_activity(self.job_id, "task_blocked", {
+            self._queue_state_op("add_comment", task["id"], {"text": comment_text})
+            self._queue_state_op("log_activity", "task_blocked", {
                 "task_id": task["id"],
                 "task_name": task.get("name", "Unknown task"),
                 "user": assignee,
                 "reason": comment_text
             })
 
-            self.state_manager.increment_api_usage(self.job_id, "asana", 1)
+            self._queue_state_op("increment_api_usage", "asana", 1)
 
-            print(f"  {assignee} blocked task: {task['name'][:50]}...")
+            logger.info(f"  {assignee} blocked task: {task['name'][:50]}...")
 
         except Exception as e:
-            print(f"✗ Error in block_task: {e}")
+            logger.error(f"✗ Error in block_task: {e}")
 
     async def _handle_unblock_task(self):
         """Handle unblocking a task."""
@@ -1500,22 +1594,22 @@ class AsanaService(BaseService):
         comment_text = self.llm.generate_comment_unblocked(assignee, blocker_reason)
 
         try:
-            client.add_comment(task["id"], comment_text)
+            await asyncio.to_thread(client.add_comment, task["id"], comment_text)
 
             self.state_manager.update_task_status(self.job_id, task["id"], "in_progress")
-            self.state_manager.add_comment(self.job_id, task["id"], {"text": comment_text})
-            self.state_manager.log_activity(self.job_id, "task_unblocked", {
+            self._queue_state_op("add_comment", task["id"], {"text": comment_text})
+            self._queue_state_op("log_activity", "task_unblocked", {
                 "task_id": task["id"],
                 "task_name": task.get("name", "Unknown task"),
                 "user": assignee
             })
 
-            self.state_manager.increment_api_usage(self.job_id, "asana", 1)
+            self._queue_state_op("increment_api_usage", "asana", 1)
 
-            print(f"  {assignee} unblocked task: {task['name'][:50]}...")
+            logger.info(f"  {assignee} unblocked task: {task['name'][:50]}...")
 
         except Exception as e:
-            print(f"✗ Error in unblock_task: {e}")
+            logger.error(f"✗ Error in unblock_task: {e}")
 
     async def _handle_complete_task(self):
         """Handle completing a task."""
@@ -1535,25 +1629,25 @@ class AsanaService(BaseService):
 
         try:
             # Add comment
-            client.add_comment(task["id"], comment_text)
+            await asyncio.to_thread(client.add_comment, task["id"], comment_text)
 
             # Complete task
-            client.complete_task(task["id"])
+            await asyncio.to_thread(client.complete_task, task["id"])
 
             self.state_manager.update_task_status(self.job_id, task["id"], "completed")
-            self.state_manager.add_comment(self.job_id, task["id"], {"text": comment_text})
-            self.state_manager.log_activity(self.job_id, "task_completed", {
+            self._queue_state_op("add_comment", task["id"], {"text": comment_text})
+            self._queue_state_op("log_activity", "task_completed", {
                 "task_id": task["id"],
                 "task_name": task.get("name", "Unknown task"),
                 "user": assignee
             })
 
-            self.state_manager.increment_api_usage(self.job_id, "asana", 2)
+            self._queue_state_op("increment_api_usage", "asana", 2)
 
-            print(f"  ✓ {assignee} completed: {task['name'][:50]}...")
+            logger.info(f"  ✓ {assignee} completed: {task['name'][:50]}...")
 
         except Exception as e:
-            print(f"✗ Error in complete_task: {e}")
+            logger.error(f"✗ Error in complete_task: {e}")
 
     async def _handle_conversation(self):
         """Handle conversational comment."""
@@ -1585,36 +1679,65 @@ class AsanaService(BaseService):
         )
 
         try:
-            client.add_comment(task["id"], comment_text)
+            await asyncio.to_thread(client.add_comment, task["id"], comment_text)
 
-            self.state_manager.add_comment(self.job_id, task["id"], {"text": comment_text})
-            self.state_manager.log_activity(self.job_id, "comment_added", {
+            self._queue_state_op("add_comment", task["id"], {"text": comment_text})
+            self._queue_state_op("log_activity", "comment_added", {
                 "task_id": task["id"],
                 "task_name": task.get("name", "Unknown task"),
                 "user": user2,
                 "type": "conversation"
             })
 
-            self.state_manager.increment_api_usage(self.job_id, "asana", 1)
+            self._queue_state_op("increment_api_usage", "asana", 1)
 
-            print(f"  {user2} replied on: {task['name'][:50]}...")
+            logger.info(f"  {user2} replied on: {task['name'][:50]}...")
 
         except Exception as e:
-            print(f"✗ Error in conversation: {e}")
+            logger.error(f"✗ Error in conversation: {e}")
+
+    def _rebuild_assignee_index(self):
+        """Index every task in state by its assignee name."""
+        projects = self.state.get("projects", [])
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for project in projects:
+            for task in project.get("tasks", []):
+                index.setdefault(task.get("assignee_name"), []).append(task)
+        self._tasks_by_assignee = index
+        self._assignee_index_source = projects
+
+    def _get_tasks_for_assignee(self, user_name: str) -> List[Dict[str, Any]]:
+        """
+        Get the state tasks assigned to a user.
+
+        Args:
+            user_name: Assignee name
+
+        Returns:
+            Tasks assigned to the user
+        """
+        if self._assignee_index_source is not self.state.get("projects"):
+            self._rebuild_assignee_index()
+        return self._tasks_by_assignee.get(user_name, [])
 
     async def _handle_ooo_comment(self):
         """Handle out-of-office comment."""
         user = random.choice(self.client_pool.get_valid_user_names())
+        await self._handle_ooo_comment_for(user)
+
+    async def _handle_ooo_comment_for(self, user: str):
+        """
+        Post an out-of-office comment from a specific user.
+
+        Args:
+            user: Name of the user posting the comment
+        """
         client = self.client_pool.get_client(user)
         if not client:
             return
 
         # Pick a task assigned to this user
-        user_tasks = []
-        for project in self.state.get("projects", []):
-            for task in project.get("tasks", []):
-                if task.get("assignee_name") == user:
-                    user_tasks.append(task)
+        user_tasks = self._get_tasks_for_assignee(user)
 
         if not user_tasks:
             return
@@ -1625,20 +1748,20 @@ class AsanaService(BaseService):
         comment_text = self.llm.generate_comment_out_of_office(user, reason)
 
         try:
-            client.add_comment(task["id"], comment_text)
+            await asyncio.to_thread(client.add_comment, task["id"], comment_text)
 
-            self.state_manager.add_comment(self.job_id, task["id"], {"text": comment_text})
-            self.state_manager.log_activity(self.job_id, "comment_added", {
+            self._queue_state_op("add_comment", task["id"], {"text": comment_text})
+            self._queue_state_op("log_activity", "comment_added", {
                 "task_id": task["id"],
                 "task_name": task.get("name", "Unknown task"),
                 "user": user,
                 "type": "ooo"
             })
 
-            print(f"  {user} posted OOO message")
+            logger.info(f"  {user} posted OOO message")
 
         except Exception as e:
-            print(f"✗ Error in ooo_comment: {e}")
+            logger.error(f"✗ Error in ooo_comment: {e}")
 
     async def _handle_task_reassignment(self):
         """Handle reassigning a task."""
@@ -1647,11 +1770,84 @@ class AsanaService(BaseService):
 
     async def _handle_rate_limit_pause(self):
         """Handle rate limit by generating realistic pause comments."""
-        print("  Generating realistic pause due to rate limits...")
-        # Users would post OOO messages
-        for user in self.client_pool.get_valid_user_names():
-            if random.random() < 0.3:  # 30% of users post OOO
-                await self._handle_ooo_comment()
+        logger.info("  Generating realistic pause due to rate limits...")
+        valid_users = self.client_pool.get_valid_user_names()
+        if not valid_users:
+            return
+
+        # About 30% of users post OOO messages - at least one
+        ooo_users = random.sample(valid_users, max(1, int(len(valid_users) * 0.3)))
+
+        # The Asana calls run off the event loop, so post them concurrently
+        semaphore = asyncio.Semaphore(self.OOO_CONCURRENCY)
+
+        async def post_ooo(user: str):
+            async with semaphore:
+                await self._handle_ooo_comment_for(user)
+
+        await asyncio.gather(*(post_ooo(user) for user in ooo_users))
+
+    async def _try_delete_with_clients(self, clients: List[AsanaConnection], method: str, gid: str,
+                                       item_description: str,
+                                       call: Callable[..., Awaitable[Any]],
+                                       forbidden: Optional[Dict[str, Set[str]]] = None) -> Optional[AsanaConnection]:
+        """
+        Try a deletion with each client until one succeeds.
+
+        Args:
+            clients: Clients to try, in order
+            method: Name of the AsanaConnection delete method (e.g. 'delete_task')
+            gid: GID of the object to delete
+            item_description: Human-readable description of the object
+            call: Runs one blocking client call, e.g. within the cleanup rate budget.
+                Each client attempt is a separate request, so each goes through it.
+            forbidden: Optional map of user name -> delete methods that user has been
+                refused. Those clients are tried last, and new refusals are recorded.
+
+        Returns:
+            The client that deleted the object, or None if every client was refused permission
+        """
+        if forbidden is not None:
+            clients = self._order_clients_by_permission(clients, method, forbidden)
+
+        for client in clients:
+            try:
+                await call(getattr(client, method), gid)
+                return client
+            except Exception as e:
+                error_str = str(e)
+                # If it's a permission error (403), try next client
+                if "403" in error_str or "permission" in error_str.lower() or "Forbidden" in error_str:
+                    if forbidden is not None:
+                        forbidden[client.user_name].add(method)
+                    continue
+                else:
+                    # For non-permission errors, raise immediately
+                    raise e
+        # If we tried all clients and all failed with permission errors
+        return None
+
+    @staticmethod
+    def _order_clients_by_permission(clients: List[AsanaConnection], method: str,
+                                     forbidden: Dict[str, Set[str]]) -> List[AsanaConnection]:
+        """
+        Move clients already refused `method` behind the others.
+
+        They are kept rather than skipped because a 403 can be specific to one
+        object (e.g. a project owned by someone else).
+
+        Args:
+            clients: Clients in preferred order
+            method: Name of the AsanaConnection delete method
+            forbidden: Map of user name -> delete methods that user has been refused
+
+        Returns:
+            Reordered list of clients
+        """
+        allowed = [c for c in clients if method not in forbidden[c.user_name]]
+        if len(allowed) == len(clients):
+            return clients
+        return allowed + [c for c in clients if method in forbidden[c.user_name]]
 
     async def cleanup_platform_data(self, progress_callback=None):
         """
@@ -1672,12 +1868,14 @@ class AsanaService(BaseService):
         Returns:
             Dict with cleanup results
         """
-        print(f"\n{'='*60}")
-        print(f"Starting cleanup for job {self.job_id}")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Starting cleanup for job {self.job_id}")
+        logger.info(f"{'='*60}\n")
 
-        # Reload state to ensure we have latest data
-        self.state = self.state_manager.load_state(self.job_id)
+        # Reload state only if it may have changed on disk since we loaded it
+        if self._state_dirty:
+            self.state = self.state_manager.load_state(self.job_id)
+            self._state_dirty = False
 
         projects = self.state.get("projects", [])
         total_projects = len(projects)
@@ -1690,7 +1888,7 @@ class AsanaService(BaseService):
         failed_projects = []
 
         if total_projects == 0:
-            print("No projects to delete")
+            logger.info("No projects to delete")
             return {
                 "success": True,
                 "deleted_projects": 0,
@@ -1702,12 +1900,12 @@ class AsanaService(BaseService):
                 "failed_projects": []
             }
 
-        print(f"Found {total_projects} project(s) to delete")
+        logger.info(f"Found {total_projects} project(s) to delete")
 
         # Get all available clients - we'll try each one for deletions that fail with permission errors
         all_clients = self.client_pool.get_valid_clients()
         if not all_clients:
-            print(f"✗ No valid clients available for deletion")
+            logger.error(f"✗ No valid clients available for deletion")
             return {
                 "success": False,
                 "deleted_projects": 0,
@@ -1723,200 +1921,230 @@ class AsanaService(BaseService):
                 }]
             }
 
-        # Helper function to try deletion with each client until one succeeds
-        def try_delete_with_clients(delete_func, item_description: str) -> bool:
-            """Try deletion with each available client until one succeeds."""
-            for client in all_clients:
+        # Deletions are independent, I/O-bound HTTP calls. Run them concurrently in
+        # worker threads, bounded by CLEANUP_CONCURRENCY in-flight requests and
+        # paced by the token-bucket limiter. Rate-limit and 5xx errors are retried
+        # with jittered exponential backoff.
+        semaphore = asyncio.Semaphore(self.CLEANUP_CONCURRENCY)
+
+        # Delete methods each user has been refused (403) during this cleanup, so
+        # later deletions try users with permission first
+        forbidden: Dict[str, Set[str]] = defaultdict(set)
+
+        # Clients in most-recently-successful order, so the user who can delete a
+        # kind of object is tried before users who keep getting refused. Each
+        # deletion works from a snapshot, since others reorder it while it waits.
+        client_order = deque(all_clients)
+
+        def promote_client(client: Optional[AsanaConnection]):
+            if client is not None and client_order[0] is not client:
+                client_order.remove(client)
+                client_order.appendleft(client)
+
+        async def run_limited(func, *args):
+            """Run a blocking client call off the event loop within the rate budget."""
+            async def attempt():
+                async with semaphore:
+                    async with self._limiter:
+                        return await asyncio.to_thread(func, *args)
+            # Only rate limits - the shared session already retries server errors
+            # on reads, and a replayed delete that had gone through would 404
+            return await retry_with_backoff(attempt, retry_if=is_rate_limit_error)
+
+        async def delete_with_clients(method: str, gid: str, item_description: str) -> bool:
+            """Try a deletion with each client, within the rate budget."""
+            client = await self._try_delete_with_clients(list(client_order), method, gid,
+                                                          item_description, run_limited, forbidden)
+            promote_client(client)
+            return client is not None
+
+        async def read_with_client(read_func, *args):
+            """Run a blocking read call within the rate budget."""
+            return await run_limited(read_func, *args)
+
+        async def try_batch_delete_with_clients(task_gids: List[str], clients: List[AsanaConnection]):
+            """
+            Batch-delete tasks, handing permission failures to the next client.
+
+            Each client's /batch request goes through the rate budget on its own.
+
+            Returns:
+                Tuple of (number of tasks deleted, first client that deleted any)
+            """
+            remaining = list(task_gids)
+            deleted = 0
+            successful_client = None
+            for client in self._order_clients_by_permission(clients, "delete_task", forbidden):
+                if not remaining:
+                    break
+                results = await run_limited(client.batch_delete_tasks, remaining)
+                client_deleted = sum(1 for r in results if r["ok"])
+                if client_deleted and successful_client is None:
+                    successful_client = client
+                deleted += client_deleted
+                # Only permission failures are worth retrying with another user
+                remaining = [r["gid"] for r in results if r["status_code"] == 403]
+                if remaining:
+                    forbidden[client.user_name].add("delete_task")
+            return deleted, successful_client
+
+        async def batch_delete_tasks(task_gids: List[str], kind: str) -> int:
+            """Delete tasks in /batch chunks concurrently. Returns the number deleted."""
+            chunk_size = AsanaConnection.BATCH_MAX_ACTIONS
+            chunks = [task_gids[i:i + chunk_size] for i in range(0, len(task_gids), chunk_size)]
+
+            async def delete_chunk(chunk: List[str]) -> int:
                 try:
-                    delete_func(client)
-                    return True
+                    deleted, client = await try_batch_delete_with_clients(chunk, list(client_order))
+                    promote_client(client)
+                    return deleted
                 except Exception as e:
-                    error_str = str(e)
-                    # If it's a permission error (403), try next client
-                    if "403" in error_str or "permission" in error_str.lower() or "Forbidden" in error_str:
-                        continue
-                    else:
-                        # For non-permission errors, raise immediately
-                        raise e
-            # If we tried all clients and all failed with permission errors
-            return False
+                    logger.warning(f"      ⚠ Error batch-deleting {len(chunk)} {kind}(s): {e}")
+                    return 0
+
+            results = await asyncio.gather(*(delete_chunk(chunk) for chunk in chunks))
+            deleted = sum(results)
+            if deleted < len(task_gids):
+                logger.warning(f"      ⚠ Could not delete {len(task_gids) - deleted} of {len(task_gids)} {kind}(s)")
+            return deleted
 
-        # Delete each project's tasks, then the project itself
+        async def get_subtasks(client: AsanaConnection, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+            try:
+                return await read_with_client(client.get_task_subtasks, task.get("gid"))
+            except Exception as e:
+                logger.warning(f"      ⚠ Error fetching subtasks for task {task.get('name', 'Unknown Task')}: {e}")
+                return []
+
+        client = all_clients[0]  # Use first client for reading
+
+        async def fetch_project_tasks(project_id: str):
+            """Fetch a project's tasks and, concurrently, every task's subtasks."""
+            tasks = await read_with_client(client.get_project_tasks, project_id)
+            subtask_lists = await asyncio.gather(*(get_subtasks(client, task) for task in tasks))
+            return tasks, subtask_lists
+
+        def prefetch(project_idx: int) -> Optional[asyncio.Task]:
+            if project_idx >= total_projects:
+                return None
+            return asyncio.create_task(fetch_project_tasks(projects[project_idx].get("id")))
+
+        # Delete each project's tasks, then the project itself. The next project's
+        # task and subtask lists are fetched while the current one is being deleted,
+        # so the GET and DELETE phases overlap.
+        next_fetch = prefetch(0)
         for idx, project in enumerate(projects):
             project_id = project.get("id")
             project_name = project.get("name", "Unknown Project")
+            fetch = next_fetch
+            next_fetch = prefetch(idx + 1)
 
             try:
-                print(f"  [{idx+1}/{total_projects}] Processing project: {project_name}")
+                logger.info(f"  [{idx+1}/{total_projects}] Processing project: {project_name}")
 
                 if progress_callback:
                     progress_callback(idx + 1, total_projects,
                                     f"Processing project: {project_name}")
 
-                # Get all tasks in this project (use first client for reading)
-                client = all_clients[0]
                 try:
-                    tasks = client.get_project_tasks(project_id)
-                    print(f"    Found {len(tasks)} task(s) to delete")
-
-                    # Delete each task (and its subtasks)
-                    for task in tasks:
-                        task_id = task.get("gid")
-                        task_name = task.get("name", "Unknown Task")
-
-                        try:
-                            # Get and delete subtasks first
-                            subtasks = client.get_task_subtasks(task_id)
-                            for subtask in subtasks:
-                                subtask_id = subtask.get("gid")
-                                try:
-                                    # Try deletion with each client until one succeeds
-                                    success = try_delete_with_clients(
-                                        lambda c: c.delete_task(subtask_id),
-                                        f"subtask {subtask_id}"
-                                    )
-                                    if success:
-                                        deleted_subtasks += 1
-                                        await asyncio.sleep(0.2)  # Small delay
-                                    else:
-                                        print(f"      ⚠ No client has permission to delete subtask {subtask_id}")
-                                except Exception as e:
-                                    print(f"      ⚠ Error deleting subtask {subtask_id}: {e}")
-
-                            # Delete the parent task
-                            success = try_delete_with_clients(
-                                lambda c: c.delete_task(task_id),
-                                f"task {task_id}"
-                            )
-                            if success:
-                                deleted_tasks += 1
-                                await asyncio.sleep(0.2)  # Small delay
-                            else:
-                                print(f"      ⚠ No client has permission to delete task {task_name}")
-
-                        except Exception as e:
-                            print(f"      ⚠ Error deleting task {task_name}: {e}")
+                    tasks, subtask_lists = await fetch
+                    logger.info(f"    Found {len(tasks)} task(s) to delete")
+
+                    # Delete subtasks before their parents, up to BATCH_MAX_ACTIONS
+                    # per /batch request
+                    subtask_gids = [s.get("gid") for subtasks in subtask_lists for s in subtasks]
+                    if subtask_gids:
+                        deleted_subtasks += await batch_delete_tasks(subtask_gids, "subtask")
+
+                    deleted_tasks += await batch_delete_tasks([t.get("gid") for t in tasks], "task")
 
                 except Exception as e:
-                    print(f"    ⚠ Error fetching tasks for project: {e}")
+                    logger.warning(f"    ⚠ Error fetching tasks for project: {e}")
 
                 # Finally, delete the project - try with each client
-                success = try_delete_with_clients(
-                    lambda c: c.delete_project(project_id),
-                    f"project {project_id}"
-                )
+                success = await delete_with_clients("delete_project", project_id,
+                                                    f"project {project_id}")
                 if success:
                     deleted_projects += 1
-                    print(f"    ✓ Deleted project: {project_name}")
+                    logger.info(f"    ✓ Deleted project: {project_name}")
                 else:
                     raise Exception(f"No client has permission to delete project {project_name}")
 
-                # Delay between projects to avoid rate limits
-                await asyncio.sleep(0.5)
-
             except Exception as e:
-                print(f"    ✗ Error deleting project {project_name}: {e}")
+                logger.error(f"    ✗ Error deleting project {project_name}: {e}")
                 failed_projects.append({
                     "id": project_id,
                     "name": project_name,
                     "error": str(e)
                 })
 
-        # Step 4: Delete portfolios (workspace-level)
-        # Query Asana directly for all portfolios in workspace (don't rely on in-memory cache)
-        print(f"\n  Deleting portfolios...")
-        try:
-            workspace_gid = self.config.get("workspace_gid")
-            client = all_clients[0]  # Use first client for reading
-            portfolios = client.get_workspace_portfolios(workspace_gid)
-            print(f"    Found {len(portfolios)} portfolio(s) in workspace")
-
-            for portfolio in portfolios:
-                portfolio_gid = portfolio.get("gid")
-                portfolio_name = portfolio.get("name", "Unknown Portfolio")
-                try:
-                    success = try_delete_with_clients(
-                        lambda c: c.delete_portfolio(portfolio_gid),
-                        f"portfolio {portfolio_name}"
-                    )
-                    if success:
-                        deleted_portfolios += 1
-                        print(f"    ✓ Deleted portfolio: {portfolio_name}")
-                    else:
-                        print(f"    ⚠ No client has permission to delete portfolio '{portfolio_name}'")
-                    await asyncio.sleep(0.2)
-                except Exception as e:
-                    print(f"    ⚠ Error deleting portfolio '{portfolio_name}': {e}")
-        except Exception as e:
-            print(f"    ⚠ Error fetching portfolios from workspace: {e}")
+        async def delete_workspace_object(delete_method: str, kind: str, obj: Dict[str, Any]) -> bool:
+            """Delete one workspace-level object (portfolio, custom field or tag)."""
+            gid = obj.get("gid")
+            name = obj.get("name", f"Unknown {kind.title()}")
+            try:
+                success = await delete_with_clients(delete_method, gid, f"{kind} {name}")
+                if success:
+                    logger.info(f"    ✓ Deleted {kind}: {name}")
+                else:
+                    logger.warning(f"    ⚠ No client has permission to delete {kind} '{name}'")
+                return success
+            except Exception as e:
+                logger.warning(f"    ⚠ Error deleting {kind} '{name}': {e}")
+                return False
 
-        # Step 5: Delete custom fields (workspace-level)
-        # Query Asana directly for all custom fields in workspace (don't rely on in-memory cache)
-        print(f"\n  Deleting custom fields...")
-        try:
-            workspace_gid = self.config.get("workspace_gid")
-            client = all_clients[0]  # Use first client for reading
-            custom_fields = client.get_workspace_custom_fields(workspace_gid)
-            print(f"    Found {len(custom_fields)} custom field(s) in workspace")
-
-            for field in custom_fields:
-                field_gid = field.get("gid")
-                field_name = field.get("name", "Unknown Field")
-                try:
-                    success = try_delete_with_clients(
-                        lambda c: c.delete_custom_field(field_gid),
-                        f"custom field {field_name}"
-                    )
-                    if success:
-                        deleted_custom_fields += 1
-                        print(f"    ✓ Deleted custom field: {field_name}")
-                    else:
-                        print(f"    ⚠ No client has permission to delete custom field '{field_name}'")
-                    await asyncio.sleep(0.2)
-                except Exception as e:
-                    print(f"    ⚠ Error deleting custom field '{field_name}': {e}")
-        except Exception as e:
-            print(f"    ⚠ Error fetching custom fields from workspace: {e}")
+        workspace_gid = self.config.get("workspace_gid")
 
-        # Step 6: Delete tags (workspace-level)
-        # Query Asana directly for all tags in workspace (don't rely on in-memory cache)
-        print(f"\n  Deleting tags...")
-        try:
-            workspace_gid = self.config.get("workspace_gid")
-            client = all_clients[0]  # Use first client for reading
-            tags = client.get_workspace_tags(workspace_gid)
-            print(f"    Found {len(tags)} tag(s) in workspace")
-
-            for tag in tags:
-                tag_gid = tag.get("gid")
-                tag_name = tag.get("name", "Unknown Tag")
-                try:
-                    success = try_delete_with_clients(
-                        lambda c: c.delete_tag(tag_gid),
-                        f"tag {tag_name}"
-                    )
-                    if success:
-                        deleted_tags += 1
-                        print(f"    ✓ Deleted tag: {tag_name}")
-                    else:
-                        print(f"    ⚠ No client has permission to delete tag '{tag_name}'")
-                    await asyncio.sleep(0.2)
-                except Exception as e:
-                    print(f"    ⚠ Error deleting tag '{tag_name}': {e}")
-        except Exception as e:
-            print(f"    ⚠ Error fetching tags from workspace: {e}")
-
-        print(f"\n{'='*60}")
-        print(f"Cleanup Summary:")
-        print(f"  Total projects: {total_projects}")
-        print(f"  Deleted projects: {deleted_projects}")
-        print(f"  Deleted tasks: {deleted_tasks}")
-        print(f"  Deleted subtasks: {deleted_subtasks}")
-        print(f"  Deleted portfolios: {deleted_portfolios}")
-        print(f"  Deleted custom fields: {deleted_custom_fields}")
-        print(f"  Deleted tags: {deleted_tags}")
-        print(f"  Failed: {len(failed_projects)}")
-        print(f"{'='*60}\n")
+        stats = self.state.get("stats", {})
+
+        async def cleanup_workspace_objects(list_method: str, delete_method: str, kind: str,
+                                            created_stat: str) -> int:
+            """Fetch every object of one workspace-level type and delete them. Returns the count deleted."""
+            # Nothing to delete if this job never created one. Older job files
+            # without the counter still get the full workspace scan.
+            if stats.get(created_stat) == 0:
+                logger.info(f"\n  No {kind}s created by this job - skipping")
+                return 0
+
+            # Query Asana directly (don't rely on in-memory cache)
+            logger.info(f"\n  Deleting {kind}s...")
+            try:
+                objects = await read_with_client(getattr(client, list_method), workspace_gid)
+                logger.info(f"    Found {len(objects)} {kind}(s) in workspace")
+
+                results = await asyncio.gather(*(
+                    delete_workspace_object(delete_method, kind, obj) for obj in objects
+                ))
+                return sum(results)
+            except Exception as e:
+                logger.warning(f"    ⚠ Error fetching {kind}s from workspace: {e}")
+                return 0
+
+        # Steps 4-6: Delete portfolios, custom fields and tags (workspace-level).
+        # They are disjoint object types, so the three phases run concurrently.
+        deleted_portfolios, deleted_custom_fields, deleted_tags = await asyncio.gather(
+            cleanup_workspace_objects("get_workspace_portfolios", "delete_portfolio", "portfolio",
+                                      "portfolios_created"),
+            cleanup_workspace_objects("get_workspace_custom_fields", "delete_custom_field", "custom field",
+                                      "custom_fields_created"),
+            cleanup_workspace_objects("get_workspace_tags", "delete_tag", "tag", "tags_created")
+        )
+
+        # One record, so the summary is written as a block and cannot interleave
+        # with other services' output
+        logger.info("\n".join([
+            f"\n{'='*60}",
+            "Cleanup Summary:",
+            f"  Total projects: {total_projects}",
+            f"  Deleted projects: {deleted_projects}",
+            f"  Deleted tasks: {deleted_tasks}",
+            f"  Deleted subtasks: {deleted_subtasks}",
+            f"  Deleted portfolios: {deleted_portfolios}",
+            f"  Deleted custom fields: {deleted_custom_fields}",
+            f"  Deleted tags: {deleted_tags}",
+            f"  Failed: {len(failed_projects)}",
+            f"{'='*60}\n"
+        ]))
+        await asyncio.to_thread(flush_logs)
 
         return {
             "success": len(failed_projects) == 0,
@@ -1933,8 +2161,14 @@ class AsanaService(BaseService):
     def pause(self):
         """Pause the service."""
         self.paused = True
+        self._flush_state_ops()
         self.state_manager.update_job_status(self.job_id, "paused")
-        print(f"Service paused for job {self.job_id}")
+        logger.info(f"Service paused for job {self.job_id}")
+
+    def stop(self):
+        """Stop the service (pause activity but keep it resumable)."""
+        self._flush_state_ops()
+        super().stop()
 
     def resume(self):
         """Resume the service."""
@@ -1952,12 +2186,12 @@ class AsanaService(BaseService):
 
             if current_time > next_activity_time:
                 # Scheduled time is in the past, recalculate based on current time
-                print(f"Scheduled activity time was in the past, recalculating...")
+                logger.info(f"Scheduled activity time was in the past, recalculating...")
                 new_next_time = self.scheduler.get_next_activity_time(current_time)
                 self.state_manager.update_next_activity_time(self.job_id, new_next_time.isoformat())
-                print(f"New next activity time: {new_next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
+                logger.info(f"New next activity time: {new_next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
 
-        print(f"Service resumed for job {self.job_id}")
+        logger.info(f"Service resumed for job {self.job_id}")
 
     # Backwards compatibility alias
     async def cleanup_asana_data(self, progress_callback=None):
@@ -1982,6 +2216,9 @@ if __name__ == "__main__":
     print("Continuous Asana Data Generator")
     print("=" * 60)
 
+    # Route service log output through the shared background log writer
+    configure_buffered_logging()
+
     # This would normally be loaded from config
     config = {
         "industry": "healthcare",
@@ -2013,6 +2250,13 @@ if __name__ == "__main__":
     # Create and run service
     service = AsanaService(config, state_manager, llm_generator, client_pool)
 
+    # Use uvloop's libuv-based event loop when it is installed (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run async
     try:
         asyncio.run(service.run())
@@ -5,14 +5,18 @@ Provides abstraction for different platform types (Asana, Okta, etc.).
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 import asyncio
+import logging
 
 from continuous.state_manager import StateManager
 from continuous.llm_generator import LLMGenerator
 from continuous.scheduler import ActivityScheduler
 from continuous.connections.base_connection import BaseClientPool
 
+logger = logging.getLogger(__name__)
+
 
 class BaseService(ABC):
     """
@@ -20,6 +24,10 @@ class BaseService(ABC):
     All service implementations must inherit from this class.
     """
 
+    # Parsed job start time, cached per started_at string (see _get_started_at)
+    _started_at: Optional[datetime] = None
+    _started_at_source: Optional[str] = None
+
     def __init__(self, config: Dict[str, Any], state_manager: StateManager,
                  llm_generator: LLMGenerator, client_pool: BaseClientPool):
         """
@@ -40,12 +48,13 @@ class BaseService(ABC):
         # Create job state
         self.job_id = state_manager.create_new_job(config)
         self.state = state_manager.load_state(self.job_id)
+        self._get_started_at()
 
         self.running = False
         self.paused = False
         self.deleted = False  # Flag to prevent state saves after deletion
 
-        print(f"✓ Service initialized - Job ID: {self.job_id}")
+        logger.info(f"✓ Service initialized - Job ID: {self.job_id}")
 
     @abstractmethod
     async def run(self):
@@ -108,23 +117,35 @@ class BaseService(ABC):
             return True
 
         # Check duration
-        from datetime import datetime, timezone
-        started_at = datetime.fromisoformat(self.state["started_at"])
         duration_days = self.config.get("duration_days", 30)
-        elapsed_days = (datetime.now(timezone.utc) - started_at).days
+        elapsed_days = (datetime.now(timezone.utc) - self._get_started_at()).days
 
         return elapsed_days < duration_days
 
+    def _get_started_at(self) -> datetime:
+        """
+        Get the job start time, parsing state["started_at"] only when it changes.
+
+        Returns:
+            Timezone-aware start time
+        """
+        started_at_str = self.state["started_at"]
+        if started_at_str != self._started_at_source:
+            started_at = datetime.fromisoformat(started_at_str)
+            if started_at.tzinfo is None:
+                started_at = started_at.replace(tzinfo=timezone.utc)
+            self._started_at = started_at
+            self._started_at_source = started_at_str
+        return self._started_at
+
     def pause(self):
         """Pause the service."""
         self.paused = True
         self.state_manager.update_job_status(self.job_id, "paused")
-        print(f"Service paused for job {self.job_id}")
+        logger.info(f"Service paused for job {self.job_id}")
 
     def resume(self):
         """Resume the service."""
-        from datetime import datetime, timezone
-
         self.paused = False
         self.state_manager.update_job_status(self.job_id, "running")
 
@@ -139,15 +160,15 @@ class BaseService(ABC):
 
             if current_time > next_activity_time:
                 # Scheduled time is in the past, recalculate based on current time
-                print(f"Scheduled activity time was in the past, recalculating...")
+                logger.info(f"Scheduled activity time was in the past, recalculating...")
                 new_next_time = self.scheduler.get_next_activity_time(current_time)
                 self.state_manager.update_next_activity_time(self.job_id, new_next_time.isoformat())
-                print(f"New next activity time: {new_next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
+                logger.info(f"New next activity time: {new_next_time.strftime('%Y-%m-%d %I:%M %p %Z')}")
 
-        print(f"Service resumed for job {self.job_id}")
+        logger.info(f"Service resumed for job {self.job_id}")
 
     def stop(self):
         """Stop the service (pause activity but keep it resumable)."""
         self.paused = True
         self.state_manager.update_job_status(self.job_id, "stopped")
-        print(f"Service stopped (paused) for job {self.job_id}")
+        logger.info(f"Service stopped (paused) for job {self.job_id}")
@@ -10,11 +10,17 @@ Simulates realistic organizational activity including:
 """
 
 import asyncio
+import atexit
+import functools
+import logging
 import random
 import string
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from continuous.services.base_service import BaseService
 from continuous.llm_generator import LLMGenerator
@@ -38,6 +44,11 @@ from continuous.templates.okta_templates import (
     calculate_user_distribution,
     generate_sample_user_profile
 )
+from continuous.buffered_logging import flush_logs
+from continuous.indexed_set import IndexedSet
+from continuous.rate_limiter import AsyncRateLimiter, is_rate_limit_error, retry_with_backoff
+
+logger = logging.getLogger(__name__)
 
 
 class OktaActivityType:
@@ -66,6 +77,106 @@ class OktaService(BaseService):
     group management, and application provisioning.
     """
 
+    # Default cap on Okta requests in flight at once (config key: concurrent_requests)
+    DEFAULT_CONCURRENT_REQUESTS = 20
+
+    # Sustained Okta request rate during cleanup (token bucket, burst of the
+    # same size) - Okta's default user/group write limits are 600 per minute
+    CLEANUP_REQUESTS_PER_SECOND = 10
+
+    # Group types that are never deleted, and the member count a group must stay
+    # under to be deleted by an activity
+    PROTECTED_GROUP_TYPES = ("department", "all_employees")
+    DELETABLE_GROUP_MAX_MEMBERS = 3
+
+    # Worker threads for blocking Okta client calls (see _call)
+    API_WORKERS = 32
+
+    # Minimum seconds between writes of the org data to the job file
+    STATE_SAVE_INTERVAL = 120
+
+    # Seconds to pause when a rate limit response doesn't say when it resets
+    RATE_LIMIT_PAUSE = 3600
+
+    # Most recent activities kept in the job's activity_log
+    ACTIVITY_LOG_LIMIT = 1000
+
+    # State keys this service changes in memory; everything else in the job file
+    # (status, schedule, errors, usage) is written directly by the state manager
+    ORG_STATE_KEYS = ("users", "groups", "app_assignments", "activity_log")
+
+    # Profile fields unique to one person. The rest of an LLM-generated profile
+    # (manager, location, division, ...) is reused for later hires with the
+    # same department and title.
+    PROFILE_IDENTITY_FIELDS = frozenset((
+        "firstName", "lastName", "email", "login", "mobilePhone", "employeeNumber", "startDate"
+    ))
+
+    # Names drawn by _generate_first_name / _generate_last_name
+    FIRST_NAMES = (
+        "John", "Jane", "Michael", "Sarah", "David", "Emily", "Robert", "Lisa",
+        "James", "Mary", "William", "Patricia", "Richard", "Jennifer", "Thomas",
+        "Linda", "Charles", "Elizabeth", "Joseph", "Barbara", "Christopher", "Susan",
+        "Daniel", "Jessica", "Matthew", "Karen", "Anthony", "Nancy", "Mark", "Betty",
+        "Paul", "Dorothy", "Steven", "Sandra", "Andrew", "Ashley", "Kenneth", "Kimberly",
+        "Joshua", "Donna", "Kevin", "Michelle", "Brian", "Carol", "George", "Amanda"
+    )
+    LAST_NAMES = (
+        "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+        "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+        "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+        "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker",
+        "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill",
+        "Flores", "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell"
+    )
+
+    # Job titles offered for each department by _generate_job_title
+    JOB_TITLES_BY_DEPARTMENT = {
+        "Engineering": (
+            "Software Engineer", "Senior Software Engineer", "Staff Engineer",
+            "Engineering Manager", "DevOps Engineer", "QA Engineer", "Data Engineer"
+        ),
+        "Sales": (
+            "Sales Representative", "Account Executive", "Sales Manager",
+            "Business Development Representative", "Account Manager", "Sales Director"
+        ),
+        "Marketing": (
+            "Marketing Manager", "Content Marketing Specialist", "SEO Specialist",
+            "Marketing Director", "Brand Manager", "Product Marketing Manager"
+        ),
+        "Product": (
+            "Product Manager", "Senior Product Manager", "Product Designer",
+            "UX Designer", "Product Owner", "Product Director"
+        ),
+        "Finance": (
+            "Accountant", "Financial Analyst", "Controller", "CFO",
+            "Accounts Payable Specialist", "Financial Manager", "Bookkeeper"
+        ),
+        "HR": (
+            "HR Manager", "Recruiter", "HR Business Partner", "HR Director",
+            "Talent Acquisition Specialist", "HR Coordinator", "People Operations Manager"
+        ),
+        "IT": (
+            "IT Support Specialist", "System Administrator", "Network Engineer",
+            "IT Manager", "Security Engineer", "Database Administrator", "IT Director"
+        ),
+        "Operations": (
+            "Operations Manager", "Operations Analyst", "Supply Chain Manager",
+            "Operations Director", "Business Analyst", "Process Improvement Specialist"
+        ),
+        "Customer Success": (
+            "Customer Success Manager", "Support Specialist", "Customer Success Director",
+            "Technical Support Engineer", "Account Manager", "Implementation Specialist"
+        ),
+        "Legal": (
+            "Legal Counsel", "Contract Manager", "Compliance Officer",
+            "Paralegal", "Legal Director", "Corporate Attorney"
+        )
+    }
+
+    # Titles for departments missing from JOB_TITLES_BY_DEPARTMENT
+    DEFAULT_JOB_TITLES = ("Specialist", "Manager", "Analyst", "Coordinator", "Associate", "Director")
+
     def __init__(self, config: Dict[str, Any], state_manager: StateManager,
                  llm_generator: Optional[LLMGenerator] = None,
                  client_pool: Optional[OktaClientPool] = None):
@@ -98,6 +209,15 @@ class OktaService(BaseService):
         self.industry_config = get_industry_config(self.industry)
         self.org_config = get_org_size_config(self.org_size)
 
+        # Per-service generator for every random draw; set random_seed in the
+        # config to replay the same sequence of choices
+        self._rng = random.Random(config.get("random_seed"))
+
+        # Industry lookups used on every user and group creation, resolved once
+        self._departments = tuple(get_departments_for_industry(self.industry))
+        self._locations = tuple(self.org_config.get("locations", ["Remote"]))
+        self._department_apps = self._get_department_apps()
+
         # Cache for Okta objects
         self.app_catalog = {}  # {app_name: app_id} - Maps app names to Okta app IDs
         self.managers = []  # List of manager user IDs
@@ -105,9 +225,92 @@ class OktaService(BaseService):
         # Activity weights for different operations
         self.activity_weights = self._calculate_activity_weights()
 
-        print(f"✓ Okta service initialized - Job ID: {self.job_id}")
-        print(f"  Industry: {self.industry}, Org Size: {self.org_size}")
-        print(f"  Initial Users: {self.initial_users}")
+        # Cumulative weight tables for _select_activity_type, keyed by which
+        # state-dependent activities are currently allowed
+        self._activity_tables: Dict[Tuple[bool, bool, bool], Tuple[List[str], List[int]]] = {}
+
+        # User IDs per status, built lazily and then kept current by
+        # _track_status_change
+        self._user_ids_by_status: Optional[Dict[str, IndexedSet[str]]] = None
+
+        # Active users with a group to lose / an app to give up, built lazily
+        # and kept current by _index_user_memberships
+        self._multi_group_user_ids: Optional[IndexedSet[str]] = None
+        self._multi_app_user_ids: Optional[IndexedSet[str]] = None
+
+        # Active users still missing an app from app_catalog, built lazily by
+        # _users_missing_apps and kept current by _index_user_memberships
+        self._missing_app_user_ids: Optional[IndexedSet[str]] = None
+        self._catalog_app_ids: frozenset = frozenset()
+
+        # Group IDs keyed by (group type, department/role name), built lazily by
+        # _find_group_id and updated in place as groups are created or deleted
+        self._group_index: Optional[Dict[Tuple[str, Optional[str]], str]] = None
+
+        # Groups _handle_delete_group may pick, built lazily by _deletable_groups
+        # and kept current as groups and memberships change
+        self._deletable_group_ids: Optional[IndexedSet[str]] = None
+
+        # Org data changed since the last save (activities no longer save individually)
+        self._state_dirty = False
+        self._last_save = time.monotonic()
+
+        # Serializes org data writes between the run loop and the exit hook
+        self._save_lock = threading.Lock()
+
+        # Bounds concurrent Okta requests when setup work is fanned out with gather
+        self._request_semaphore = asyncio.Semaphore(
+            config.get("concurrent_requests", self.DEFAULT_CONCURRENT_REQUESTS)
+        )
+
+        # ISO timestamp shared by every state change within the same second
+        self._now_iso_second = -1
+        self._now_iso_value = ""
+
+        # LLM profile details (minus PROFILE_IDENTITY_FIELDS) and email domain
+        # keyed by (department, title), so repeat hires skip the model call
+        self._profile_templates: Dict[Tuple[str, str], Tuple[Dict[str, Any], str]] = {}
+
+        # Paces cleanup requests to Okta's per-endpoint budget
+        self._limiter = AsyncRateLimiter(max_rate=self.CLEANUP_REQUESTS_PER_SECOND, time_period=1)
+
+        # Dedicated threads for Okta client calls, sized for the request cap
+        # instead of sharing the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.API_WORKERS, thread_name_prefix="okta"
+        )
+
+        logger.info(f"✓ Okta service initialized - Job ID: {self.job_id}")
+        logger.info(f"  Industry: {self.industry}, Org Size: {self.org_size}")
+        logger.info(f"  Initial Users: {self.initial_users}")
+
+    async def _call(self, fn, *args, **kwargs):
+        """
+        Run a blocking Okta client call on the service's executor.
+
+        Args:
+            fn: Client method to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Whatever fn returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def _now_iso(self) -> str:
+        """
+        Get the current UTC time as an ISO string, formatted at most once per second.
+
+        Returns:
+            ISO 8601 timestamp
+        """
+        second = time.monotonic_ns() // 1_000_000_000
+        if second != self._now_iso_second:
+            self._now_iso_second = second
+            self._now_iso_value = datetime.now(timezone.utc).isoformat()
+        return self._now_iso_value
 
     def _calculate_activity_weights(self) -> Dict[str, int]:
         """
@@ -147,25 +350,51 @@ class OktaService(BaseService):
 
     async def run(self):
         """Main loop - runs continuously until stopped."""
+        # Services run in daemon threads, so an API server shutdown never reaches
+        # the loop's exit path - save unsaved org data from an exit hook instead.
+        # The hook stays registered if the loop dies with an exception, since
+        # nothing else saves in that case.
+        atexit.register(self._save_on_exit)
+        try:
+            await self._run_generation()
+        finally:
+            # The service isn't run again, so release its client call threads
+            self._executor.shutdown(wait=False)
+        atexit.unregister(self._save_on_exit)
+
+    async def _run_generation(self):
+        """Set up the org if needed, then generate activity until stopped or deleted."""
         self.running = True
 
+        # Start new tasks eagerly, so gathered coroutines that finish without
+        # suspending skip a trip through the scheduler (Python 3.12+)
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
         # Check if we need initial setup
         initial_generation = len(self.state.get("groups", {})) == 0
 
         if initial_generation:
-            self.state_manager.update_job_status(self.job_id, "initializing")
-            print(f"Initializing Okta organization for {self.industry}...")
+            # Setup creates objects before its final save - an exit hook firing
+            # part way through must still write them
+            self._state_dirty = True
+            await asyncio.to_thread(self.state_manager.update_job_status, self.job_id, "initializing")
+            logger.info(f"Initializing Okta organization for {self.industry}...")
             await self._plan_initialization()
             await self._initialize_organization()
             # Clear the plan after initialization completes
             if "initialization_plan" in self.state:
                 del self.state["initialization_plan"]
-                self.state_manager.save_state(self.job_id, self.state)
-            self.state_manager.update_job_status(self.job_id, "running")
-            print("✓ Initial organization setup complete")
+                await asyncio.to_thread(self.state_manager.save_state, self.job_id, self.state)
+            await asyncio.to_thread(self.state_manager.update_job_status, self.job_id, "running")
+            logger.info("✓ Initial organization setup complete")
+            await asyncio.to_thread(flush_logs)
         else:
-            self.state_manager.update_job_status(self.job_id, "running")
-            print("Resuming Okta activity generation...")
+            await asyncio.to_thread(self.state_manager.update_job_status, self.job_id, "running")
+            logger.info("Resuming Okta activity generation...")
+
+        # Set by the state manager when the job is stopped or marked for deletion
+        status_changed = self.state_manager.status_changed_event(self.job_id)
 
         # Main activity loop
         while self.running and self._should_continue():
@@ -174,21 +403,29 @@ class OktaService(BaseService):
                     await asyncio.sleep(60)
                     continue
 
-                # Check for deletion marker
-                if not self.deleted:
-                    disk_state = self.state_manager.load_state(self.job_id)
+                # Check for deletion marker - the job file is only re-read
+                # after its status has changed
+                if not self.deleted and status_changed.is_set():
+                    status_changed.clear()
+                    disk_state = await asyncio.to_thread(self.state_manager.load_state, self.job_id)
                     if disk_state is None or disk_state.get("_deleting"):
-                        print(f"[Job {self.job_id}] Deletion marker detected - exiting")
+                        logger.info(f"[Job {self.job_id}] Deletion marker detected - exiting")
                         self.running = False
                         self.deleted = True
+                        await asyncio.to_thread(flush_logs)
                         return
 
                     if disk_state.get("status") == "stopped":
-                        print(f"[Job {self.job_id}] Job stopped - exiting")
+                        logger.info(f"[Job {self.job_id}] Job stopped - exiting")
                         self.running = False
+                        await self._save_org_state()
+                        await asyncio.to_thread(flush_logs)
                         return
 
-                    self.state = disk_state
+                    self._merge_disk_state(disk_state)
+
+                if not self.deleted and time.monotonic() - self._last_save >= self.STATE_SAVE_INTERVAL:
+                    await self._save_org_state()
 
                 # Check if it's time for activity
                 current_time = datetime.now(timezone.utc)
@@ -198,30 +435,96 @@ class OktaService(BaseService):
 
                     # Update next activity time
                     next_time = self.scheduler.get_next_activity_time(current_time)
-                    self.state_manager.update_next_activity_time(self.job_id, next_time.isoformat())
+                    self.state["next_activity_time"] = next_time.isoformat()
+                    await asyncio.to_thread(
+                        self.state_manager.update_next_activity_time, self.job_id, next_time.isoformat()
+                    )
                 else:
                     # Update next activity time if not set
                     if not self.state.get("next_activity_time"):
                         next_time = self.scheduler.get_next_activity_time(current_time)
-                        self.state_manager.update_next_activity_time(self.job_id, next_time.isoformat())
+                        self.state["next_activity_time"] = next_time.isoformat()
+                        await asyncio.to_thread(
+                            self.state_manager.update_next_activity_time, self.job_id, next_time.isoformat()
+                        )
 
                 # Sleep before next check
-                await asyncio.sleep(random.randint(30, 90))
+                await asyncio.sleep(self._rng.randint(30, 90))
 
             except OktaRateLimitError as e:
-                print(f"⚠ Rate limit hit: {e}")
-                self.state_manager.log_error(self.job_id, "rate_limit", str(e))
-                # Pause for an hour
-                await asyncio.sleep(3600)
+                logger.warning(f"⚠ Rate limit hit: {e}")
+                await asyncio.to_thread(self.state_manager.log_error, self.job_id, "rate_limit", str(e))
+                await self._save_org_state()
+                # Wait until Okta's rate limit window resets
+                await asyncio.sleep(e.retry_after or self.RATE_LIMIT_PAUSE)
 
             except Exception as e:
-                print(f"✗ Error in main loop: {e}")
-                self.state_manager.log_error(self.job_id, "general", str(e))
+                logger.error(f"✗ Error in main loop: {e}")
+                await asyncio.to_thread(self.state_manager.log_error, self.job_id, "general", str(e))
                 await asyncio.sleep(300)  # 5 minutes before retry
 
         # Clean shutdown
-        self.state_manager.update_job_status(self.job_id, "stopped")
-        print(f"Okta generation stopped for job {self.job_id}")
+        await self._save_org_state()
+        await asyncio.to_thread(self.state_manager.update_job_status, self.job_id, "stopped")
+        logger.info(f"Okta generation stopped for job {self.job_id}")
+        await asyncio.to_thread(flush_logs)
+
+    def _merge_disk_state(self, disk_state: Dict[str, Any]):
+        """
+        Take the fields other parties write from a freshly loaded job file.
+
+        Only this service changes the org data, so the in-memory copy (and the
+        indexes built over it) is kept and just the other top-level fields are
+        updated, instead of swapping in the whole loaded object.
+
+        Args:
+            disk_state: State loaded from the job file
+        """
+        for key, value in disk_state.items():
+            if key not in self.ORG_STATE_KEYS:
+                self.state[key] = value
+
+    async def _save_org_state(self):
+        """
+        Write unsaved org data to the job file.
+
+        The write runs in a worker thread so the event loop keeps serving other
+        coroutines; nothing else mutates self.state while it is awaited.
+        """
+        await asyncio.to_thread(self._write_org_state)
+
+    def _write_org_state(self):
+        """
+        Write unsaved org data to the job file, blocking until done.
+
+        The file is re-read first so status, schedule and error fields written by
+        other parties are kept, and nothing is written once the job is being deleted.
+        """
+        with self._save_lock:
+            if self.deleted or not self._state_dirty:
+                return
+
+            disk_state = self.state_manager.load_state(self.job_id)
+            if disk_state is None or disk_state.get("_deleting"):
+                return
+
+            self._merge_disk_state(disk_state)
+            self.state_manager.save_state(self.job_id, self.state)
+
+            self._state_dirty = False
+            self._last_save = time.monotonic()
+
+    def _save_on_exit(self):
+        """
+        Final save when the interpreter exits while the run loop is still going.
+
+        Without it, users, groups and assignments created since the last periodic
+        save exist in Okta but not in the job file, so cleanup could not find them.
+        """
+        try:
+            self._write_org_state()
+        except Exception as e:
+            logger.error(f"✗ Error saving state on exit for job {self.job_id}: {e}")
 
     async def _plan_initialization(self):
         """
@@ -236,7 +539,7 @@ class OktaService(BaseService):
         num_users = self.initial_users
 
         # Determine number of groups
-        departments = get_departments_for_industry(self.industry)
+        departments = self._departments
         num_groups = 1  # "All Employees" group
         num_groups += len(departments)  # Department groups
 
@@ -276,28 +579,32 @@ class OktaService(BaseService):
             "completed_users": 0,
             "completed_group_assignments": 0,
             "completed_app_assignments": 0,
-            "start_time": datetime.now(timezone.utc).isoformat(),
+            "start_time": self._now_iso(),
             "estimated_duration_seconds": int(estimated_duration)
         }
 
-        self.state_manager.save_state(self.job_id, self.state)
-
-        print(f"\n{'='*60}")
-        print(f"INITIALIZATION PLAN")
-        print(f"{'='*60}")
-        print(f"  Groups: {num_groups}")
-        print(f"  Users: {num_users}")
-        print(f"  Group Assignments: {total_group_assignments}")
-        print(f"  App Assignments: {total_app_assignments}")
-        print(f"  Estimated duration: {int(estimated_duration)}s")
-        print(f"{'='*60}\n")
+        await asyncio.to_thread(self.state_manager.save_state, self.job_id, self.state)
+
+        # One record, so the plan is written as a block and cannot interleave
+        # with other services' output
+        logger.info("\n".join([
+            f"\n{'='*60}",
+            "INITIALIZATION PLAN",
+            f"{'='*60}",
+            f"  Groups: {num_groups}",
+            f"  Users: {num_users}",
+            f"  Group Assignments: {total_group_assignments}",
+            f"  App Assignments: {total_app_assignments}",
+            f"  Estimated duration: {int(estimated_duration)}s",
+            f"{'='*60}\n"
+        ]))
 
     async def _initialize_organization(self):
         """
         Initialize organization with groups, users, and app assignments.
         Creates the foundational structure for ongoing activity generation.
         """
-        print("Setting up organizational structure...")
+        logger.info("Setting up organizational structure...")
 
         # Initialize state structure if needed
         if "groups" not in self.state:
@@ -325,54 +632,32 @@ class OktaService(BaseService):
         await self._assign_initial_apps()
 
         # Save state
-        self.state_manager.save_state(self.job_id, self.state)
+        await asyncio.to_thread(self.state_manager.save_state, self.job_id, self.state)
 
-        print(f"✓ Created {len(self.state['groups'])} groups")
-        print(f"✓ Created {len(self.state['users'])} users")
-        print(f"✓ Created {len(self.state['app_assignments'])} app assignments")
+        logger.info(f"✓ Created {len(self.state['groups'])} groups")
+        logger.info(f"✓ Created {len(self.state['users'])} users")
+        logger.info(f"✓ Created {len(self.state['app_assignments'])} app assignments")
 
     async def _create_organizational_groups(self):
         """Create department, team, and role-based groups."""
-        client = self.client_pool.get_random_client()
-
         # Get departments from template
-        departments = get_departments_for_industry(self.industry)
+        departments = self._departments
 
-        # Create "All Employees" group
-        try:
-            all_employees = await asyncio.to_thread(
-                client.create_group,
-                name="All Employees",
-                description="All employees in the organization"
-            )
-            if all_employees:
-                self.state["groups"][all_employees["id"]] = {
-                    "id": all_employees["id"],
-                    "name": "All Employees",
-                    "type": "all_employees",
-                    "description": all_employees.get("description"),
-                    "member_count": 0,
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "created_by": client.user_name
-                }
-                # Update initialization plan if it exists
-                if "initialization_plan" in self.state:
-                    self.state["initialization_plan"]["completed_groups"] += 1
-                print(f"  Created group: All Employees")
-        except Exception as e:
-            print(f"  Error creating All Employees group: {e}")
+        # One creation timestamp for the whole batch of groups
+        now_iso = self._now_iso()
 
-        # Create department groups
-        for dept in departments:
+        async def department_spec(dept: str) -> Optional[Tuple[str, str, str, Optional[str]]]:
             try:
                 # Use LLM to generate better group descriptions if available
-                if self.llm_generator:
-                    group_name = self.llm_generator.generate_group_name(
+                if self.llm:
+                    group_name = await asyncio.to_thread(
+                        self.llm.generate_group_name,
                         industry=self.industry,
                         department=dept,
                         group_type="department"
                     )
-                    description = self.llm_generator.generate_group_description(
+                    description = await asyncio.to_thread(
+                        self.llm.generate_group_description,
                         industry=self.industry,
                         group_name=group_name,
                         group_type="department"
@@ -380,241 +665,382 @@ class OktaService(BaseService):
                 else:
                     group_name = f"{dept} Department"
                     description = f"Members of the {dept} department"
+                return group_name, description, "department", dept
+            except Exception as e:
+                # Skip this department rather than abort setup
+                logger.info(f"  Error creating {dept} group: {e}")
+                return None
 
-                group = await asyncio.to_thread(
-                    client.create_group,
-                    name=group_name,
-                    description=description
-                )
+        # (name, description, type, department) for every group to create
+        specs = [("All Employees", "All employees in the organization", "all_employees", None)]
+        department_specs = await asyncio.gather(*(department_spec(dept) for dept in departments))
+        specs.extend(spec for spec in department_specs if spec)
+
+        # Create role-based groups if org size supports it
+        if self.org_config.get("has_complex_hierarchy"):
+            role_groups = ["Managers", "Senior Engineers", "Directors", "Contractors"]
+            specs.extend((role, f"All {role.lower()} in the organization", "role", None)
+                         for role in role_groups)
+
+        async def create_one_group(group_name: str, description: str, group_type: str,
+                                   dept: Optional[str]):
+            label = dept or group_name
+            try:
+                client = self.client_pool.get_next_client()
+                async with self._request_semaphore:
+                    group = await self._call(
+                        client.create_group,
+                        name=group_name,
+                        description=description
+                    )
                 if group:
-                    self.state["groups"][group["id"]] = {
+                    group_data = {
                         "id": group["id"],
                         "name": group_name,
-                        "type": "department",
-                        "department": dept,
+                        "type": group_type,
                         "description": group.get("description"),
                         "member_count": 0,
-                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "created_at": now_iso,
                         "created_by": client.user_name
                     }
+                    if dept:
+                        group_data["department"] = dept
+                    self.state["groups"][group["id"]] = group_data
+                    self._index_group(group["id"], group_data)
+
                     # Update initialization plan if it exists
                     if "initialization_plan" in self.state:
                         self.state["initialization_plan"]["completed_groups"] += 1
-                    print(f"  Created department group: {dept}")
 
-                await asyncio.sleep(0.5)  # Rate limit protection
+                    if group_type == "department":
+                        logger.info(f"  Created department group: {label}")
+                    elif group_type == "role":
+                        logger.info(f"  Created role group: {label}")
+                    else:
+                        logger.info(f"  Created group: {label}")
             except Exception as e:
-                print(f"  Error creating {dept} group: {e}")
+                logger.info(f"  Error creating {label} group: {e}")
 
-        # Create role-based groups if org size supports it
-        if self.org_config.get("has_complex_hierarchy"):
-            role_groups = ["Managers", "Senior Engineers", "Directors", "Contractors"]
-            for role in role_groups:
-                try:
-                    group = await asyncio.to_thread(
-                        client.create_group,
-                        name=role,
-                        description=f"All {role.lower()} in the organization"
-                    )
-                    if group:
-                        self.state["groups"][group["id"]] = {
-                            "id": group["id"],
-                            "name": role,
-                            "type": "role",
-                            "description": group.get("description"),
-                            "member_count": 0,
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                            "created_by": client.user_name
-                        }
-                        # Update initialization plan if it exists
-                        if "initialization_plan" in self.state:
-                            self.state["initialization_plan"]["completed_groups"] += 1
-                        print(f"  Created role group: {role}")
-
-                    await asyncio.sleep(0.5)
-                except Exception as e:
-                    print(f"  Error creating {role} group: {e}")
+        # Creation order doesn't matter, so create every group concurrently
+        await asyncio.gather(*(create_one_group(*spec) for spec in specs))
 
     async def _create_initial_users(self):
         """Create initial batch of users with realistic profiles."""
-        print(f"Creating {self.initial_users} initial users...")
+        logger.info(f"Creating {self.initial_users} initial users...")
 
-        departments = get_departments_for_industry(self.industry)
-        locations = self.org_config.get("locations", ["Remote"])
+        profiles = self._precompute_initial_profiles()
+        now_iso = self._now_iso()
 
-        # Calculate user distribution across departments
-        users_per_dept = self.initial_users // len(departments)
-        remainder = self.initial_users % len(departments)
+        # Groups already exist, so new users join All Employees and their
+        # department group in the create request itself
+        all_employees_group = self._find_group_id("all_employees")
 
         user_count = 0
 
-        for dept_idx, dept in enumerate(departments):
-            # Add remainder users to first departments
-            dept_users = users_per_dept + (1 if dept_idx < remainder else 0)
+        async def create_one_user(profile: Dict[str, Any], is_manager: bool, user_idx: int):
+            nonlocal user_count
+            try:
+                group_ids = [
+                    group_id
+                    for group_id in (all_employees_group, self._find_group_id("department", profile["department"]))
+                    if group_id
+                ]
+
+                # Rotate through the pool's clients
+                client = self.client_pool.get_next_client()
+
+                # Create user
+                async with self._request_semaphore:
+                    user = await self._call(
+                        client.create_user,
+                        profile=profile,
+                        activate=True,
+                        group_ids=group_ids
+                    )
 
-            for i in range(dept_users):
-                try:
-                    # Generate user profile
-                    first_name = self._generate_first_name()
-                    last_name = self._generate_last_name()
-                    email = f"{first_name.lower()}.{last_name.lower()}@{self.industry.lower()}.example.com"
+                if user:
+                    self.state["users"][user["id"]] = {
+                        "id": user["id"],
+                        "profile": profile,
+                        "status": "ACTIVE",
+                        "groups": group_ids,
+                        "apps": [],
+                        "created_at": now_iso,
+                        "created_by": client.user_name
+                    }
+                    self._track_status_change(user["id"], None, "ACTIVE")
 
-                    # Select appropriate role
-                    is_manager = random.random() < self.org_config.get("executive_ratio", 0.1)
+                    for group_id in group_ids:
+                        self._change_member_count(group_id, 1)
+
+                    # Track managers
                     if is_manager:
-                        title = random.choice(["Manager", "Director", "VP", "Senior Manager"])
-                        title = f"{title} of {dept}"
-                    else:
-                        # Use _generate_job_title to get department-appropriate title
-                        title = self._generate_job_title(dept)
-
-                    profile = {
-                        "firstName": first_name,
-                        "lastName": last_name,
-                        "email": email,
-                        "login": email,
-                        "department": dept,
-                        "title": title,
-                        "employeeNumber": f"EMP{str(user_count + 1000).zfill(5)}",
-                        "location": random.choice(locations),
-                        "startDate": (datetime.now(timezone.utc) - timedelta(days=random.randint(30, 1095))).isoformat()
-                    }
+                        self.managers.append(user["id"])
 
-                    # Use random client from pool
-                    client = self.client_pool.get_random_client()
+                    user_count += 1
 
-                    # Create user
-                    user = await asyncio.to_thread(
-                        client.create_user,
-                        profile=profile,
-                        activate=True
-                    )
+                    # Update initialization plan if it exists
+                    if "initialization_plan" in self.state:
+                        self.state["initialization_plan"]["completed_users"] += 1
+                        self.state["initialization_plan"]["completed_group_assignments"] += len(group_ids)
 
-                    if user:
-                        self.state["users"][user["id"]] = {
-                            "id": user["id"],
-                            "profile": profile,
-                            "status": "ACTIVE",
-                            "groups": [],
-                            "apps": [],
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                            "created_by": client.user_name
-                        }
+                    if user_count % 10 == 0:
+                        logger.info(f"  Created {user_count}/{self.initial_users} users")
 
-                        # Track managers
-                        if is_manager:
-                            self.managers.append(user["id"])
+            except Exception as e:
+                logger.info(f"  Error creating user {user_idx + 1}: {e}")
 
-                        user_count += 1
+        # Create every user concurrently, bounded by the request semaphore
+        await asyncio.gather(*(
+            create_one_user(profile, is_manager, user_idx)
+            for user_idx, (profile, is_manager) in enumerate(profiles)
+        ))
 
-                        # Update initialization plan if it exists
-                        if "initialization_plan" in self.state:
-                            self.state["initialization_plan"]["completed_users"] += 1
+        logger.info(f"✓ Created {user_count} users")
 
-                        if user_count % 10 == 0:
-                            print(f"  Created {user_count}/{self.initial_users} users")
+    def _precompute_initial_profiles(self) -> List[Tuple[Dict[str, Any], bool]]:
+        """
+        Build the profiles for every initial user before any requests are made.
 
-                    await asyncio.sleep(0.2)  # Rate limit protection
+        Users are spread evenly across departments, with the remainder going to
+        the first departments. The random attributes are drawn in bulk.
 
-                except Exception as e:
-                    print(f"  Error creating user {user_count + 1}: {e}")
+        Returns:
+            List of (profile, is_manager) tuples, in employee number order
+        """
+        departments = self._departments
 
-        print(f"✓ Created {user_count} users")
+        # Calculate user distribution across departments
+        users_per_dept = self.initial_users // len(departments)
+        remainder = self.initial_users % len(departments)
+
+        user_slots = []
+        for dept_idx, dept in enumerate(departments):
+            # Add remainder users to first departments
+            dept_users = users_per_dept + (1 if dept_idx < remainder else 0)
+            user_slots.extend([dept] * dept_users)
+
+        num_users = len(user_slots)
+        executive_ratio = self.org_config.get("executive_ratio", 0.1)
+        is_manager_draws = [r < executive_ratio for r in (self._rng.random() for _ in range(num_users))]
+        location_draws = self._rng.choices(self._locations, k=num_users)
+        tenure_days_draws = self._rng.choices(range(30, 1096), k=num_users)
+        now = datetime.now(timezone.utc)
+        email_domain = f"{self.industry.lower()}.example.com"
+
+        profiles = []
+        for user_idx, dept in enumerate(user_slots):
+            first_name = self._generate_first_name()
+            last_name = self._generate_last_name()
+            email = f"{first_name.lower()}.{last_name.lower()}@{email_domain}"
+
+            # Select appropriate role
+            is_manager = is_manager_draws[user_idx]
+            if is_manager:
+                title = self._rng.choice(["Manager", "Director", "VP", "Senior Manager"])
+                title = f"{title} of {dept}"
+            else:
+                # Use _generate_job_title to get department-appropriate title
+                title = self._generate_job_title(dept)
+
+            profile = {
+                "firstName": first_name,
+                "lastName": last_name,
+                "email": email,
+                "login": email,
+                "department": dept,
+                "title": title,
+                "employeeNumber": f"EMP{str(user_idx + 1000).zfill(5)}",
+                "location": location_draws[user_idx],
+                "startDate": (now - timedelta(days=tenure_days_draws[user_idx])).isoformat()
+            }
+            profiles.append((profile, is_manager))
+
+        return profiles
+
+    async def _add_initial_group_member(self, user: Dict[str, Any], group_id: str,
+                                        error_label: str) -> bool:
+        """
+        Add a user to a group during initial setup and record it in state.
+
+        Args:
+            user: User state entry
+            group_id: Okta group ID
+            error_label: Description used in the error message (e.g. "user to All Employees")
+
+        Returns:
+            True if the user was added
+        """
+        try:
+            client = self.client_pool.get_next_client()
+            async with self._request_semaphore:
+                success = await self._call(
+                    client.add_user_to_group,
+                    user_id=user["id"],
+                    group_id=group_id
+                )
+            if success:
+                user["groups"].append(group_id)
+                self._index_user_memberships(user)
+                self._change_member_count(group_id, 1)
+                # Update initialization plan if it exists
+                if "initialization_plan" in self.state:
+                    self.state["initialization_plan"]["completed_group_assignments"] += 1
+                return True
+        except Exception as e:
+            logger.info(f"  Error adding {error_label}: {e}")
+        return False
 
     async def _assign_users_to_groups(self):
         """Assign users to appropriate groups based on their profiles."""
-        print("Assigning users to groups...")
+        logger.info("Assigning users to groups...")
 
-        # Get "All Employees" group
-        all_employees_group = None
-        for group_id, group in self.state["groups"].items():
-            if group["type"] == "all_employees":
-                all_employees_group = group_id
-                break
+        all_employees_group = self._find_group_id("all_employees")
+        managers_group = self._find_group_id("role", "Managers")
 
-        assignment_count = 0
+        # Collect every (user, group) membership, then add them concurrently.
+        # Users normally joined All Employees and their department group when
+        # they were created, so only missing memberships are added here.
+        assignments = []
 
         for user_id, user in self.state["users"].items():
             profile = user["profile"]
 
             # Assign to "All Employees"
-            if all_employees_group:
-                try:
-                    client = self.client_pool.get_random_client()
-                    success = await asyncio.to_thread(
-                        client.add_user_to_group,
-                        user_id=user_id,
-                        group_id=all_employees_group
-                    )
-                    if success:
-                        user["groups"].append(all_employees_group)
-                        self.state["groups"][all_employees_group]["member_count"] += 1
-                        assignment_count += 1
-                        # Update initialization plan if it exists
-                        if "initialization_plan" in self.state:
-                            self.state["initialization_plan"]["completed_group_assignments"] += 1
-                except Exception as e:
-                    print(f"  Error adding user to All Employees: {e}")
+            if all_employees_group and all_employees_group not in user["groups"]:
+                assignments.append((user, all_employees_group, "user to All Employees"))
 
             # Assign to department group
             dept = profile.get("department")
             if dept:
-                for group_id, group in self.state["groups"].items():
-                    if group["type"] == "department" and group.get("department") == dept:
-                        try:
-                            client = self.client_pool.get_random_client()
-                            success = await asyncio.to_thread(
-                                client.add_user_to_group,
-                                user_id=user_id,
-                                group_id=group_id
-                            )
-                            if success:
-                                user["groups"].append(group_id)
-                                self.state["groups"][group_id]["member_count"] += 1
-                                assignment_count += 1
-                                # Update initialization plan if it exists
-                                if "initialization_plan" in self.state:
-                                    self.state["initialization_plan"]["completed_group_assignments"] += 1
-                        except Exception as e:
-                            print(f"  Error adding user to {dept}: {e}")
-                        break
+                dept_group = self._find_group_id("department", dept)
+                if dept_group and dept_group not in user["groups"]:
+                    assignments.append((user, dept_group, f"user to {dept}"))
 
             # Assign to role-based groups
             title = profile.get("title", "").lower()
-            if "manager" in title or "director" in title or "vp" in title:
-                for group_id, group in self.state["groups"].items():
-                    if group["type"] == "role" and group["name"] == "Managers":
-                        try:
-                            client = self.client_pool.get_random_client()
-                            success = await asyncio.to_thread(
-                                client.add_user_to_group,
-                                user_id=user_id,
-                                group_id=group_id
-                            )
-                            if success:
-                                user["groups"].append(group_id)
-                                self.state["groups"][group_id]["member_count"] += 1
-                                assignment_count += 1
-                                # Update initialization plan if it exists
-                                if "initialization_plan" in self.state:
-                                    self.state["initialization_plan"]["completed_group_assignments"] += 1
-                        except Exception as e:
-                            print(f"  Error adding manager to role group: {e}")
-                        break
-
-            await asyncio.sleep(0.1)  # Rate limit protection
-
-        print(f"✓ Created {assignment_count} group assignments")
+            if managers_group and ("manager" in title or "director" in title or "vp" in title):
+                assignments.append((user, managers_group, "manager to role group"))
+
+        results = await asyncio.gather(*(
+            self._add_initial_group_member(user, group_id, error_label)
+            for user, group_id, error_label in assignments
+        ))
+        assignment_count = sum(results)
+
+        logger.info(f"✓ Created {assignment_count} group assignments")
+
+    def _find_group_id(self, group_type: str, key: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a group ID without scanning every group.
+
+        Args:
+            group_type: Group type ("all_employees", "department", "role", ...)
+            key: Department for department groups, group name for other types,
+                None for the All Employees group
+
+        Returns:
+            Group ID, or None if there is no such group
+        """
+        if self._group_index is None:
+            index = {}
+            for group_id, group in self.state["groups"].items():
+                # Keep the first match, like the linear scans this replaces
+                index.setdefault(self._group_index_key(group), group_id)
+            self._group_index = index
+
+        group_id = self._group_index.get((group_type, key))
+        if group_id is not None and group_id not in self.state["groups"]:
+            # Stale after an external change to the state file - rebuild once
+            self._group_index = None
+            return self._find_group_id(group_type, key)
+        return group_id
+
+    @staticmethod
+    def _group_index_key(group: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """Key a group is filed under in the _find_group_id index."""
+        if group["type"] == "all_employees":
+            return (group["type"], None)
+        if group["type"] == "department":
+            return (group["type"], group.get("department"))
+        return (group["type"], group["name"])
+
+    def _index_group(self, group_id: str, group: Dict[str, Any]):
+        """Add a newly created group to the group indexes that are built."""
+        self._index_deletable_group(group_id)
+        if self._group_index is not None:
+            self._group_index.setdefault(self._group_index_key(group), group_id)
+
+    def _unindex_group(self, group_id: str, group: Dict[str, Any]):
+        """
+        Drop a deleted group from the group indexes that are built.
+
+        Call after the group has been removed from state.
+        """
+        if self._deletable_group_ids is not None:
+            self._deletable_group_ids.discard(group_id)
+        if self._group_index is None:
+            return
+        key = self._group_index_key(group)
+        if self._group_index.get(key) != group_id:
+            return
+        # Fall back to the next group with the same key, if any
+        replacement = next(
+            (gid for gid, g in self.state["groups"].items() if self._group_index_key(g) == key),
+            None
+        )
+        if replacement is None:
+            del self._group_index[key]
+        else:
+            self._group_index[key] = replacement
+
+    def _deletable_groups(self) -> IndexedSet[str]:
+        """
+        Get the groups the delete-group handler can pick.
+
+        Built from state on first use; after that, kept current by _index_group,
+        _unindex_group and _change_member_count.
+
+        Returns:
+            IDs of unprotected groups with few members - do not modify
+        """
+        if self._deletable_group_ids is None:
+            self._deletable_group_ids = IndexedSet()
+            for group_id in self.state["groups"]:
+                self._index_deletable_group(group_id)
+        return self._deletable_group_ids
+
+    def _index_deletable_group(self, group_id: str):
+        """Re-check whether a group belongs in the deletable index, if it is built."""
+        if self._deletable_group_ids is None:
+            return
+        group = self.state["groups"].get(group_id)
+        if (group is not None and group["type"] not in self.PROTECTED_GROUP_TYPES
+                and group["member_count"] < self.DELETABLE_GROUP_MAX_MEMBERS):
+            self._deletable_group_ids.add(group_id)
+        else:
+            self._deletable_group_ids.discard(group_id)
+
+    def _change_member_count(self, group_id: str, delta: int):
+        """
+        Adjust a group's member count, keeping the deletable index in step.
+
+        Args:
+            group_id: Okta group ID
+            delta: Members added (positive) or removed (negative)
+        """
+        self.state["groups"][group_id]["member_count"] += delta
+        self._index_deletable_group(group_id)
 
     async def _discover_apps(self):
         """Discover and cache available apps in the Okta org."""
-        print("Discovering available applications...")
+        logger.info("Discovering available applications...")
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         try:
             # List all apps in the org
-            apps = await asyncio.to_thread(client.list_apps, limit=200)
+            apps = await self._call(client.list_apps, limit=200)
 
             if apps:
                 for app in apps:
@@ -623,81 +1049,95 @@ class OktaService(BaseService):
                     if app_name:
                         self.app_catalog[app_name] = app["id"]
 
-                print(f"✓ Discovered {len(self.app_catalog)} applications")
+                logger.info(f"✓ Discovered {len(self.app_catalog)} applications")
+
+                # The catalog changed - rebuild the missing-apps index on next use
+                self._missing_app_user_ids = None
             else:
-                print("  No applications found in org")
+                logger.info("  No applications found in org")
 
         except Exception as e:
-            print(f"  Error discovering apps: {e}")
+            logger.info(f"  Error discovering apps: {e}")
 
     async def _assign_initial_apps(self):
         """Assign apps to users based on department and role."""
-        print("Assigning applications to users...")
+        logger.info("Assigning applications to users...")
 
         # Get app assignment patterns from templates
         universal_apps = ["Slack", "Zoom", "Microsoft 365", "Google Workspace"]
-        department_apps = self._get_department_apps()
+        manager_apps = ["Workday", "Tableau", "Power BI"]
+        now_iso = self._now_iso()
+
+        def resolve(app_names: List[str]) -> List[Tuple[str, str]]:
+            return [(app_name, self.app_catalog[app_name]) for app_name in app_names
+                    if app_name in self.app_catalog]
+
+        # Resolve app IDs once, not per user
+        resolved_universal = resolve(universal_apps)
+        resolved_manager = resolve(manager_apps)
+        resolved_department = {dept: resolve(apps) for dept, apps in self._department_apps.items()}
 
-        assignment_count = 0
+        # Apps to assign per (department, is manager), built on first use
+        apps_by_profile: Dict[Tuple[str, bool], List[Tuple[str, str]]] = {}
+
+        # Collect every (user, app) assignment, then make them concurrently
+        assignments = []
 
         for user_id, user in self.state["users"].items():
             profile = user["profile"]
             dept = profile.get("department", "")
             title = profile.get("title", "").lower()
+            key = (dept, "manager" in title or "director" in title)
 
-            apps_to_assign = []
-
-            # Assign universal apps (everyone gets these)
-            for app_name in universal_apps:
-                if app_name in self.app_catalog:
-                    apps_to_assign.append((app_name, self.app_catalog[app_name]))
-
-            # Assign department-specific apps
-            if dept in department_apps:
-                dept_specific = department_apps[dept]
-                for app_name in dept_specific:
-                    if app_name in self.app_catalog:
-                        apps_to_assign.append((app_name, self.app_catalog[app_name]))
-
-            # Assign role-specific apps
-            if "manager" in title or "director" in title:
-                manager_apps = ["Workday", "Tableau", "Power BI"]
-                for app_name in manager_apps:
-                    if app_name in self.app_catalog:
-                        apps_to_assign.append((app_name, self.app_catalog[app_name]))
-
-            # Create assignments
-            for app_name, app_id in apps_to_assign[:5]:  # Limit to 5 apps initially
-                try:
-                    client = self.client_pool.get_random_client()
-                    assignment = await asyncio.to_thread(
+            apps_to_assign = apps_by_profile.get(key)
+            if apps_to_assign is None:
+                # Universal apps (everyone gets these), then department-specific
+                # apps, then role-specific apps - limited to 5 apps initially
+                apps_to_assign = resolved_universal + resolved_department.get(dept, [])
+                if key[1]:
+                    apps_to_assign = apps_to_assign + resolved_manager
+                apps_to_assign = apps_by_profile[key] = apps_to_assign[:5]
+
+            assignments.extend((user_id, user, app_name, app_id)
+                               for app_name, app_id in apps_to_assign)
+
+        async def assign_one_app(user_id: str, user: Dict[str, Any], app_name: str, app_id: str) -> bool:
+            try:
+                client = self.client_pool.get_next_client()
+                async with self._request_semaphore:
+                    assignment = await self._call(
                         client.assign_user_to_app,
                         user_id=user_id,
                         app_id=app_id
                     )
 
-                    if assignment:
-                        assignment_id = f"{app_id}_{user_id}"
-                        self.state["app_assignments"][assignment_id] = {
-                            "app_id": app_id,
-                            "app_name": app_name,
-                            "user_id": user_id,
-                            "assigned_at": datetime.now(timezone.utc).isoformat(),
-                            "assigned_by": client.user_name
-                        }
-                        user["apps"].append(app_id)
-                        assignment_count += 1
-                        # Update initialization plan if it exists
-                        if "initialization_plan" in self.state:
-                            self.state["initialization_plan"]["completed_app_assignments"] += 1
-
-                except Exception as e:
-                    # Silently skip if app assignment fails
-                    pass
+                if assignment:
+                    assignment_id = f"{app_id}_{user_id}"
+                    self.state["app_assignments"][assignment_id] = {
+                        "app_id": app_id,
+                        "app_name": app_name,
+                        "user_id": user_id,
+                        "assigned_at": now_iso,
+                        "assigned_by": client.user_name
+                    }
+                    user["apps"].append(app_id)
+                    self._index_user_memberships(user)
+                    # Update initialization plan if it exists
+                    if "initialization_plan" in self.state:
+                        self.state["initialization_plan"]["completed_app_assignments"] += 1
+                    return True
+
+            except Exception as e:
+                # Silently skip if app assignment fails
+                pass
+            return False
 
-            await asyncio.sleep(0.2)  # Rate limit protection
+        results = await asyncio.gather(*(
+            assign_one_app(*assignment) for assignment in assignments
+        ))
+        assignment_count = sum(results)
 
-        print(f"✓ Created {assignment_count} app assignments")
+        logger.info(f"✓ Created {assignment_count} app assignments")
 
     def _get_department_apps(self) -> Dict[str, List[str]]:
         """Get department-specific apps based on industry."""
@@ -759,73 +1199,243 @@ class OktaService(BaseService):
             # Log activity
             self._log_activity(activity_type, "success")
 
-            # Save state after each activity
-            if not self.deleted:
-                self.state_manager.save_state(self.job_id, self.state)
+            # Saved by the run loop every STATE_SAVE_INTERVAL seconds
+            self._state_dirty = True
 
         except Exception as e:
-            print(f"Error generating {activity_type}: {e}")
+            logger.info(f"Error generating {activity_type}: {e}")
             self._log_activity(activity_type, "failed", str(e))
+            self._state_dirty = True
 
     def _select_activity_type(self) -> str:
         """Select activity type based on weights and current state."""
-        # Build weighted list
-        choices = []
-        weights = []
+        # Don't deactivate if too few users, delete groups unless there are
+        # enough of them, or unsuspend when nobody is suspended
+        allowed = (
+            len(self._user_ids_with_status("ACTIVE")) >= 10,
+            len(self.state["groups"]) >= 10,
+            len(self._user_ids_with_status("SUSPENDED")) > 0
+        )
 
-        for activity, weight in self.activity_weights.items():
-            # Adjust weights based on current state
-            if activity == OktaActivityType.DEACTIVATE_USER:
-                # Only if we have active users
-                active_users = [u for u in self.state["users"].values() if u["status"] == "ACTIVE"]
-                if len(active_users) < 10:
-                    weight = 0  # Don't deactivate if too few users
-            elif activity == OktaActivityType.DELETE_GROUP:
-                # Only if we have enough groups
-                if len(self.state["groups"]) < 10:
-                    weight = 0
-            elif activity == OktaActivityType.UNSUSPEND_USER:
-                # Only if we have suspended users
-                suspended_users = [u for u in self.state["users"].values() if u["status"] == "SUSPENDED"]
-                if not suspended_users:
-                    weight = 0
-
-            if weight > 0:
-                choices.append(activity)
-                weights.append(weight)
+        table = self._activity_tables.get(allowed)
+        if table is None:
+            table = self._build_activity_table(*allowed)
+            self._activity_tables[allowed] = table
+        choices, cum_weights = table
 
         if not choices:
             # Default to creating a user if no other activities available
             return OktaActivityType.CREATE_USER
 
-        return random.choices(choices, weights=weights)[0]
+        return self._rng.choices(choices, cum_weights=cum_weights)[0]
+
+    def _build_activity_table(self, can_deactivate: bool, can_delete_group: bool,
+                              can_unsuspend: bool) -> Tuple[List[str], List[int]]:
+        """
+        Build the activity choices and cumulative weights for one combination
+        of state-dependent activities.
+
+        Args:
+            can_deactivate: Whether DEACTIVATE_USER may be picked
+            can_delete_group: Whether DELETE_GROUP may be picked
+            can_unsuspend: Whether UNSUSPEND_USER may be picked
+
+        Returns:
+            Tuple of (activity types, cumulative weights)
+        """
+        disabled = set()
+        if not can_deactivate:
+            disabled.add(OktaActivityType.DEACTIVATE_USER)
+        if not can_delete_group:
+            disabled.add(OktaActivityType.DELETE_GROUP)
+        if not can_unsuspend:
+            disabled.add(OktaActivityType.UNSUSPEND_USER)
+
+        choices = []
+        cum_weights = []
+        total = 0
+        for activity, weight in self.activity_weights.items():
+            if weight > 0 and activity not in disabled:
+                total += weight
+                choices.append(activity)
+                cum_weights.append(total)
+
+        return choices, cum_weights
+
+    def _user_ids_with_status(self, status: str) -> IndexedSet[str]:
+        """
+        Get the IDs of users with a status.
+
+        Built from state on first use; after that, every user creation and
+        status change goes through _track_status_change so no rescan is needed.
+
+        Args:
+            status: Okta user status (ACTIVE, SUSPENDED, DEPROVISIONED, ...)
+
+        Returns:
+            Set of user IDs (do not modify)
+        """
+        if self._user_ids_by_status is None:
+            by_status = defaultdict(IndexedSet)
+            for user_id, user_data in self.state["users"].items():
+                by_status[user_data["status"]].add(user_id)
+            self._user_ids_by_status = by_status
+        return self._user_ids_by_status[status]
+
+    def _random_user_with_status(self, status: str) -> Optional[Dict[str, Any]]:
+        """
+        Pick a random user with a status.
+
+        Args:
+            status: Okta user status
+
+        Returns:
+            User state entry, or None if no user has the status
+        """
+        user_ids = self._user_ids_with_status(status)
+        if not user_ids:
+            return None
+        return self.state["users"][user_ids.choice(self._rng)]
+
+    def _set_user_status(self, user_data: Dict[str, Any], new_status: str):
+        """
+        Change a user's status, moving them to the matching status index.
+
+        Args:
+            user_data: User state entry
+            new_status: Status the user now has
+        """
+        self._track_status_change(user_data["id"], user_data["status"], new_status)
+        user_data["status"] = new_status
+        self._index_user_memberships(user_data)
+
+    def _track_status_change(self, user_id: str, old_status: Optional[str], new_status: str):
+        """
+        Keep the status index in step with a user being added or changing status.
+
+        Args:
+            user_id: Okta user ID
+            old_status: Previous status, or None for a newly created user
+            new_status: Status the user now has
+        """
+        if self._user_ids_by_status is None:
+            return
+        if old_status is not None:
+            self._user_ids_by_status[old_status].discard(user_id)
+        self._user_ids_by_status[new_status].add(user_id)
+
+    def _removal_candidates(self) -> Tuple[IndexedSet[str], IndexedSet[str]]:
+        """
+        Get the users the remove-from-group and unassign-app handlers can pick.
+
+        Built from state on first use; after that, every change to a user's
+        groups, apps or status goes through _index_user_memberships.
+
+        Returns:
+            Tuple of (IDs of active users in more than one group,
+            IDs of active users with more than two apps) - do not modify
+        """
+        if self._multi_group_user_ids is None:
+            self._multi_group_user_ids = IndexedSet()
+            self._multi_app_user_ids = IndexedSet()
+            for user_data in self.state["users"].values():
+                self._index_user_memberships(user_data)
+        return self._multi_group_user_ids, self._multi_app_user_ids
+
+    def _index_user_memberships(self, user_data: Dict[str, Any]):
+        """
+        Update the candidate sets after a user's groups, apps or status change.
+
+        Args:
+            user_data: User state entry
+        """
+        user_id = user_data["id"]
+        active = user_data["status"] == "ACTIVE"
+
+        if self._missing_app_user_ids is not None:
+            if active and not self._catalog_app_ids.issubset(user_data["apps"]):
+                self._missing_app_user_ids.add(user_id)
+            else:
+                self._missing_app_user_ids.discard(user_id)
+
+        if self._multi_group_user_ids is None:
+            return
+
+        if active and len(user_data["groups"]) > 1:
+            self._multi_group_user_ids.add(user_id)
+        else:
+            self._multi_group_user_ids.discard(user_id)
+        if active and len(user_data["apps"]) > 2:
+            self._multi_app_user_ids.add(user_id)
+        else:
+            self._multi_app_user_ids.discard(user_id)
+
+    def _users_missing_apps(self) -> IndexedSet[str]:
+        """
+        Get the active users the assign-app handler can pick.
+
+        Built from state on first use (and after app discovery); after that,
+        kept current by _index_user_memberships.
+
+        Returns:
+            IDs of active users without every app in app_catalog - do not modify
+        """
+        if self._missing_app_user_ids is None:
+            self._catalog_app_ids = frozenset(self.app_catalog.values())
+            self._missing_app_user_ids = IndexedSet()
+            for user_data in self.state["users"].values():
+                self._index_user_memberships(user_data)
+        return self._missing_app_user_ids
 
     async def _handle_create_user(self):
         """Handle new user creation (hiring)."""
-        departments = get_departments_for_industry(self.industry)
-        locations = self.org_config.get("locations", ["Remote"])
+        departments = self._departments
+        locations = self._locations
+        now_iso = self._now_iso()
 
         # Generate user profile
-        dept = random.choice(departments)
+        dept = self._rng.choice(departments)
 
         # Use LLM generator if available, otherwise fall back to simple generation
-        if self.llm_generator:
+        if self.llm:
             # Generate job title first
             title = self._generate_job_title(dept)
 
-            # Use LLM to generate realistic user profile
-            profile = self.llm_generator.generate_user_profile(
-                industry=self.industry,
-                department=dept,
-                title=title,
-                org_size=self.org_size
-            )
+            cached = self._profile_templates.get((dept, title))
+            if cached is None:
+                # Use LLM to generate realistic user profile (off the event loop -
+                # the model call is by far the slowest part of a hire)
+                profile = await asyncio.to_thread(
+                    self.llm.generate_user_profile,
+                    industry=self.industry,
+                    department=dept,
+                    title=title,
+                    org_size=self.org_size
+                )
+                template = {k: v for k, v in profile.items() if k not in self.PROFILE_IDENTITY_FIELDS}
+                email_domain = (profile.get("email", "").partition("@")[2]
+                                or f"{self.industry.lower()}.example.com")
+                self._profile_templates[(dept, title)] = (template, email_domain)
+            else:
+                # Same department and title as an earlier hire - reuse its
+                # generated details and only draw a new name
+                template, email_domain = cached
+                first_name = self._generate_first_name()
+                last_name = self._generate_last_name()
+                email = f"{first_name.lower()}.{last_name.lower()}@{email_domain}"
+                profile = {
+                    **template,
+                    "firstName": first_name,
+                    "lastName": last_name,
+                    "email": email,
+                    "login": email
+                }
 
             # Ensure required fields are present
             if "employeeNumber" not in profile:
                 profile["employeeNumber"] = f"EMP{str(len(self.state['users']) + 1000).zfill(5)}"
             if "startDate" not in profile:
-                profile["startDate"] = datetime.now(timezone.utc).isoformat()
+                profile["startDate"] = now_iso
         else:
             # Fallback to simple generation
             first_name = self._generate_first_name()
@@ -840,13 +1450,13 @@ class OktaService(BaseService):
                 "department": dept,
                 "title": self._generate_job_title(dept),
                 "employeeNumber": f"EMP{str(len(self.state['users']) + 1000).zfill(5)}",
-                "location": random.choice(locations),
-                "startDate": datetime.now(timezone.utc).isoformat()
+                "location": self._rng.choice(locations),
+                "startDate": now_iso
             }
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        user = await asyncio.to_thread(
+        user = await self._call(
             client.create_user,
             profile=profile,
             activate=True
@@ -859,11 +1469,12 @@ class OktaService(BaseService):
                 "status": "ACTIVE",
                 "groups": [],
                 "apps": [],
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": now_iso,
                 "created_by": client.user_name
             }
+            self._track_status_change(user["id"], None, "ACTIVE")
 
-            print(f"  Created user: {profile['firstName']} {profile['lastName']} ({profile['title']})")
+            logger.info(f"  Created user: {profile['firstName']} {profile['lastName']} ({profile['title']})")
 
             # Assign to department group
             await self._assign_user_to_department(user["id"], dept)
@@ -874,41 +1485,39 @@ class OktaService(BaseService):
     async def _handle_deactivate_user(self):
         """Handle user deactivation (offboarding)."""
         # Find an active user to deactivate
-        active_users = [u for u in self.state["users"].values() if u["status"] == "ACTIVE"]
+        user_data = self._random_user_with_status("ACTIVE")
 
-        if not active_users:
+        if not user_data:
             return
 
-        user_data = random.choice(active_users)
         user_id = user_data["id"]
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        success = await asyncio.to_thread(
+        success = await self._call(
             client.deactivate_user,
             user_id=user_id
         )
 
         if success:
-            user_data["status"] = "DEPROVISIONED"
-            user_data["deactivated_at"] = datetime.now(timezone.utc).isoformat()
+            self._set_user_status(user_data, "DEPROVISIONED")
+            user_data["deactivated_at"] = self._now_iso()
             profile = user_data["profile"]
-            print(f"  Deactivated user: {profile['firstName']} {profile['lastName']}")
+            logger.info(f"  Deactivated user: {profile['firstName']} {profile['lastName']}")
 
     async def _handle_update_user(self):
         """Handle user profile update (promotion, transfer)."""
         # Find an active user to update
-        active_users = [u for u in self.state["users"].values() if u["status"] == "ACTIVE"]
+        user_data = self._random_user_with_status("ACTIVE")
 
-        if not active_users:
+        if not user_data:
             return
 
-        user_data = random.choice(active_users)
         user_id = user_data["id"]
         profile = user_data["profile"].copy()
 
         # Determine update type
-        update_type = random.choice(["promotion", "transfer", "location_change"])
+        update_type = self._rng.choice(["promotion", "transfer", "location_change"])
 
         if update_type == "promotion":
             # Update title
@@ -921,21 +1530,21 @@ class OktaService(BaseService):
                 profile["title"] = old_title.replace("Manager", "Director")
         elif update_type == "transfer":
             # Change department
-            departments = get_departments_for_industry(self.industry)
+            departments = self._departments
             current_dept = profile.get("department", "")
-            new_dept = random.choice([d for d in departments if d != current_dept])
+            new_dept = self._rng.choice([d for d in departments if d != current_dept])
             profile["department"] = new_dept
             profile["title"] = self._generate_job_title(new_dept)
         else:
             # Change location
-            locations = self.org_config.get("locations", ["Remote"])
+            locations = self._locations
             current_location = profile.get("location", "")
-            new_location = random.choice([l for l in locations if l != current_location])
+            new_location = self._rng.choice([l for l in locations if l != current_location])
             profile["location"] = new_location
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        updated_user = await asyncio.to_thread(
+        updated_user = await self._call(
             client.update_user,
             user_id=user_id,
             profile=profile
@@ -943,7 +1552,7 @@ class OktaService(BaseService):
 
         if updated_user:
             user_data["profile"] = profile
-            print(f"  Updated user: {profile['firstName']} {profile['lastName']} - {update_type}")
+            logger.info(f"  Updated user: {profile['firstName']} {profile['lastName']} - {update_type}")
 
     async def _handle_assign_to_group(self):
         """Handle adding user to a group."""
@@ -954,8 +1563,8 @@ class OktaService(BaseService):
                 for group_id, group in self.state["groups"].items():
                     if group_id not in user_data["groups"]:
                         # Try to assign
-                        client = self.client_pool.get_random_client()
-                        success = await asyncio.to_thread(
+                        client = self.client_pool.get_next_client()
+                        success = await self._call(
                             client.add_user_to_group,
                             user_id=user_data["id"],
                             group_id=group_id
@@ -963,114 +1572,134 @@ class OktaService(BaseService):
 
                         if success:
                             user_data["groups"].append(group_id)
-                            group["member_count"] += 1
+                            self._index_user_memberships(user_data)
+                            self._change_member_count(group_id, 1)
                             profile = user_data["profile"]
-                            print(f"  Added {profile['firstName']} {profile['lastName']} to {group['name']}")
+                            logger.info(f"  Added {profile['firstName']} {profile['lastName']} to {group['name']}")
                             return
 
     async def _handle_remove_from_group(self):
         """Handle removing user from a group."""
-        # Find a user in multiple groups
-        for user_data in self.state["users"].values():
-            if user_data["status"] == "ACTIVE" and len(user_data["groups"]) > 1:
-                # Don't remove from "All Employees"
-                removable_groups = [g for g in user_data["groups"]
-                                   if self.state["groups"][g]["type"] != "all_employees"]
-
-                if removable_groups:
-                    group_id = random.choice(removable_groups)
-                    client = self.client_pool.get_random_client()
-
-                    success = await asyncio.to_thread(
-                        client.remove_user_from_group,
-                        user_id=user_data["id"],
-                        group_id=group_id
-                    )
+        # Pick an active user in multiple groups
+        multi_group_user_ids, _ = self._removal_candidates()
+        if not multi_group_user_ids:
+            return
 
-                    if success:
-                        user_data["groups"].remove(group_id)
-                        self.state["groups"][group_id]["member_count"] -= 1
-                        profile = user_data["profile"]
-                        group_name = self.state["groups"][group_id]["name"]
-                        print(f"  Removed {profile['firstName']} {profile['lastName']} from {group_name}")
-                        return
+        user_data = self.state["users"][multi_group_user_ids.choice(self._rng)]
+
+        # Don't remove from "All Employees"
+        removable_groups = [g for g in user_data["groups"]
+                           if self.state["groups"][g]["type"] != "all_employees"]
+
+        if removable_groups:
+            group_id = self._rng.choice(removable_groups)
+            client = self.client_pool.get_next_client()
+
+            success = await self._call(
+                client.remove_user_from_group,
+                user_id=user_data["id"],
+                group_id=group_id
+            )
+
+            if success:
+                user_data["groups"].remove(group_id)
+                self._index_user_memberships(user_data)
+                self._change_member_count(group_id, -1)
+                profile = user_data["profile"]
+                group_name = self.state["groups"][group_id]["name"]
+                logger.info(f"  Removed {profile['firstName']} {profile['lastName']} from {group_name}")
 
     async def _handle_assign_app(self):
         """Handle assigning app to user."""
         if not self.app_catalog:
             return
 
-        # Find a user who doesn't have all apps
-        for user_data in self.state["users"].values():
-            if user_data["status"] == "ACTIVE":
-                # Find an app they don't have
-                for app_name, app_id in self.app_catalog.items():
-                    if app_id not in user_data["apps"]:
-                        client = self.client_pool.get_random_client()
+        # Pick an active user who doesn't have all apps
+        missing_app_user_ids = self._users_missing_apps()
+        if not missing_app_user_ids:
+            return
 
-                        assignment = await asyncio.to_thread(
-                            client.assign_user_to_app,
-                            user_id=user_data["id"],
-                            app_id=app_id
-                        )
+        user_data = self.state["users"][missing_app_user_ids.choice(self._rng)]
+        owned_apps = set(user_data["apps"])
 
-                        if assignment:
-                            assignment_id = f"{app_id}_{user_data['id']}"
-                            self.state["app_assignments"][assignment_id] = {
-                                "app_id": app_id,
-                                "app_name": app_name,
-                                "user_id": user_data["id"],
-                                "assigned_at": datetime.now(timezone.utc).isoformat(),
-                                "assigned_by": client.user_name
-                            }
-                            user_data["apps"].append(app_id)
-                            profile = user_data["profile"]
-                            print(f"  Assigned {app_name} to {profile['firstName']} {profile['lastName']}")
-                            return
+        # Find an app they don't have
+        for app_name, app_id in self.app_catalog.items():
+            if app_id in owned_apps:
+                continue
+
+            client = self.client_pool.get_next_client()
+
+            assignment = await self._call(
+                client.assign_user_to_app,
+                user_id=user_data["id"],
+                app_id=app_id
+            )
+
+            if assignment:
+                assignment_id = f"{app_id}_{user_data['id']}"
+                self.state["app_assignments"][assignment_id] = {
+                    "app_id": app_id,
+                    "app_name": app_name,
+                    "user_id": user_data["id"],
+                    "assigned_at": self._now_iso(),
+                    "assigned_by": client.user_name
+                }
+                user_data["apps"].append(app_id)
+                self._index_user_memberships(user_data)
+                profile = user_data["profile"]
+                logger.info(f"  Assigned {app_name} to {profile['firstName']} {profile['lastName']}")
+                return
 
     async def _handle_unassign_app(self):
         """Handle removing app from user."""
-        # Find a user with multiple apps
-        for user_data in self.state["users"].values():
-            if user_data["status"] == "ACTIVE" and len(user_data["apps"]) > 2:
-                app_id = random.choice(user_data["apps"])
-                client = self.client_pool.get_random_client()
-
-                success = await asyncio.to_thread(
-                    client.remove_user_from_app,
-                    user_id=user_data["id"],
-                    app_id=app_id
-                )
+        # Pick an active user with multiple apps
+        _, multi_app_user_ids = self._removal_candidates()
+        if not multi_app_user_ids:
+            return
 
-                if success:
-                    user_data["apps"].remove(app_id)
-                    # Remove from app_assignments
-                    assignment_id = f"{app_id}_{user_data['id']}"
-                    if assignment_id in self.state["app_assignments"]:
-                        app_name = self.state["app_assignments"][assignment_id].get("app_name", "Unknown")
-                        del self.state["app_assignments"][assignment_id]
-                    else:
-                        app_name = "Unknown"
+        user_data = self.state["users"][multi_app_user_ids.choice(self._rng)]
+        app_id = self._rng.choice(user_data["apps"])
+        client = self.client_pool.get_next_client()
 
-                    profile = user_data["profile"]
-                    print(f"  Removed {app_name} from {profile['firstName']} {profile['lastName']}")
-                    return
+        success = await self._call(
+            client.remove_user_from_app,
+            user_id=user_data["id"],
+            app_id=app_id
+        )
+
+        if success:
+            user_data["apps"].remove(app_id)
+            self._index_user_memberships(user_data)
+            # Remove from app_assignments
+            assignment_id = f"{app_id}_{user_data['id']}"
+            if assignment_id in self.state["app_assignments"]:
+                app_name = self.state["app_assignments"][assignment_id].get("app_name", "Unknown")
+                del self.state["app_assignments"][assignment_id]
+            else:
+                app_name = "Unknown"
+
+            profile = user_data["profile"]
+            logger.info(f"  Removed {app_name} from {profile['firstName']} {profile['lastName']}")
 
     async def _handle_create_group(self):
         """Handle creating a new group."""
         # Determine group type
-        departments = get_departments_for_industry(self.industry)
-        dept = random.choice(departments)
-        group_type = random.choice(["team", "project", "role"])
+        departments = self._departments
+        dept = self._rng.choice(departments)
+        group_type = self._rng.choice(["team", "project", "role"])
 
         # Use LLM generator if available, otherwise fall back to simple generation
-        if self.llm_generator:
-            group_name = self.llm_generator.generate_group_name(
+        if self.llm:
+            # Off the event loop, like the setup groups; the description prompt
+            # needs the generated name, so the two calls stay sequential
+            group_name = await asyncio.to_thread(
+                self.llm.generate_group_name,
                 industry=self.industry,
                 department=dept,
                 group_type=group_type
             )
-            description = self.llm_generator.generate_group_description(
+            description = await asyncio.to_thread(
+                self.llm.generate_group_description,
                 industry=self.industry,
                 group_name=group_name,
                 group_type=group_type
@@ -1080,16 +1709,16 @@ class OktaService(BaseService):
             group_types = ["Project", "Committee", "Team", "Task Force"]
             group_prefixes = ["Innovation", "Digital", "Strategic", "Customer", "Product"]
 
-            selected_type = random.choice(group_types)
-            prefix = random.choice(group_prefixes)
-            suffix = random.randint(100, 999)
+            selected_type = self._rng.choice(group_types)
+            prefix = self._rng.choice(group_prefixes)
+            suffix = self._rng.randint(100, 999)
 
             group_name = f"{prefix} {selected_type} {suffix}"
             description = f"Members of the {group_name}"
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        group = await asyncio.to_thread(
+        group = await self._call(
             client.create_group,
             name=group_name,
             description=description
@@ -1102,26 +1731,24 @@ class OktaService(BaseService):
                 "type": "project",
                 "description": description,
                 "member_count": 0,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": self._now_iso(),
                 "created_by": client.user_name
             }
-            print(f"  Created group: {group_name}")
+            self._index_group(group["id"], self.state["groups"][group["id"]])
+            logger.info(f"  Created group: {group_name}")
 
     async def _handle_delete_group(self):
         """Handle deleting a group."""
         # Find a deletable group (not department or all_employees)
-        deletable_groups = [
-            (gid, g) for gid, g in self.state["groups"].items()
-            if g["type"] not in ["department", "all_employees"] and g["member_count"] < 3
-        ]
-
-        if not deletable_groups:
+        deletable_group_ids = self._deletable_groups()
+        if not deletable_group_ids:
             return
 
-        group_id, group = random.choice(deletable_groups)
-        client = self.client_pool.get_random_client()
+        group_id = deletable_group_ids.choice(self._rng)
+        group = self.state["groups"][group_id]
+        client = self.client_pool.get_next_client()
 
-        success = await asyncio.to_thread(
+        success = await self._call(
             client.delete_group,
             group_id=group_id
         )
@@ -1131,118 +1758,118 @@ class OktaService(BaseService):
             for user_data in self.state["users"].values():
                 if group_id in user_data["groups"]:
                     user_data["groups"].remove(group_id)
+                    self._index_user_memberships(user_data)
 
             group_name = group["name"]
             del self.state["groups"][group_id]
-            print(f"  Deleted group: {group_name}")
+            self._unindex_group(group_id, group)
+            logger.info(f"  Deleted group: {group_name}")
 
     async def _handle_suspend_user(self):
         """Handle suspending a user."""
         # Find an active user to suspend
-        active_users = [u for u in self.state["users"].values() if u["status"] == "ACTIVE"]
+        user_data = self._random_user_with_status("ACTIVE")
 
-        if not active_users:
+        if not user_data:
             return
 
-        user_data = random.choice(active_users)
         user_id = user_data["id"]
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        success = await asyncio.to_thread(
+        success = await self._call(
             client.suspend_user,
             user_id=user_id
         )
 
         if success:
-            user_data["status"] = "SUSPENDED"
-            user_data["suspended_at"] = datetime.now(timezone.utc).isoformat()
+            self._set_user_status(user_data, "SUSPENDED")
+            user_data["suspended_at"] = self._now_iso()
             profile = user_data["profile"]
-            print(f"  Suspended user: {profile['firstName']} {profile['lastName']}")
+            logger.info(f"  Suspended user: {profile['firstName']} {profile['lastName']}")
 
     async def _handle_unsuspend_user(self):
         """Handle unsuspending a user."""
         # Find a suspended user
-        suspended_users = [u for u in self.state["users"].values() if u["status"] == "SUSPENDED"]
+        user_data = self._random_user_with_status("SUSPENDED")
 
-        if not suspended_users:
+        if not user_data:
             return
 
-        user_data = random.choice(suspended_users)
         user_id = user_data["id"]
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        success = await asyncio.to_thread(
+        success = await self._call(
             client.unsuspend_user,
             user_id=user_id
         )
 
         if success:
-            user_data["status"] = "ACTIVE"
+            self._set_user_status(user_data, "ACTIVE")
             if "suspended_at" in user_data:
                 del user_data["suspended_at"]
             profile = user_data["profile"]
-            print(f"  Unsuspended user: {profile['firstName']} {profile['lastName']}")
+            logger.info(f"  Unsuspended user: {profile['firstName']} {profile['lastName']}")
 
     async def _handle_password_reset(self):
         """Handle password reset for a user."""
         # Find an active user
-        active_users = [u for u in self.state["users"].values() if u["status"] == "ACTIVE"]
+        user_data = self._random_user_with_status("ACTIVE")
 
-        if not active_users:
+        if not user_data:
             return
 
-        user_data = random.choice(active_users)
         user_id = user_data["id"]
         profile = user_data["profile"]
 
         # Log the password reset event
-        print(f"  Password reset initiated for: {profile['firstName']} {profile['lastName']}")
+        logger.info(f"  Password reset initiated for: {profile['firstName']} {profile['lastName']}")
 
     async def _handle_mfa_enrollment(self):
         """Handle MFA enrollment for a user."""
         # Find an active user
-        active_users = [u for u in self.state["users"].values() if u["status"] == "ACTIVE"]
+        user_data = self._random_user_with_status("ACTIVE")
 
-        if not active_users:
+        if not user_data:
             return
 
-        user_data = random.choice(active_users)
         profile = user_data["profile"]
 
         # Log the MFA enrollment event
-        print(f"  MFA enrolled for: {profile['firstName']} {profile['lastName']}")
+        logger.info(f"  MFA enrolled for: {profile['firstName']} {profile['lastName']}")
 
     async def _assign_user_to_department(self, user_id: str, department: str):
         """Assign user to their department group."""
-        for group_id, group in self.state["groups"].items():
-            if group["type"] == "department" and group.get("department") == department:
-                try:
-                    client = self.client_pool.get_random_client()
-                    success = await asyncio.to_thread(
-                        client.add_user_to_group,
-                        user_id=user_id,
-                        group_id=group_id
-                    )
-                    if success:
-                        self.state["users"][user_id]["groups"].append(group_id)
-                        group["member_count"] += 1
-                except Exception:
-                    pass
-                break
+        group_id = self._find_group_id("department", department)
+        if group_id:
+            try:
+                client = self.client_pool.get_next_client()
+                success = await self._call(
+                    client.add_user_to_group,
+                    user_id=user_id,
+                    group_id=group_id
+                )
+                if success:
+                    user_data = self.state["users"][user_id]
+                    user_data["groups"].append(group_id)
+                    self._index_user_memberships(user_data)
+                    self._change_member_count(group_id, 1)
+            except Exception:
+                pass
 
     async def _assign_basic_apps(self, user_id: str):
         """Assign basic apps to a new user."""
         basic_apps = ["Slack", "Zoom", "Microsoft 365"]
+        now_iso = self._now_iso()
 
         for app_name in basic_apps:
             if app_name in self.app_catalog:
                 try:
-                    client = self.client_pool.get_random_client()
+                    client = self.client_pool.get_next_client()
                     app_id = self.app_catalog[app_name]
 
-                    assignment = await asyncio.to_thread(
+                    assignment = await self._call(
                         client.assign_user_to_app,
                         user_id=user_id,
                         app_id=app_id
@@ -1254,104 +1881,43 @@ class OktaService(BaseService):
                             "app_id": app_id,
                             "app_name": app_name,
                             "user_id": user_id,
-                            "assigned_at": datetime.now(timezone.utc).isoformat(),
+                            "assigned_at": now_iso,
                             "assigned_by": client.user_name
                         }
-                        self.state["users"][user_id]["apps"].append(app_id)
+                        user_data = self.state["users"][user_id]
+                        user_data["apps"].append(app_id)
+                        self._index_user_memberships(user_data)
                 except Exception:
                     pass
 
     def _generate_first_name(self) -> str:
         """Generate a random first name."""
-        first_names = [
-            "John", "Jane", "Michael", "Sarah", "David", "Emily", "Robert", "Lisa",
-            "James", "Mary", "William", "Patricia", "Richard", "Jennifer", "Thomas",
-            "Linda", "Charles", "Elizabeth", "Joseph", "Barbara", "Christopher", "Susan",
-            "Daniel", "Jessica", "Matthew", "Karen", "Anthony", "Nancy", "Mark", "Betty",
-            "Paul", "Dorothy", "Steven", "Sandra", "Andrew", "Ashley", "Kenneth", "Kimberly",
-            "Joshua", "Donna", "Kevin", "Michelle", "Brian", "Carol", "George", "Amanda"
-        ]
-        return random.choice(first_names)
+        return self._rng.choice(self.FIRST_NAMES)
 
     def _generate_last_name(self) -> str:
         """Generate a random last name."""
-        last_names = [
-            "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-            "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
-            "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
-            "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker",
-            "Young", "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill",
-            "Flores", "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell"
-        ]
-        return random.choice(last_names)
+        return self._rng.choice(self.LAST_NAMES)
 
     def _generate_job_title(self, department: str) -> str:
         """Generate a job title appropriate for the department."""
-        titles_by_dept = {
-            "Engineering": [
-                "Software Engineer", "Senior Software Engineer", "Staff Engineer",
-                "Engineering Manager", "DevOps Engineer", "QA Engineer", "Data Engineer"
-            ],
-            "Sales": [
-                "Sales Representative", "Account Executive", "Sales Manager",
-                "Business Development Representative", "Account Manager", "Sales Director"
-            ],
-            "Marketing": [
-                "Marketing Manager", "Content Marketing Specialist", "SEO Specialist",
-                "Marketing Director", "Brand Manager", "Product Marketing Manager"
-            ],
-            "Product": [
-                "Product Manager", "Senior Product Manager", "Product Designer",
-                "UX Designer", "Product Owner", "Product Director"
-            ],
-            "Finance": [
-                "Accountant", "Financial Analyst", "Controller", "CFO",
-                "Accounts Payable Specialist", "Financial Manager", "Bookkeeper"
-            ],
-            "HR": [
-                "HR Manager", "Recruiter", "HR Business Partner", "HR Director",
-                "Talent Acquisition Specialist", "HR Coordinator", "People Operations Manager"
-            ],
-            "IT": [
-                "IT Support Specialist", "System Administrator", "Network Engineer",
-                "IT Manager", "Security Engineer", "Database Administrator", "IT Director"
-            ],
-            "Operations": [
-                "Operations Manager", "Operations Analyst", "Supply Chain Manager",
-                "Operations Director", "Business Analyst", "Process Improvement Specialist"
-            ],
-            "Customer Success": [
-                "Customer Success Manager", "Support Specialist", "Customer Success Director",
-                "Technical Support Engineer", "Account Manager", "Implementation Specialist"
-            ],
-            "Legal": [
-                "Legal Counsel", "Contract Manager", "Compliance Officer",
-                "Paralegal", "Legal Director", "Corporate Attorney"
-            ]
-        }
-
-        # Default titles if department not found
-        default_titles = [
-            "Specialist", "Manager", "Analyst", "Coordinator", "Associate", "Director"
-        ]
-
-        dept_titles = titles_by_dept.get(department, default_titles)
-        return random.choice(dept_titles)
+        return self._rng.choice(self.JOB_TITLES_BY_DEPARTMENT.get(department, self.DEFAULT_JOB_TITLES))
 
     def _log_activity(self, activity_type: str, status: str, details: str = None):
         """Log activity to state."""
         activity = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._now_iso(),
             "activity_type": activity_type,
             "status": status,
             "details": details
         }
 
-        self.state["activity_log"].append(activity)
-
-        # Keep only last 1000 activities
-        if len(self.state["activity_log"]) > 1000:
-            self.state["activity_log"] = self.state["activity_log"][-1000:]
+        # The log is a bounded deque that drops its oldest entry on append. State
+        # loaded from disk (or swapped in by the API server) holds a plain list.
+        activity_log = self.state.get("activity_log")
+        if not isinstance(activity_log, deque):
+            activity_log = deque(activity_log or (), maxlen=self.ACTIVITY_LOG_LIMIT)
+            self.state["activity_log"] = activity_log
+        activity_log.append(activity)
 
     # Override abstract methods that don't apply to Okta
     async def _create_project(self) -> Optional[Dict[str, Any]]:
@@ -1372,7 +1938,7 @@ class OktaService(BaseService):
         Returns:
             Dictionary with cleanup results
         """
-        print(f"Starting cleanup for job {self.job_id}...")
+        logger.info(f"Starting cleanup for job {self.job_id}...")
 
         results = {
             "users_deleted": 0,
@@ -1381,107 +1947,140 @@ class OktaService(BaseService):
             "errors": []
         }
 
+        # Okta drops a user's app assignments when the user is deleted, so only
+        # assignments for users this job isn't deleting need their own call
+        users = self.state.get("users", {})
+        assignments_by_user: Dict[str, int] = defaultdict(int)
+        orphan_assignments = {}
+        for assignment_id, assignment in self.state.get("app_assignments", {}).items():
+            if assignment["user_id"] in users:
+                assignments_by_user[assignment["user_id"]] += 1
+            else:
+                orphan_assignments[assignment_id] = assignment
+
         # Calculate total operations
         total_operations = (
-            len(self.state.get("users", {})) * 2 +  # Deactivate + delete
+            len(users) * 2 +  # Deactivate + delete
             len(self.state.get("groups", {})) +
-            len(self.state.get("app_assignments", {}))
+            len(orphan_assignments)
         )
         current_operation = 0
 
-        # Step 1: Remove app assignments
-        print("Removing app assignments...")
-        for assignment_id, assignment in self.state.get("app_assignments", {}).items():
+        def report_progress(message: str):
+            nonlocal current_operation
+            current_operation += 1
+            if progress_callback:
+                progress_callback(current_operation, total_operations, message)
+
+        # Each step fans out under a semaphore rather than awaiting one call (plus
+        # a fixed sleep) at a time. Cleanup runs on its own event loop, so it
+        # gets its own semaphore instead of the one bound to the run loop.
+        cleanup_slots = asyncio.Semaphore(
+            self.config.get("concurrent_requests", self.DEFAULT_CONCURRENT_REQUESTS)
+        )
+
+        async def call_limited(func, *args, **kwargs):
+            """Run a client call within the rate budget, retrying rate limits."""
+            async def attempt():
+                async with self._limiter:
+                    return await self._call(func, *args, **kwargs)
+            # Only rate limits - a delete retried after a server error that had
+            # already gone through would get a 404 and count as a failure
+            return await retry_with_backoff(attempt, retry_if=is_rate_limit_error)
+
+        async def remove_assignment(assignment_id: str, assignment: Dict[str, Any]):
             try:
-                client = self.client_pool.get_random_client()
-                success = await asyncio.to_thread(
-                    client.remove_user_from_app,
-                    user_id=assignment["user_id"],
-                    app_id=assignment["app_id"]
-                )
+                async with cleanup_slots:
+                    client = self.client_pool.get_next_client()
+                    success = await call_limited(
+                        client.remove_user_from_app,
+                        user_id=assignment["user_id"],
+                        app_id=assignment["app_id"]
+                    )
                 if success:
                     results["assignments_removed"] += 1
 
-                current_operation += 1
-                if progress_callback:
-                    progress_callback(
-                        current_operation,
-                        total_operations,
-                        f"Removing app assignment {current_operation}/{len(self.state.get('app_assignments', {}))}"
-                    )
-
-                await asyncio.sleep(0.1)
+                report_progress(
+                    f"Removing app assignment {current_operation + 1}/{len(orphan_assignments)}"
+                )
 
             except Exception as e:
                 results["errors"].append(f"Error removing assignment {assignment_id}: {e}")
 
-        # Step 2: Deactivate and delete users
-        print("Deactivating and deleting users...")
-        for user_id, user_data in self.state.get("users", {}).items():
+        async def delete_user(user_id: str, user_data: Dict[str, Any]):
+            # Deactivate and delete stay in order for each user; users run concurrently
             try:
-                client = self.client_pool.get_random_client()
+                async with cleanup_slots:
+                    client = self.client_pool.get_next_client()
 
-                # First deactivate if active
-                if user_data.get("status") == "ACTIVE":
-                    await asyncio.to_thread(client.deactivate_user, user_id)
+                    # First deactivate if active
+                    if user_data.get("status") == "ACTIVE":
+                        await call_limited(client.deactivate_user, user_id)
 
-                current_operation += 1
-                if progress_callback:
-                    progress_callback(
-                        current_operation,
-                        total_operations,
+                    report_progress(
                         f"Deactivating user {user_data['profile']['firstName']} {user_data['profile']['lastName']}"
                     )
 
-                await asyncio.sleep(0.2)
-
-                # Then delete
-                success = await asyncio.to_thread(client.delete_user, user_id)
+                    # Then delete
+                    success = await call_limited(client.delete_user, user_id)
                 if success:
                     results["users_deleted"] += 1
+                    results["assignments_removed"] += assignments_by_user.get(user_id, 0)
 
-                current_operation += 1
-                if progress_callback:
-                    progress_callback(
-                        current_operation,
-                        total_operations,
-                        f"Deleting user {user_data['profile']['firstName']} {user_data['profile']['lastName']}"
-                    )
-
-                await asyncio.sleep(0.2)
+                report_progress(
+                    f"Deleting user {user_data['profile']['firstName']} {user_data['profile']['lastName']}"
+                )
 
             except Exception as e:
                 results["errors"].append(f"Error deleting user {user_id}: {e}")
 
-        # Step 3: Delete groups
-        print("Deleting groups...")
-        for group_id, group_data in self.state.get("groups", {}).items():
+        async def delete_group(group_id: str, group_data: Dict[str, Any]):
             try:
-                client = self.client_pool.get_random_client()
-                success = await asyncio.to_thread(client.delete_group, group_id)
+                async with cleanup_slots:
+                    client = self.client_pool.get_next_client()
+                    success = await call_limited(client.delete_group, group_id)
                 if success:
                     results["groups_deleted"] += 1
 
-                current_operation += 1
-                if progress_callback:
-                    progress_callback(
-                        current_operation,
-                        total_operations,
-                        f"Deleting group {group_data['name']}"
-                    )
-
-                await asyncio.sleep(0.1)
+                report_progress(f"Deleting group {group_data['name']}")
 
             except Exception as e:
                 results["errors"].append(f"Error deleting group {group_id}: {e}")
 
+        # Step 1: Remove app assignments that user deletion won't cover
+        logger.info("Removing app assignments...")
+        await asyncio.gather(*(
+            remove_assignment(assignment_id, assignment)
+            for assignment_id, assignment in orphan_assignments.items()
+        ))
+
+        # Step 2: Deactivate and delete users (along with their app assignments)
+        logger.info("Deactivating and deleting users...")
+        await asyncio.gather(*(
+            delete_user(user_id, user_data)
+            for user_id, user_data in users.items()
+        ))
+
+        # Step 3: Delete groups (once their members are gone)
+        logger.info("Deleting groups...")
+        await asyncio.gather(*(
+            delete_group(group_id, group_data)
+            for group_id, group_data in self.state.get("groups", {}).items()
+        ))
+
         # Mark as deleted
         self.deleted = True
 
-        print(f"✓ Cleanup completed:")
-        print(f"  - Users deleted: {results['users_deleted']}")
-        print(f"  - Groups deleted: {results['groups_deleted']}")
-        print(f"  - Assignments removed: {results['assignments_removed']}")
-        print(f"  - Errors: {len(results['errors'])}")
+        # The cleanup service isn't used again, so release its client call threads
+        self._executor.shutdown(wait=False)
+
+        logger.info("\n".join([
+            "✓ Cleanup completed:",
+            f"  - Users deleted: {results['users_deleted']}",
+            f"  - Groups deleted: {results['groups_deleted']}",
+            f"  - Assignments removed: {results['assignments_removed']}",
+            f"  - Errors: {len(results['errors'])}"
+        ]))
+        await asyncio.to_thread(flush_logs)
 
         return results
\ No newline at end of file
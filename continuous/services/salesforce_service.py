@@ -13,13 +13,22 @@ Simulates realistic CRM and sales activity including:
 """
 
 import asyncio
+import atexit
+import bisect
+import functools
+import itertools
 import random
 import string
+import threading
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from continuous.services.base_service import BaseService
+from continuous.indexed_set import IndexedSet
+from continuous.rate_limiter import AsyncRateLimiter, backoff_delay, is_rate_limit_error, retry_with_backoff
 from continuous.llm_generator import LLMGenerator
 from continuous.state_manager import StateManager
 from continuous.scheduler import ActivityScheduler, ActivityType
@@ -98,6 +107,128 @@ class SalesforceService(BaseService):
     customer relationship management, and support case lifecycles.
     """
 
+    # Default cap on Salesforce requests in flight at once (config key: concurrent_requests)
+    DEFAULT_CONCURRENT_REQUESTS = 5
+
+    # Worker threads for blocking Salesforce client calls (see _call)
+    API_WORKERS = 16
+
+    # Sustained Salesforce request rate for setup work (token bucket, burst of the
+    # same size; config key: requests_per_second)
+    DEFAULT_REQUESTS_PER_SECOND = 10
+
+    # Minimum seconds between writes of the CRM data to the job file
+    STATE_SAVE_INTERVAL = 120
+
+    # Most recent activities kept in the job's activity_log
+    ACTIVITY_LOG_LIMIT = 1000
+
+    # State keys this service changes in memory; everything else in the job file
+    # (status, schedule, errors) is written directly by the state manager
+    ORG_STATE_KEYS = ("accounts", "contacts", "opportunities", "cases", "leads",
+                      "users", "campaigns", "products", "activity_log")
+
+    # Bounds in seconds for the jittered backoff after a rate limit error in the main loop
+    RATE_LIMIT_MIN_PAUSE = 30
+    RATE_LIMIT_MAX_PAUSE = 300
+
+    # Choice tables built once from the templates instead of on every draw;
+    # weighted tables hold cumulative weights so random.choices skips the sum
+    ACCOUNT_TYPE_KEYS = tuple(ACCOUNT_TYPES)
+    OPPORTUNITY_TYPE_KEYS = tuple(OPPORTUNITY_TYPES)
+    ACCOUNT_SEGMENT_KEYS = tuple(ACCOUNT_SEGMENTS)
+    ACCOUNT_SEGMENT_CUM_WEIGHTS = tuple(itertools.accumulate(
+        config["percentage"] for config in ACCOUNT_SEGMENTS.values()
+    ))
+    CONTACT_ROLE_KEYS = tuple(CONTACT_ROLES)
+    # Weight decision makers and champions higher
+    CONTACT_ROLE_CUM_WEIGHTS = tuple(itertools.accumulate((3, 2, 3, 2, 1, 1)[:len(CONTACT_ROLES)]))
+    CONTACT_ROLE_TITLES = {role: tuple(config["typical_titles"]) for role, config in CONTACT_ROLES.items()}
+    LEAD_SOURCE_KEYS = tuple(source for sources in LEAD_SOURCES.values() for source in sources)
+    LEAD_SOURCE_CUM_WEIGHTS = tuple(itertools.accumulate(
+        weight for sources in LEAD_SOURCES.values() for weight in sources.values()
+    ))
+    CASE_TYPE_KEYS = tuple(CASE_TEMPLATES["types"])
+    CASE_TYPE_CUM_WEIGHTS = tuple(itertools.accumulate(
+        config["percentage"] for config in CASE_TEMPLATES["types"].values()
+    ))
+    CASE_PRIORITY_KEYS = tuple(CASE_TEMPLATES["priorities"])
+    CASE_PRIORITY_CUM_WEIGHTS = tuple(itertools.accumulate(
+        config["percentage"] for config in CASE_TEMPLATES["priorities"].values()
+    ))
+    CASE_ORIGIN_KEYS = tuple(CASE_TEMPLATES["origins"])
+    CASE_ORIGIN_CUM_WEIGHTS = tuple(itertools.accumulate(CASE_TEMPLATES["origins"].values()))
+
+    # Record states that make an activity eligible (see _record_buckets)
+    QUALIFIED_LEAD_STATUSES = ("Working - Contacted", "Qualified")
+    LATE_STAGE_PROBABILITY = 60
+    ESCALATABLE_PRIORITIES = ("High", "Critical")
+
+    # Next open stage for each B2B enterprise pipeline stage; stages missing here
+    # are the last open stage or closed (see _select_next_opportunity_stage)
+    NEXT_OPPORTUNITY_STAGES = {
+        current["name"]: following
+        for current, following in zip(SALES_PROCESS_TEMPLATES["b2b_enterprise"]["stages"][:-2],
+                                      SALES_PROCESS_TEMPLATES["b2b_enterprise"]["stages"][1:])
+        if not following.get("is_closed")
+    }
+
+    # Most recent generated account names the LLM is told to avoid repeating
+    RECENT_ACCOUNT_NAMES = 10
+
+    # Company names whose email domains are cached - new contacts land on
+    # existing accounts, so the same names come up again and again
+    EMAIL_DOMAIN_CACHE_SIZE = 1024
+
+    # Names drawn by _generate_first_name / _generate_last_name / _draw_names
+    FIRST_NAMES = (
+        "John", "Jane", "Michael", "Sarah", "David", "Emily", "Robert", "Lisa",
+        "James", "Mary", "William", "Patricia", "Richard", "Jennifer", "Thomas",
+        "Linda", "Charles", "Elizabeth", "Joseph", "Barbara", "Christopher", "Susan",
+        "Daniel", "Jessica", "Matthew", "Karen", "Anthony", "Nancy", "Mark", "Betty",
+        "Paul", "Dorothy", "Steven", "Sandra", "Andrew", "Ashley", "Kenneth", "Kimberly"
+    )
+    LAST_NAMES = (
+        "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+        "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
+        "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
+        "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker"
+    )
+
+    # Support case subjects by case type
+    CASE_SUBJECTS = {
+        "Question": (
+            "How to configure user permissions",
+            "Need help with report generation",
+            "Question about billing cycle",
+            "Feature clarification needed"
+        ),
+        "Problem": (
+            "Unable to access dashboard",
+            "Error when saving records",
+            "Performance issues",
+            "Integration not working"
+        ),
+        "Feature Request": (
+            "Request: Add custom field support",
+            "Enhancement: Bulk update capability",
+            "New feature: Mobile app support",
+            "Improvement: Better search functionality"
+        ),
+        "Bug": (
+            "Bug: Data not syncing correctly",
+            "Issue: Incorrect calculations",
+            "Error: Null pointer exception",
+            "Defect: Missing validation"
+        ),
+        "Billing": (
+            "Billing inquiry for last invoice",
+            "Need to update payment method",
+            "Question about contract renewal",
+            "Dispute charge on account"
+        )
+    }
+
     def __init__(self, config: Dict[str, Any], state_manager: StateManager,
                  llm_generator: Optional[LLMGenerator] = None,
                  client_pool: Optional[SalesforceClientPool] = None):
@@ -133,12 +264,166 @@ class SalesforceService(BaseService):
         # Activity weights for different operations
         self.activity_weights = self._calculate_activity_weights()
 
-        # Cache for generated account names to avoid duplicates
-        self._generated_account_names = set()
+        # Activity order and weights for _select_activity_type, with the cumulative
+        # weights rebuilt only when the set of eligible activities changes
+        self._activity_keys = tuple(self.activity_weights)
+        self._activity_base_weights = tuple(self.activity_weights.values())
+        self._eligible_activities: Tuple[bool, ...] = ()
+        self._cum_weights: List[int] = []
+
+        # State checks for activities that need existing records; activities
+        # missing from the table are always eligible
+        self._activity_eligibility: Dict[str, Callable[[], bool]] = {
+            # Lead activities require leads
+            SalesforceActivityType.CONVERT_LEAD: lambda: self._bucket_count("qualified_leads") >= 3,
+            SalesforceActivityType.QUALIFY_LEAD: lambda: self._bucket_count("new_leads") >= 2,
+
+            # Opportunity activities require open opportunities
+            SalesforceActivityType.UPDATE_OPPORTUNITY_STAGE:
+                lambda: self._bucket_count("open_opportunities") >= 2,
+            SalesforceActivityType.CLOSE_OPPORTUNITY_WON:
+                lambda: self._bucket_count("late_stage_opportunities") >= 1,
+            SalesforceActivityType.CLOSE_OPPORTUNITY_LOST:
+                lambda: self._bucket_count("late_stage_opportunities") >= 1,
+
+            # Case activities require accounts with customer type
+            SalesforceActivityType.CREATE_CASE: lambda: self._bucket_count("customer_accounts") >= 1,
+            SalesforceActivityType.UPDATE_CASE: lambda: self._bucket_count("open_cases") >= 1,
+            SalesforceActivityType.CLOSE_CASE: lambda: self._bucket_count("open_cases") >= 1,
+            SalesforceActivityType.ESCALATE_CASE: lambda: self._bucket_count("escalatable_cases") >= 1,
+
+            # Activity logging requires opportunities or accounts
+            SalesforceActivityType.LOG_CALL: self._has_related_records,
+            SalesforceActivityType.LOG_EMAIL: self._has_related_records,
+            SalesforceActivityType.LOG_MEETING: self._has_related_records,
+            SalesforceActivityType.CREATE_TASK: self._has_related_records,
+
+            # Campaign activities
+            SalesforceActivityType.ADD_CAMPAIGN_MEMBER:
+                lambda: len(self.state["campaigns"]) >= 1 and len(self.state["contacts"]) >= 1
+        }
+
+        # Latest generated account names, oldest first - bounded so long-running
+        # jobs don't accumulate every name ever generated
+        self._generated_account_names = deque(maxlen=self.RECENT_ACCOUNT_NAMES)
+
+        # Bounds concurrent Salesforce requests when setup work is fanned out with gather
+        self._request_semaphore = asyncio.Semaphore(
+            config.get("concurrent_requests", self.DEFAULT_CONCURRENT_REQUESTS)
+        )
+
+        # Paces setup requests instead of sleeping after each one
+        self._limiter = AsyncRateLimiter(
+            max_rate=config.get("requests_per_second", self.DEFAULT_REQUESTS_PER_SECOND),
+            time_period=1
+        )
+
+        # ISO timestamp shared by every state change within the same second
+        self._now_iso_second = -1
+        self._now_iso_value = ""
+
+        # CRM data changed since the last save (activities no longer save individually)
+        self._state_dirty = False
+        self._last_save = time.monotonic()
+
+        # Serializes CRM data writes between the run loop and the exit hook
+        self._save_lock = threading.Lock()
+
+        # Dedicated threads for Salesforce client calls, sized for the request cap
+        # instead of sharing the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.API_WORKERS, thread_name_prefix="salesforce"
+        )
+
+        # Consecutive main loop iterations that hit a rate limit (drives the backoff)
+        self._rate_limit_strikes = 0
+
+        # ID lists behind _record_ids, with the collection dict they were built from
+        self._record_id_lists: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+
+        # Record IDs per eligibility bucket (new_leads, open_cases, ...), built
+        # from state on first use and kept current by _track_record
+        self._buckets: Optional[Dict[str, IndexedSet[str]]] = None
+
+        # Handler coroutine for each activity type, looked up once per activity
+        self._activity_handlers = {
+            SalesforceActivityType.CREATE_LEAD: self._handle_create_lead,
+            SalesforceActivityType.CONVERT_LEAD: self._handle_convert_lead,
+            SalesforceActivityType.QUALIFY_LEAD: self._handle_qualify_lead,
+            SalesforceActivityType.CREATE_OPPORTUNITY: self._handle_create_opportunity,
+            SalesforceActivityType.UPDATE_OPPORTUNITY_STAGE: self._handle_update_opportunity_stage,
+            SalesforceActivityType.ADD_OPPORTUNITY_PRODUCT: self._handle_add_opportunity_product,
+            SalesforceActivityType.CLOSE_OPPORTUNITY_WON: self._handle_close_opportunity_won,
+            SalesforceActivityType.CLOSE_OPPORTUNITY_LOST: self._handle_close_opportunity_lost,
+            SalesforceActivityType.CREATE_ACCOUNT: self._handle_create_account,
+            SalesforceActivityType.UPDATE_ACCOUNT: self._handle_update_account,
+            SalesforceActivityType.CREATE_CONTACT: self._handle_create_contact,
+            SalesforceActivityType.UPDATE_CONTACT: self._handle_update_contact,
+            SalesforceActivityType.CREATE_CASE: self._handle_create_case,
+            SalesforceActivityType.UPDATE_CASE: self._handle_update_case,
+            SalesforceActivityType.CLOSE_CASE: self._handle_close_case,
+            SalesforceActivityType.ESCALATE_CASE: self._handle_escalate_case,
+            SalesforceActivityType.LOG_CALL: self._handle_log_call,
+            SalesforceActivityType.LOG_EMAIL: self._handle_log_email,
+            SalesforceActivityType.LOG_MEETING: self._handle_log_meeting,
+            SalesforceActivityType.CREATE_TASK: self._handle_create_task,
+            SalesforceActivityType.CREATE_CAMPAIGN: self._handle_create_campaign,
+            SalesforceActivityType.ADD_CAMPAIGN_MEMBER: self._handle_add_campaign_member
+        }
 
         print(f"✓ Salesforce service initialized - Job ID: {self.job_id}")
         print(f"  Industry: {self.industry}, Org Size: {self.org_size}")
 
+    async def _call(self, fn, *args, **kwargs):
+        """
+        Run a blocking Salesforce client call on the service's executor.
+
+        Args:
+            fn: Client method to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Whatever fn returns
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def _limited_call(self, fn, *args, **kwargs):
+        """
+        Run a blocking Salesforce client call under the request cap and rate limiter.
+
+        Rate limits are retried with jittered backoff. Server errors are not: the
+        calls made here create records, and a 5xx or gateway timeout can arrive
+        after Salesforce has committed them, so a retry would duplicate them.
+
+        Args:
+            fn: Client method to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Whatever fn returns
+        """
+        async def attempt():
+            async with self._request_semaphore, self._limiter:
+                return await self._call(fn, *args, **kwargs)
+
+        return await retry_with_backoff(attempt, retry_if=is_rate_limit_error)
+
+    def _now_iso(self) -> str:
+        """
+        Get the current UTC time as an ISO string, formatted at most once per second.
+
+        Returns:
+            ISO 8601 timestamp
+        """
+        second = time.monotonic_ns() // 1_000_000_000
+        if second != self._now_iso_second:
+            self._now_iso_second = second
+            self._now_iso_value = datetime.now(timezone.utc).isoformat()
+        return self._now_iso_value
+
     def _calculate_activity_weights(self) -> Dict[str, int]:
         """
         Calculate activity weights based on org size and sales process.
@@ -199,12 +484,29 @@ class SalesforceService(BaseService):
 
     async def run(self):
         """Main loop - runs continuously until stopped."""
+        # Services run in daemon threads, so an API server shutdown never reaches
+        # the loop's exit path - save unsaved CRM data from an exit hook instead.
+        # The hook stays registered if the loop dies with an exception, since
+        # nothing else saves in that case.
+        atexit.register(self._save_on_exit)
+        try:
+            await self._run_generation()
+        finally:
+            # The service isn't run again, so release its client call threads
+            self._executor.shutdown(wait=False)
+        atexit.unregister(self._save_on_exit)
+
+    async def _run_generation(self):
+        """Set up the org if needed, then generate activity until stopped or deleted."""
         self.running = True
 
         # Check if we need initial setup
         initial_generation = len(self.state.get("accounts", {})) == 0
 
         if initial_generation:
+            # Setup creates records before its final save - an exit hook firing
+            # part way through must still write them
+            self._state_dirty = True
             self.state_manager.update_job_status(self.job_id, "initializing")
             print(f"Initializing Salesforce CRM organization for {self.industry}...")
             await self._plan_initialization()
@@ -219,15 +521,34 @@ class SalesforceService(BaseService):
             self.state_manager.update_job_status(self.job_id, "running")
             print("Resuming Salesforce activity generation...")
 
+        # Set by the state manager when the job is stopped or marked for deletion
+        status_changed = self.state_manager.status_changed_event(self.job_id)
+
         # Main activity loop
         while self.running and self._should_continue():
             try:
                 if self.paused:
-                    await asyncio.sleep(60)
+                    # Block until the job's status changes (resume, deletion)
+                    # rather than polling - the wait still times out every minute
+                    woken = await asyncio.to_thread(status_changed.wait, 60)
+                    if woken and self.paused:
+                        status_changed.clear()
+                    if woken and self.paused and not self.deleted:
+                        # Still paused (or stopped, which stays resumable) - only
+                        # a deletion ends the loop here
+                        disk_state = self.state_manager.load_state(self.job_id)
+                        if disk_state is None or disk_state.get("_deleting"):
+                            print(f"[Job {self.job_id}] Deletion marker detected - exiting")
+                            self.running = False
+                            self.deleted = True
+                            return
+                        self._merge_disk_state(disk_state)
                     continue
 
-                # Check for deletion marker
-                if not self.deleted:
+                # Check for deletion marker - the job file is only re-read
+                # after its status has changed
+                if not self.deleted and status_changed.is_set():
+                    status_changed.clear()
                     disk_state = self.state_manager.load_state(self.job_id)
                     if disk_state is None or disk_state.get("_deleting"):
                         print(f"[Job {self.job_id}] Deletion marker detected - exiting")
@@ -238,9 +559,13 @@ class SalesforceService(BaseService):
                     if disk_state.get("status") == "stopped":
                         print(f"[Job {self.job_id}] Job stopped - exiting")
                         self.running = False
+                        self._save_org_state()
                         return
 
-                    self.state = disk_state
+                    self._merge_disk_state(disk_state)
+
+                if not self.deleted and time.monotonic() - self._last_save >= self.STATE_SAVE_INTERVAL:
+                    self._save_org_state()
 
                 # Check if it's time for activity
                 current_time = datetime.now(timezone.utc)
@@ -249,13 +574,17 @@ class SalesforceService(BaseService):
                     await self._generate_activity()
 
                     # Update next activity time
-                    next_time = self.scheduler.get_next_activity_time(current_time)
-                    self.state_manager.update_next_activity_time(self.job_id, next_time.isoformat())
+                    next_time = self.scheduler.get_next_activity_time(current_time).isoformat()
+                    self.state["next_activity_time"] = next_time
+                    self.state_manager.update_next_activity_time(self.job_id, next_time)
                 else:
                     # Update next activity time if not set
                     if not self.state.get("next_activity_time"):
-                        next_time = self.scheduler.get_next_activity_time(current_time)
-                        self.state_manager.update_next_activity_time(self.job_id, next_time.isoformat())
+                        next_time = self.scheduler.get_next_activity_time(current_time).isoformat()
+                        self.state["next_activity_time"] = next_time
+                        self.state_manager.update_next_activity_time(self.job_id, next_time)
+
+                self._rate_limit_strikes = 0
 
                 # Sleep before next check
                 await asyncio.sleep(random.randint(30, 90))
@@ -263,8 +592,13 @@ class SalesforceService(BaseService):
             except SalesforceRateLimitError as e:
                 print(f"⚠ Rate limit hit: {e}")
                 self.state_manager.log_error(self.job_id, "rate_limit", str(e))
-                # Pause for an hour
-                await asyncio.sleep(3600)
+                self._save_org_state()
+                # Back off exponentially (with jitter) while the limit persists
+                pause = backoff_delay(e, self._rate_limit_strikes,
+                                      base_delay=self.RATE_LIMIT_MIN_PAUSE,
+                                      max_delay=self.RATE_LIMIT_MAX_PAUSE)
+                self._rate_limit_strikes += 1
+                await asyncio.sleep(min(self.RATE_LIMIT_MAX_PAUSE, max(self.RATE_LIMIT_MIN_PAUSE, pause)))
 
             except Exception as e:
                 print(f"✗ Error in main loop: {e}")
@@ -272,9 +606,61 @@ class SalesforceService(BaseService):
                 await asyncio.sleep(300)  # 5 minutes before retry
 
         # Clean shutdown
+        self._save_org_state()
         self.state_manager.update_job_status(self.job_id, "stopped")
         print(f"Salesforce generation stopped for job {self.job_id}")
 
+    def _merge_disk_state(self, disk_state: Dict[str, Any]):
+        """
+        Take the fields other parties write from a freshly loaded job file.
+
+        Only this service changes the CRM data, so the in-memory copy (and the
+        bucket counts kept over it) is kept and just the other top-level fields
+        are updated, instead of swapping in the whole loaded object.
+
+        Args:
+            disk_state: State loaded from the job file
+        """
+        for key, value in disk_state.items():
+            if key not in self.ORG_STATE_KEYS:
+                self.state[key] = value
+
+    def _save_org_state(self):
+        """
+        Write unsaved CRM data to the job file.
+
+        The file is re-read first so status, schedule and error fields written by
+        other parties are kept, and nothing is written once the job is being deleted.
+        """
+        with self._save_lock:
+            if self.deleted or not self._state_dirty:
+                return
+
+            disk_state = self.state_manager.load_state(self.job_id)
+            if disk_state is None or disk_state.get("_deleting"):
+                return
+
+            self._merge_disk_state(disk_state)
+
+            # Recount with the error total from the file
+            self._update_stats()
+            self.state_manager.save_state(self.job_id, self.state)
+
+            self._state_dirty = False
+            self._last_save = time.monotonic()
+
+    def _save_on_exit(self):
+        """
+        Final save when the interpreter exits while the run loop is still going.
+
+        Without it, accounts, leads and cases created since the last periodic save
+        exist in Salesforce but not in the job file, so cleanup could not find them.
+        """
+        try:
+            self._save_org_state()
+        except Exception as e:
+            print(f"✗ Error saving state on exit for job {self.job_id}: {e}")
+
     async def _plan_initialization(self):
         """
         Pre-compute initialization totals BEFORE creating any objects.
@@ -329,7 +715,7 @@ class SalesforceService(BaseService):
             "completed_opportunities": 0,
             "completed_campaigns": 0,
             "completed_leads": 0,
-            "start_time": datetime.now(timezone.utc).isoformat(),
+            "start_time": self._now_iso(),
             "estimated_duration_seconds": int(estimated_duration)
         }
 
@@ -379,18 +765,23 @@ class SalesforceService(BaseService):
         # Step 2: Create initial accounts
         await self._create_initial_accounts()
 
-        # Step 3: Create contacts for each account
-        await self._create_initial_contacts()
-
-        # Step 4: Create initial opportunities
-        await self._create_initial_opportunities()
+        # Steps 3-6 only depend on the accounts and users, so they run concurrently
+        # (the request semaphore and rate limiter still bound the combined load)
+        steps = [
+            # Step 3: Create contacts for each account
+            self._create_initial_contacts(),
+            # Step 4: Create initial opportunities
+            self._create_initial_opportunities()
+        ]
 
         # Step 5: Create campaigns (if enterprise)
         if self.org_size == "enterprise":
-            await self._create_initial_campaigns()
+            steps.append(self._create_initial_campaigns())
 
         # Step 6: Create some initial leads
-        await self._create_initial_leads()
+        steps.append(self._create_initial_leads())
+
+        await asyncio.gather(*steps)
 
         # Update stats and save state
         self._update_stats()
@@ -405,10 +796,10 @@ class SalesforceService(BaseService):
     async def _fetch_salesforce_users(self):
         """Fetch active Salesforce users for assignment to records."""
         print("Fetching Salesforce users...")
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         try:
-            users = await asyncio.to_thread(
+            users = await self._call(
                 client.get_workspace_users,
                 workspace_gid=""  # Not used in Salesforce
             )
@@ -432,118 +823,159 @@ class SalesforceService(BaseService):
 
         print(f"Creating {num_accounts} initial accounts...")
 
-        account_count = 0
+        # Roll every account's details up front so the creates can be batched
+        specs = []
         for account_type, count in account_distribution.items():
             for i in range(count):
-                try:
-                    # Generate account data
-                    account_name = self._generate_account_name(account_type)
-
-                    # Select account segment (enterprise, mid-market, SMB)
-                    segment = self._select_account_segment()
-                    segment_config = ACCOUNT_SEGMENTS[segment]
-
-                    # Generate realistic revenue
-                    revenue_range = segment_config["annual_revenue_range"]
-                    annual_revenue = random.randint(revenue_range[0], revenue_range[1])
-
-                    client = self.client_pool.get_random_client()
-
-                    # Create account
-                    account = await asyncio.to_thread(
-                        client.create_project,
-                        workspace_gid="",  # Not used
-                        name=account_name,
-                        notes=f"{account_type} account in {self.industry} industry",
-                        industry=self.industry.title(),
-                        annual_revenue=annual_revenue
-                    )
-
-                    if account:
-                        self.state["accounts"][account["gid"]] = {
-                            "id": account["gid"],
+                # Generate account data
+                account_name = self._generate_account_name(account_type)
+
+                # Select account segment (enterprise, mid-market, SMB)
+                segment = self._select_account_segment()
+
+                # Generate realistic revenue
+                revenue_range = ACCOUNT_SEGMENTS[segment]["annual_revenue_range"]
+                annual_revenue = random.randint(revenue_range[0], revenue_range[1])
+
+                specs.append((account_type, account_name, segment, annual_revenue))
+
+        # Accounts go out in composite requests of up to 200 records each
+        batch_size = SalesforceConnection.COMPOSITE_MAX_RECORDS
+        batches = [specs[i:i + batch_size] for i in range(0, len(specs), batch_size)]
+
+        account_count = 0
+
+        async def create_account_batch(batch: List[Tuple[str, str, str, int]]):
+            nonlocal account_count
+            try:
+                client = self.client_pool.get_next_client()
+
+                # Create accounts
+                created = await self._limited_call(
+                    client.create_accounts_composite,
+                    [
+                        {
                             "name": account_name,
-                            "type": account_type,
-                            "segment": segment,
-                            "industry": self.industry,
-                            "annual_revenue": annual_revenue,
-                            "contacts": [],
-                            "opportunities": [],
-                            "cases": [],
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                            "created_by": client.user_name
+                            "notes": f"{account_type} account in {self.industry} industry",
+                            "industry": self.industry.title(),
+                            "annual_revenue": annual_revenue
                         }
+                        for account_type, account_name, _, annual_revenue in batch
+                    ]
+                )
+
+                created_at = self._now_iso()
+                batch_count = 0
+                for (account_type, account_name, segment, annual_revenue), account in zip(batch, created):
+                    if not account:
+                        continue
+
+                    self.state["accounts"][account["gid"]] = {
+                        "id": account["gid"],
+                        "name": account_name,
+                        "type": account_type,
+                        "segment": segment,
+                        "industry": self.industry,
+                        "annual_revenue": annual_revenue,
+                        "contacts": [],
+                        "opportunities": [],
+                        "cases": [],
+                        "created_at": created_at,
+                        "created_by": client.user_name
+                    }
+                    self._track_record("accounts", self.state["accounts"][account["gid"]], 1)
+                    batch_count += 1
 
-                        account_count += 1
+                account_count += batch_count
 
-                        # Update initialization plan if it exists
-                        if "initialization_plan" in self.state:
-                            self.state["initialization_plan"]["completed_accounts"] += 1
+                # Update initialization plan if it exists
+                if "initialization_plan" in self.state:
+                    self.state["initialization_plan"]["completed_accounts"] += batch_count
 
-                        if account_count % 10 == 0:
-                            print(f"  Created {account_count}/{num_accounts} accounts")
+                print(f"  Created {account_count}/{num_accounts} accounts")
 
-                    await asyncio.sleep(0.3)  # Rate limit protection
+            except Exception as e:
+                print(f"  Error creating {len(batch)} accounts: {e}")
 
-                except Exception as e:
-                    print(f"  Error creating account {account_count + 1}: {e}")
+        await asyncio.gather(*(create_account_batch(batch) for batch in batches))
 
     async def _create_initial_contacts(self):
         """Create contacts for each account (2-10 per account)."""
         print("Creating contacts for accounts...")
 
-        contact_count = 0
-        for account_id, account_data in self.state["accounts"].items():
-            # Determine number of contacts (2-10 per account)
-            num_contacts = random.randint(2, 10)
+        # Determine number of contacts (2-10 per account)
+        contact_counts = [random.randint(2, 10) for _ in self.state["accounts"]]
+        names = iter(self._draw_names(sum(contact_counts)))
 
+        # (account data, role, contact fields) for every contact, rolled up front
+        pending = []
+        for (account_id, account_data), num_contacts in zip(self.state["accounts"].items(), contact_counts):
+            domain = self._email_domain(account_data["name"])
             for i in range(num_contacts):
-                try:
-                    first_name = self._generate_first_name()
-                    last_name = self._generate_last_name()
-
-                    # Select contact role
-                    role = self._select_contact_role()
-                    title = random.choice(CONTACT_ROLES[role]["typical_titles"])
-
-                    email = f"{first_name.lower()}.{last_name.lower()}@{account_data['name'].lower().replace(' ', '')}.com"
-
-                    client = self.client_pool.get_random_client()
-
-                    # Create contact
-                    contact = await asyncio.to_thread(
-                        client.create_contact,
-                        account_id=account_id,
-                        first_name=first_name,
-                        last_name=last_name,
-                        email=email,
-                        title=title
-                    )
-
-                    if contact:
-                        self.state["contacts"][contact["gid"]] = {
-                            "id": contact["gid"],
-                            "account_id": account_id,
-                            "first_name": first_name,
-                            "last_name": last_name,
-                            "email": email,
-                            "title": title,
-                            "role": role,
-                            "created_at": datetime.now(timezone.utc).isoformat(),
-                            "created_by": client.user_name
-                        }
+                first_name, last_name = next(names)
+
+                # Select contact role
+                role = self._select_contact_role()
+                title = random.choice(self.CONTACT_ROLE_TITLES[role])
+
+                email = f"{first_name.lower()}.{last_name.lower()}@{domain}"
+
+                pending.append((account_data, role, {
+                    "account_id": account_id,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "email": email,
+                    "title": title
+                }))
 
-                        account_data["contacts"].append(contact["gid"])
-                        contact_count += 1
+        # Contacts go out in composite requests of up to 200 records each
+        batch_size = SalesforceConnection.COMPOSITE_MAX_RECORDS
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
 
-                        # Update initialization plan if it exists
-                        if "initialization_plan" in self.state:
-                            self.state["initialization_plan"]["completed_contacts"] += 1
+        contact_count = 0
 
-                    await asyncio.sleep(0.2)
+        async def create_contact_batch(batch: List[Tuple[Dict[str, Any], str, Dict[str, Any]]]):
+            nonlocal contact_count
+            try:
+                client = self.client_pool.get_next_client()
 
-                except Exception as e:
-                    print(f"  Error creating contact: {e}")
+                # Create contacts
+                created = await self._limited_call(
+                    client.create_contacts_composite,
+                    [record for _, _, record in batch]
+                )
+
+                created_at = self._now_iso()
+                batch_count = 0
+                for (account_data, role, record), contact in zip(batch, created):
+                    if not contact:
+                        continue
+
+                    self.state["contacts"][contact["gid"]] = {
+                        "id": contact["gid"],
+                        "account_id": record["account_id"],
+                        "first_name": record["first_name"],
+                        "last_name": record["last_name"],
+                        "email": record["email"],
+                        "title": record["title"],
+                        "role": role,
+                        "created_at": created_at,
+                        "created_by": client.user_name
+                    }
+
+                    account_data["contacts"].append(contact["gid"])
+                    batch_count += 1
+
+                contact_count += batch_count
+
+                # Update initialization plan if it exists
+                if "initialization_plan" in self.state:
+                    self.state["initialization_plan"]["completed_contacts"] += batch_count
+
+            except Exception as e:
+                print(f"  Error creating {len(batch)} contacts: {e}")
+
+        await asyncio.gather(*(create_contact_batch(batch) for batch in batches))
 
         print(f"✓ Created {contact_count} contacts")
 
@@ -556,45 +988,70 @@ class SalesforceService(BaseService):
         print(f"Creating {num_opportunities} initial opportunities...")
 
         opp_count = 0
-        accounts_with_opps = random.sample(
-            list(self.state["accounts"].keys()),
-            min(len(self.state["accounts"]), num_opportunities)
-        )
+        # Sample positions rather than a copied key list, then index the ID tuple
+        account_ids = tuple(self.state["accounts"])
+        positions = random.sample(range(len(account_ids)), min(len(account_ids), num_opportunities))
+
+        # Roll every opportunity's details up front so the creates can be batched
+        specs = []
+        for position in positions:
+            account_id = account_ids[position]
+            account_data = self.state["accounts"][account_id]
+
+            # Generate opportunity data based on industry and segment
+            opp_data = generate_opportunity_data(
+                self.industry,
+                account_data["segment"],
+                random.choice(self.OPPORTUNITY_TYPE_KEYS),
+                self.org_size
+            )
+
+            # Generate opportunity name
+            opp_name = self._generate_opportunity_name(account_data["name"], opp_data["type"])
+
+            # Select owner (sales rep)
+            owner = self._get_random_user()
+
+            specs.append((account_id, account_data, opp_data, opp_name, owner))
+
+        # Opportunities go out in composite requests of up to 200 records each
+        batch_size = SalesforceConnection.COMPOSITE_MAX_RECORDS
+        batches = [specs[i:i + batch_size] for i in range(0, len(specs), batch_size)]
+
+        def opportunity_fields(account_id: str, opp_data: Dict[str, Any], opp_name: str,
+                               owner: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            fields = {
+                "account_id": account_id,
+                "name": opp_name,
+                "notes": f"{opp_data['type']} opportunity in {opp_data['stage']} stage",
+                "amount": opp_data["amount"],
+                "close_date": opp_data["close_date"],
+                "stage": opp_data["stage"],
+                "probability": opp_data["probability"]
+            }
+            if owner:
+                fields["assignee"] = owner["gid"]
+            return fields
 
-        for account_id in accounts_with_opps[:num_opportunities]:
+        async def create_opportunity_batch(batch: List[Tuple[str, Dict[str, Any], Dict[str, Any], str,
+                                                             Optional[Dict[str, Any]]]]):
+            nonlocal opp_count
             try:
-                account_data = self.state["accounts"][account_id]
-
-                # Generate opportunity data based on industry and segment
-                opp_data = generate_opportunity_data(
-                    self.industry,
-                    account_data["segment"],
-                    random.choice(list(OPPORTUNITY_TYPES.keys())),
-                    self.org_size
-                )
+                client = self.client_pool.get_next_client()
 
-                # Generate opportunity name
-                opp_name = self._generate_opportunity_name(account_data["name"], opp_data["type"])
-
-                # Select owner (sales rep)
-                owner = self._get_random_user()
-
-                client = self.client_pool.get_random_client()
-
-                # Create opportunity
-                opportunity = await asyncio.to_thread(
-                    client.create_task,
-                    project_gid=account_id,
-                    name=opp_name,
-                    notes=f"{opp_data['type']} opportunity in {opp_data['stage']} stage",
-                    assignee=owner["gid"] if owner else None,
-                    amount=opp_data["amount"],
-                    close_date=opp_data["close_date"],
-                    stage=opp_data["stage"],
-                    probability=opp_data["probability"]
+                # Create opportunities
+                created = await self._limited_call(
+                    client.create_opportunities_composite,
+                    [opportunity_fields(account_id, opp_data, opp_name, owner)
+                     for account_id, _, opp_data, opp_name, owner in batch]
                 )
 
-                if opportunity:
+                created_at = self._now_iso()
+                batch_count = 0
+                for (account_id, account_data, opp_data, opp_name, owner), opportunity in zip(batch, created):
+                    if not opportunity:
+                        continue
+
                     self.state["opportunities"][opportunity["gid"]] = {
                         "id": opportunity["gid"],
                         "account_id": account_id,
@@ -606,24 +1063,26 @@ class SalesforceService(BaseService):
                         "type": opp_data["type"],
                         "owner_id": owner["gid"] if owner else None,
                         "is_closed": False,
-                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "created_at": created_at,
                         "created_by": client.user_name
                     }
+                    self._track_record("opportunities", self.state["opportunities"][opportunity["gid"]], 1)
 
                     account_data["opportunities"].append(opportunity["gid"])
-                    opp_count += 1
+                    batch_count += 1
 
-                    # Update initialization plan if it exists
-                    if "initialization_plan" in self.state:
-                        self.state["initialization_plan"]["completed_opportunities"] += 1
+                opp_count += batch_count
 
-                    if opp_count % 10 == 0:
-                        print(f"  Created {opp_count}/{num_opportunities} opportunities")
+                # Update initialization plan if it exists
+                if "initialization_plan" in self.state:
+                    self.state["initialization_plan"]["completed_opportunities"] += batch_count
 
-                await asyncio.sleep(0.3)
+                print(f"  Created {opp_count}/{num_opportunities} opportunities")
 
             except Exception as e:
-                print(f"  Error creating opportunity: {e}")
+                print(f"  Error creating {len(batch)} opportunities: {e}")
+
+        await asyncio.gather(*(create_opportunity_batch(batch) for batch in batches))
 
     async def _create_initial_campaigns(self):
         """Create marketing campaigns for enterprise orgs."""
@@ -632,15 +1091,19 @@ class SalesforceService(BaseService):
         num_campaigns = random.randint(3, 8)
         campaign_types = ["Webinar", "Trade Show", "Email Campaign", "Content Marketing", "Product Launch"]
 
+        # Roll every campaign's details up front so the creates can run concurrently
+        specs = []
         for i in range(num_campaigns):
-            try:
-                campaign_type = random.choice(campaign_types)
-                campaign_name = f"Q{random.randint(1,4)} {datetime.now().year} {campaign_type}"
+            campaign_type = random.choice(campaign_types)
+            campaign_name = f"Q{random.randint(1,4)} {datetime.now().year} {campaign_type}"
+            specs.append((campaign_name, campaign_type))
 
-                client = self.client_pool.get_random_client()
+        async def create_one_campaign(campaign_name: str, campaign_type: str):
+            try:
+                client = self.client_pool.get_next_client()
 
                 # Create campaign
-                campaign = await asyncio.to_thread(
+                campaign = await self._limited_call(
                     client.create_portfolio,
                     workspace_gid="",
                     name=campaign_name,
@@ -655,7 +1118,7 @@ class SalesforceService(BaseService):
                         "type": campaign_type,
                         "status": "In Progress",
                         "members": [],
-                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        "created_at": self._now_iso(),
                         "created_by": client.user_name
                     }
 
@@ -663,65 +1126,75 @@ class SalesforceService(BaseService):
                     if "initialization_plan" in self.state:
                         self.state["initialization_plan"]["completed_campaigns"] += 1
 
-                await asyncio.sleep(0.5)
-
             except Exception as e:
                 print(f"  Error creating campaign: {e}")
 
+        await asyncio.gather(*(create_one_campaign(*spec) for spec in specs))
+
     async def _create_initial_leads(self):
         """Create initial lead pipeline."""
         num_leads = random.randint(20, 100)
         print(f"Creating {num_leads} initial leads...")
 
+        # Roll every lead's details up front so the creates can be batched
+        pending = []
+        for first_name, last_name in self._draw_names(num_leads):
+            # Generate lead data
+            company = self._generate_company_name()
+
+            # Select lead source
+            lead_source = self._select_lead_source()
+
+            email = f"{first_name.lower()}.{last_name.lower()}@{self._email_domain(company)}"
+
+            pending.append({
+                "first_name": first_name,
+                "last_name": last_name,
+                "company": company,
+                "email": email,
+                "status": "Open - Not Contacted",
+                "lead_source": lead_source
+            })
+
+        # Leads go out in composite requests of up to 200 records each
+        batch_size = SalesforceConnection.COMPOSITE_MAX_RECORDS
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
         lead_count = 0
-        for i in range(num_leads):
+
+        async def create_lead_batch(batch: List[Dict[str, Any]]):
+            nonlocal lead_count
             try:
-                # Generate lead data
-                first_name = self._generate_first_name()
-                last_name = self._generate_last_name()
-                company = self._generate_company_name()
-
-                # Select lead source
-                lead_source = self._select_lead_source()
-
-                email = f"{first_name.lower()}.{last_name.lower()}@{company.lower().replace(' ', '')}.com"
-
-                client = self.client_pool.get_random_client()
-
-                # Create lead
-                lead = await asyncio.to_thread(
-                    client.create_lead,
-                    first_name=first_name,
-                    last_name=last_name,
-                    company=company,
-                    email=email,
-                    status="Open - Not Contacted",
-                    lead_source=lead_source
-                )
+                client = self.client_pool.get_next_client()
+
+                # Create leads
+                created = await self._limited_call(client.create_leads_composite, batch)
+
+                created_at = self._now_iso()
+                batch_count = 0
+                for record, lead in zip(batch, created):
+                    if not lead:
+                        continue
 
-                if lead:
                     self.state["leads"][lead["gid"]] = {
                         "id": lead["gid"],
-                        "first_name": first_name,
-                        "last_name": last_name,
-                        "company": company,
-                        "email": email,
-                        "status": "Open - Not Contacted",
-                        "lead_source": lead_source,
-                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        **record,
+                        "created_at": created_at,
                         "created_by": client.user_name
                     }
+                    self._track_record("leads", self.state["leads"][lead["gid"]], 1)
+                    batch_count += 1
 
-                    lead_count += 1
+                lead_count += batch_count
 
-                    # Update initialization plan if it exists
-                    if "initialization_plan" in self.state:
-                        self.state["initialization_plan"]["completed_leads"] += 1
-
-                await asyncio.sleep(0.2)
+                # Update initialization plan if it exists
+                if "initialization_plan" in self.state:
+                    self.state["initialization_plan"]["completed_leads"] += batch_count
 
             except Exception as e:
-                print(f"  Error creating lead: {e}")
+                print(f"  Error creating {len(batch)} leads: {e}")
+
+        await asyncio.gather(*(create_lead_batch(batch) for batch in batches))
 
         print(f"✓ Created {lead_count} leads")
 
@@ -731,135 +1204,49 @@ class SalesforceService(BaseService):
         activity_type = self._select_activity_type()
 
         try:
-            if activity_type == SalesforceActivityType.CREATE_LEAD:
-                await self._handle_create_lead()
-            elif activity_type == SalesforceActivityType.CONVERT_LEAD:
-                await self._handle_convert_lead()
-            elif activity_type == SalesforceActivityType.QUALIFY_LEAD:
-                await self._handle_qualify_lead()
-            elif activity_type == SalesforceActivityType.CREATE_OPPORTUNITY:
-                await self._handle_create_opportunity()
-            elif activity_type == SalesforceActivityType.UPDATE_OPPORTUNITY_STAGE:
-                await self._handle_update_opportunity_stage()
-            elif activity_type == SalesforceActivityType.ADD_OPPORTUNITY_PRODUCT:
-                await self._handle_add_opportunity_product()
-            elif activity_type == SalesforceActivityType.CLOSE_OPPORTUNITY_WON:
-                await self._handle_close_opportunity_won()
-            elif activity_type == SalesforceActivityType.CLOSE_OPPORTUNITY_LOST:
-                await self._handle_close_opportunity_lost()
-            elif activity_type == SalesforceActivityType.CREATE_ACCOUNT:
-                await self._handle_create_account()
-            elif activity_type == SalesforceActivityType.UPDATE_ACCOUNT:
-                await self._handle_update_account()
-            elif activity_type == SalesforceActivityType.CREATE_CONTACT:
-                await self._handle_create_contact()
-            elif activity_type == SalesforceActivityType.UPDATE_CONTACT:
-                await self._handle_update_contact()
-            elif activity_type == SalesforceActivityType.CREATE_CASE:
-                await self._handle_create_case()
-            elif activity_type == SalesforceActivityType.UPDATE_CASE:
-                await self._handle_update_case()
-            elif activity_type == SalesforceActivityType.CLOSE_CASE:
-                await self._handle_close_case()
-            elif activity_type == SalesforceActivityType.ESCALATE_CASE:
-                await self._handle_escalate_case()
-            elif activity_type == SalesforceActivityType.LOG_CALL:
-                await self._handle_log_call()
-            elif activity_type == SalesforceActivityType.LOG_EMAIL:
-                await self._handle_log_email()
-            elif activity_type == SalesforceActivityType.LOG_MEETING:
-                await self._handle_log_meeting()
-            elif activity_type == SalesforceActivityType.CREATE_TASK:
-                await self._handle_create_task()
-            elif activity_type == SalesforceActivityType.CREATE_CAMPAIGN:
-                await self._handle_create_campaign()
-            elif activity_type == SalesforceActivityType.ADD_CAMPAIGN_MEMBER:
-                await self._handle_add_campaign_member()
-
-            # Log activity and update stats
+            handler = self._activity_handlers.get(activity_type)
+            if handler:
+                await handler()
+
+            # Log activity (stats are recounted when the state is saved)
             self._log_activity(activity_type, "success")
-            self._update_stats()
 
-            # Save state after each activity
-            if not self.deleted:
-                self.state_manager.save_state(self.job_id, self.state)
+            # Saved by the run loop every STATE_SAVE_INTERVAL seconds
+            self._state_dirty = True
 
         except Exception as e:
             print(f"Error generating {activity_type}: {e}")
             self._log_activity(activity_type, "failed", str(e))
-            self._update_stats()
+            self._state_dirty = True
 
     def _select_activity_type(self) -> str:
         """Select activity type based on weights and current state."""
-        # Build weighted list
-        choices = []
-        weights = []
-
-        for activity, weight in self.activity_weights.items():
-            # Adjust weights based on current state
-            adjusted_weight = weight
-
-            # Lead activities require leads
-            if activity == SalesforceActivityType.CONVERT_LEAD:
-                qualified_leads = [l for l in self.state["leads"].values()
-                                 if l.get("status") in ["Working - Contacted", "Qualified"]]
-                if len(qualified_leads) < 3:
-                    adjusted_weight = 0
-            elif activity == SalesforceActivityType.QUALIFY_LEAD:
-                new_leads = [l for l in self.state["leads"].values()
-                           if l.get("status") == "Open - Not Contacted"]
-                if len(new_leads) < 2:
-                    adjusted_weight = 0
-
-            # Opportunity activities require open opportunities
-            elif activity == SalesforceActivityType.UPDATE_OPPORTUNITY_STAGE:
-                open_opps = self._get_open_opportunities()
-                if len(open_opps) < 2:
-                    adjusted_weight = 0
-            elif activity in [SalesforceActivityType.CLOSE_OPPORTUNITY_WON,
-                            SalesforceActivityType.CLOSE_OPPORTUNITY_LOST]:
-                late_stage_opps = [o for o in self._get_open_opportunities()
-                                  if o.get("probability", 0) >= 60]
-                if len(late_stage_opps) < 1:
-                    adjusted_weight = 0
-
-            # Case activities require accounts with customer type
-            elif activity == SalesforceActivityType.CREATE_CASE:
-                customer_accounts = [a for a in self.state["accounts"].values()
-                                   if a.get("type") == "Customer"]
-                if len(customer_accounts) < 1:
-                    adjusted_weight = 0
-            elif activity in [SalesforceActivityType.UPDATE_CASE,
-                            SalesforceActivityType.CLOSE_CASE]:
-                open_cases = self._get_open_cases()
-                if len(open_cases) < 1:
-                    adjusted_weight = 0
-            elif activity == SalesforceActivityType.ESCALATE_CASE:
-                escalatable_cases = [c for c in self._get_open_cases()
-                                    if c.get("priority") in ["High", "Critical"]]
-                if len(escalatable_cases) < 1:
-                    adjusted_weight = 0
-
-            # Activity logging requires opportunities or accounts
-            elif activity in [SalesforceActivityType.LOG_CALL, SalesforceActivityType.LOG_EMAIL,
-                            SalesforceActivityType.LOG_MEETING, SalesforceActivityType.CREATE_TASK]:
-                if len(self.state["opportunities"]) < 1 and len(self.state["accounts"]) < 1:
-                    adjusted_weight = 0
-
-            # Campaign activities
-            elif activity == SalesforceActivityType.ADD_CAMPAIGN_MEMBER:
-                if len(self.state["campaigns"]) < 1 or len(self.state["contacts"]) < 1:
-                    adjusted_weight = 0
+        # Which activities the current state allows, in activity_weights order
+        eligibility = self._activity_eligibility
+        eligible = tuple(activity not in eligibility or eligibility[activity]()
+                         for activity in self._activity_keys)
 
-            if adjusted_weight > 0:
-                choices.append(activity)
-                weights.append(adjusted_weight)
+        # Cumulative weights only change when an activity becomes (in)eligible
+        if eligible != self._eligible_activities:
+            self._eligible_activities = eligible
+            self._rebuild_cum_weights()
 
-        if not choices:
+        if not self._cum_weights or self._cum_weights[-1] <= 0:
             # Default to creating a lead if no other activities available
             return SalesforceActivityType.CREATE_LEAD
 
-        return random.choices(choices, weights=weights)[0]
+        return random.choices(self._activity_keys, cum_weights=self._cum_weights)[0]
+
+    def _has_related_records(self) -> bool:
+        """Check whether there are opportunities or accounts to log activities against."""
+        return len(self.state["opportunities"]) >= 1 or len(self.state["accounts"]) >= 1
+
+    def _rebuild_cum_weights(self):
+        """Recompute the cumulative activity weights, zeroing ineligible activities."""
+        self._cum_weights = list(itertools.accumulate(
+            weight if allowed else 0
+            for weight, allowed in zip(self._activity_base_weights, self._eligible_activities)
+        ))
 
     # ========== LEAD MANAGEMENT HANDLERS ==========
 
@@ -870,11 +1257,11 @@ class SalesforceService(BaseService):
         company = self._generate_company_name()
         lead_source = self._select_lead_source()
 
-        email = f"{first_name.lower()}.{last_name.lower()}@{company.lower().replace(' ', '')}.com"
+        email = f"{first_name.lower()}.{last_name.lower()}@{self._email_domain(company)}"
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        lead = await asyncio.to_thread(
+        lead = await self._call(
             client.create_lead,
             first_name=first_name,
             last_name=last_name,
@@ -893,46 +1280,43 @@ class SalesforceService(BaseService):
                 "email": email,
                 "status": "Open - Not Contacted",
                 "lead_source": lead_source,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": self._now_iso(),
                 "created_by": client.user_name
             }
+            self._track_record("leads", self.state["leads"][lead["gid"]], 1)
 
             print(f"  Created lead: {first_name} {last_name} from {company} (Source: {lead_source})")
 
     async def _handle_qualify_lead(self):
         """Qualify a lead (move to contacted/qualified status)."""
-        # Find new leads to qualify
-        new_leads = [l for l in self.state["leads"].values()
-                    if l.get("status") == "Open - Not Contacted"]
+        lead = self._random_bucket_record("leads", "new_leads")
 
-        if not new_leads:
+        if not lead:
             return
 
-        lead = random.choice(new_leads)
-        new_status = random.choice(["Working - Contacted", "Qualified"])
+        new_status = random.choice(self.QUALIFIED_LEAD_STATUSES)
 
         # Note: Salesforce API doesn't support direct lead update in simple-salesforce
         # In production, you'd update via the API
+        self._track_record("leads", lead, -1)
         lead["status"] = new_status
-        lead["qualified_at"] = datetime.now(timezone.utc).isoformat()
+        self._track_record("leads", lead, 1)
+        lead["qualified_at"] = self._now_iso()
 
         print(f"  Qualified lead: {lead['first_name']} {lead['last_name']} - Status: {new_status}")
 
     async def _handle_convert_lead(self):
         """Convert a qualified lead to Account, Contact, and Opportunity."""
-        # Find qualified leads
-        qualified_leads = [l for l in self.state["leads"].values()
-                         if l.get("status") in ["Working - Contacted", "Qualified"]]
+        lead = self._random_bucket_record("leads", "qualified_leads")
 
-        if not qualified_leads:
+        if not lead:
             return
 
-        lead = random.choice(qualified_leads)
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         try:
             # Convert lead
-            result = await asyncio.to_thread(
+            result = await self._call(
                 client.convert_lead,
                 lead_id=lead["id"],
                 create_opportunity=True,
@@ -951,9 +1335,10 @@ class SalesforceService(BaseService):
                     "contacts": [result["contact_id"]],
                     "opportunities": [result["opportunity_id"]],
                     "cases": [],
-                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "created_at": self._now_iso(),
                     "created_by": client.user_name
                 }
+                self._track_record("accounts", self.state["accounts"][account_id], 1)
 
                 # Add contact to state
                 contact_id = result["contact_id"]
@@ -965,7 +1350,7 @@ class SalesforceService(BaseService):
                     "email": lead["email"],
                     "title": "Unknown",
                     "role": "decision_maker",
-                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "created_at": self._now_iso(),
                     "created_by": client.user_name
                 }
 
@@ -982,13 +1367,16 @@ class SalesforceService(BaseService):
                     "type": "New Business",
                     "owner_id": None,
                     "is_closed": False,
-                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "created_at": self._now_iso(),
                     "created_by": client.user_name
                 }
+                self._track_record("opportunities", self.state["opportunities"][opp_id], 1)
 
                 # Mark lead as converted
+                self._track_record("leads", lead, -1)
                 lead["status"] = "Closed - Converted"
-                lead["converted_at"] = datetime.now(timezone.utc).isoformat()
+                self._track_record("leads", lead, 1)
+                lead["converted_at"] = self._now_iso()
 
                 print(f"  Converted lead: {lead['first_name']} {lead['last_name']} → Account: {lead['company']}")
 
@@ -1003,23 +1391,23 @@ class SalesforceService(BaseService):
             return
 
         # Select an account
-        account_id = random.choice(list(self.state["accounts"].keys()))
+        account_id = random.choice(self._record_ids("accounts"))
         account_data = self.state["accounts"][account_id]
 
         # Generate opportunity data
         opp_data = generate_opportunity_data(
             self.industry,
             account_data["segment"],
-            random.choice(list(OPPORTUNITY_TYPES.keys())),
+            random.choice(self.OPPORTUNITY_TYPE_KEYS),
             self.org_size
         )
 
         opp_name = self._generate_opportunity_name(account_data["name"], opp_data["type"])
         owner = self._get_random_user()
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        opportunity = await asyncio.to_thread(
+        opportunity = await self._call(
             client.create_opportunity,
             account_id=account_id,
             name=opp_name,
@@ -1043,52 +1431,51 @@ class SalesforceService(BaseService):
                 "type": opp_data["type"],
                 "owner_id": owner["gid"] if owner else None,
                 "is_closed": False,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": self._now_iso(),
                 "created_by": client.user_name
             }
+            self._track_record("opportunities", self.state["opportunities"][opportunity["gid"]], 1)
 
             account_data["opportunities"].append(opportunity["gid"])
             print(f"  Created opportunity: {opp_name} - ${opp_data['amount']:,} ({opp_data['stage']})")
 
     async def _handle_update_opportunity_stage(self):
         """Move an opportunity forward in the sales pipeline."""
-        open_opps = self._get_open_opportunities()
+        opp = self._random_bucket_record("opportunities", "open_opportunities")
 
-        if not open_opps:
+        if not opp:
             return
 
-        opp = random.choice(open_opps)
-
         # Get next stage
         new_stage = self._select_next_opportunity_stage(opp["stage"])
 
         if not new_stage:
             return  # Already at final stage
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         # Update opportunity stage
-        await asyncio.to_thread(
+        await self._call(
             client.update_opportunity_stage,
             opp_id=opp["id"],
             stage=new_stage["name"]
         )
 
+        self._track_record("opportunities", opp, -1)
         opp["stage"] = new_stage["name"]
         opp["probability"] = new_stage["probability"]
-        opp["last_stage_change"] = datetime.now(timezone.utc).isoformat()
+        self._track_record("opportunities", opp, 1)
+        opp["last_stage_change"] = self._now_iso()
 
         print(f"  Updated opportunity: {opp['name']} → {new_stage['name']} ({new_stage['probability']}%)")
 
     async def _handle_add_opportunity_product(self):
         """Add products to an opportunity."""
-        open_opps = self._get_open_opportunities()
+        opp = self._random_bucket_record("opportunities", "open_opportunities")
 
-        if not open_opps:
+        if not opp:
             return
 
-        opp = random.choice(open_opps)
-
         # Get products for this opportunity's deal size
         products = get_typical_products(self.industry, opp["amount"])
 
@@ -1096,53 +1483,52 @@ class SalesforceService(BaseService):
 
     async def _handle_close_opportunity_won(self):
         """Close an opportunity as won."""
-        # Find late-stage opportunities
-        late_stage_opps = [o for o in self._get_open_opportunities()
-                          if o.get("probability", 0) >= 60]
+        # Pick a late-stage opportunity
+        opp = self._random_bucket_record("opportunities", "late_stage_opportunities")
 
-        if not late_stage_opps:
+        if not opp:
             return
-
-        opp = random.choice(late_stage_opps)
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         # Close as won
-        await asyncio.to_thread(
+        await self._call(
             client.update_opportunity_stage,
             opp_id=opp["id"],
             stage="Closed Won"
         )
 
+        self._track_record("opportunities", opp, -1)
         opp["stage"] = "Closed Won"
         opp["probability"] = 100
         opp["is_closed"] = True
-        opp["closed_at"] = datetime.now(timezone.utc).isoformat()
+        self._track_record("opportunities", opp, 1)
+        opp["closed_at"] = self._now_iso()
         opp["win_reason"] = get_win_loss_reason(True)
 
         print(f"  Closed Won: {opp['name']} - ${opp['amount']:,} (Reason: {opp['win_reason']})")
 
     async def _handle_close_opportunity_lost(self):
         """Close an opportunity as lost."""
-        open_opps = self._get_open_opportunities()
+        # More likely to lose early-stage deals
+        opp = self._random_bucket_record("opportunities", "open_opportunities")
 
-        if not open_opps:
+        if not opp:
             return
-
-        # More likely to lose early-stage deals
-        opp = random.choice(open_opps)
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         # Close as lost
-        await asyncio.to_thread(
+        await self._call(
             client.update_opportunity_stage,
             opp_id=opp["id"],
             stage="Closed Lost"
         )
 
+        self._track_record("opportunities", opp, -1)
         opp["stage"] = "Closed Lost"
         opp["probability"] = 0
         opp["is_closed"] = True
-        opp["closed_at"] = datetime.now(timezone.utc).isoformat()
+        self._track_record("opportunities", opp, 1)
+        opp["closed_at"] = self._now_iso()
         opp["loss_reason"] = get_win_loss_reason(False)
 
         print(f"  Closed Lost: {opp['name']} - ${opp['amount']:,} (Reason: {opp['loss_reason']})")
@@ -1151,7 +1537,7 @@ class SalesforceService(BaseService):
 
     async def _handle_create_account(self):
         """Create a new account."""
-        account_type = random.choice(list(ACCOUNT_TYPES.keys()))
+        account_type = random.choice(self.ACCOUNT_TYPE_KEYS)
         account_name = self._generate_account_name(account_type)
         segment = self._select_account_segment()
         segment_config = ACCOUNT_SEGMENTS[segment]
@@ -1159,9 +1545,9 @@ class SalesforceService(BaseService):
         revenue_range = segment_config["annual_revenue_range"]
         annual_revenue = random.randint(revenue_range[0], revenue_range[1])
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        account = await asyncio.to_thread(
+        account = await self._call(
             client.create_project,
             workspace_gid="",
             name=account_name,
@@ -1181,9 +1567,10 @@ class SalesforceService(BaseService):
                 "contacts": [],
                 "opportunities": [],
                 "cases": [],
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": self._now_iso(),
                 "created_by": client.user_name
             }
+            self._track_record("accounts", self.state["accounts"][account["gid"]], 1)
 
             print(f"  Created account: {account_name} ({account_type}, {segment})")
 
@@ -1192,13 +1579,15 @@ class SalesforceService(BaseService):
         if not self.state["accounts"]:
             return
 
-        account_id = random.choice(list(self.state["accounts"].keys()))
+        account_id = random.choice(self._record_ids("accounts"))
         account_data = self.state["accounts"][account_id]
 
         # Update account type (e.g., prospect → customer)
         if account_data["type"] == "Prospect" and len(account_data["opportunities"]) > 0:
+            self._track_record("accounts", account_data, -1)
             account_data["type"] = "Customer"
-            account_data["updated_at"] = datetime.now(timezone.utc).isoformat()
+            self._track_record("accounts", account_data, 1)
+            account_data["updated_at"] = self._now_iso()
             print(f"  Updated account: {account_data['name']} → Customer")
 
     async def _handle_create_contact(self):
@@ -1206,18 +1595,18 @@ class SalesforceService(BaseService):
         if not self.state["accounts"]:
             return
 
-        account_id = random.choice(list(self.state["accounts"].keys()))
+        account_id = random.choice(self._record_ids("accounts"))
         account_data = self.state["accounts"][account_id]
 
         first_name = self._generate_first_name()
         last_name = self._generate_last_name()
         role = self._select_contact_role()
-        title = random.choice(CONTACT_ROLES[role]["typical_titles"])
-        email = f"{first_name.lower()}.{last_name.lower()}@{account_data['name'].lower().replace(' ', '')}.com"
+        title = random.choice(self.CONTACT_ROLE_TITLES[role])
+        email = f"{first_name.lower()}.{last_name.lower()}@{self._email_domain(account_data['name'])}"
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        contact = await asyncio.to_thread(
+        contact = await self._call(
             client.create_contact,
             account_id=account_id,
             first_name=first_name,
@@ -1235,7 +1624,7 @@ class SalesforceService(BaseService):
                 "email": email,
                 "title": title,
                 "role": role,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": self._now_iso(),
                 "created_by": client.user_name
             }
 
@@ -1247,14 +1636,14 @@ class SalesforceService(BaseService):
         if not self.state["contacts"]:
             return
 
-        contact_id = random.choice(list(self.state["contacts"].keys()))
+        contact_id = random.choice(self._record_ids("contacts"))
         contact = self.state["contacts"][contact_id]
 
         # Update title (promotion)
         new_role = self._select_contact_role()
-        contact["title"] = random.choice(CONTACT_ROLES[new_role]["typical_titles"])
+        contact["title"] = random.choice(self.CONTACT_ROLE_TITLES[new_role])
         contact["role"] = new_role
-        contact["updated_at"] = datetime.now(timezone.utc).isoformat()
+        contact["updated_at"] = self._now_iso()
 
         print(f"  Updated contact: {contact['first_name']} {contact['last_name']} → {contact['title']}")
 
@@ -1263,36 +1652,22 @@ class SalesforceService(BaseService):
     async def _handle_create_case(self):
         """Create a support case for a customer account."""
         # Only create cases for customer accounts
-        customer_accounts = [a for a in self.state["accounts"].values()
-                           if a.get("type") == "Customer"]
+        account = self._random_bucket_record("accounts", "customer_accounts")
 
-        if not customer_accounts:
+        if not account:
             return
 
-        account = random.choice(customer_accounts)
-
         # Select case type and priority
-        case_type = random.choices(
-            list(CASE_TEMPLATES["types"].keys()),
-            weights=[v["percentage"] for v in CASE_TEMPLATES["types"].values()]
-        )[0]
-
-        priority = random.choices(
-            list(CASE_TEMPLATES["priorities"].keys()),
-            weights=[v["percentage"] for v in CASE_TEMPLATES["priorities"].values()]
-        )[0]
-
-        origin = random.choices(
-            list(CASE_TEMPLATES["origins"].keys()),
-            weights=list(CASE_TEMPLATES["origins"].values())
-        )[0]
+        case_type = self._weighted_pick(self.CASE_TYPE_KEYS, self.CASE_TYPE_CUM_WEIGHTS)
+        priority = self._weighted_pick(self.CASE_PRIORITY_KEYS, self.CASE_PRIORITY_CUM_WEIGHTS)
+        origin = self._weighted_pick(self.CASE_ORIGIN_KEYS, self.CASE_ORIGIN_CUM_WEIGHTS)
 
         # Generate case subject
         subject = self._generate_case_subject(case_type)
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        case = await asyncio.to_thread(
+        case = await self._call(
             client.create_case,
             account_id=account["id"],
             subject=subject,
@@ -1311,22 +1686,21 @@ class SalesforceService(BaseService):
                 "priority": priority,
                 "status": "New",
                 "origin": origin,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": self._now_iso(),
                 "created_by": client.user_name
             }
+            self._track_record("cases", self.state["cases"][case["gid"]], 1)
 
             account["cases"].append(case["gid"])
             print(f"  Created case: {subject} ({priority} priority, {case_type})")
 
     async def _handle_update_case(self):
         """Update case status (move through resolution workflow)."""
-        open_cases = self._get_open_cases()
+        case = self._random_bucket_record("cases", "open_cases")
 
-        if not open_cases:
+        if not case:
             return
 
-        case = random.choice(open_cases)
-
         # Move to next status
         current_status = case.get("status", "New")
         status_progression = ["New", "In Progress", "Waiting on Customer", "Resolved"]
@@ -1335,45 +1709,45 @@ class SalesforceService(BaseService):
             current_idx = status_progression.index(current_status)
             if current_idx < len(status_progression) - 1:
                 new_status = status_progression[current_idx + 1]
+                self._track_record("cases", case, -1)
                 case["status"] = new_status
-                case["updated_at"] = datetime.now(timezone.utc).isoformat()
+                self._track_record("cases", case, 1)
+                case["updated_at"] = self._now_iso()
 
                 print(f"  Updated case: {case['subject']} → {new_status}")
 
     async def _handle_close_case(self):
         """Close a resolved case."""
-        resolved_cases = [c for c in self._get_open_cases()
-                         if c.get("status") == "Resolved"]
+        case = self._random_bucket_record("cases", "resolved_cases")
 
-        if not resolved_cases:
+        if not case:
             return
-
-        case = random.choice(resolved_cases)
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         # Close case
-        await asyncio.to_thread(
+        await self._call(
             client.close_case,
             case_id=case["id"],
             status="Closed"
         )
 
+        self._track_record("cases", case, -1)
         case["status"] = "Closed"
-        case["closed_at"] = datetime.now(timezone.utc).isoformat()
+        self._track_record("cases", case, 1)
+        case["closed_at"] = self._now_iso()
 
         print(f"  Closed case: {case['subject']}")
 
     async def _handle_escalate_case(self):
         """Escalate a high-priority case."""
-        escalatable_cases = [c for c in self._get_open_cases()
-                            if c.get("priority") in ["High", "Critical"]]
+        case = self._random_bucket_record("cases", "escalatable_cases")
 
-        if not escalatable_cases:
+        if not case:
             return
-
-        case = random.choice(escalatable_cases)
+        self._track_record("cases", case, -1)
         case["status"] = "Escalated"
-        case["escalated_at"] = datetime.now(timezone.utc).isoformat()
+        self._track_record("cases", case, 1)
+        case["escalated_at"] = self._now_iso()
 
         print(f"  Escalated case: {case['subject']} ({case['priority']} priority)")
 
@@ -1383,17 +1757,17 @@ class SalesforceService(BaseService):
         """Log a phone call activity."""
         # Log calls for opportunities or accounts
         if self.state["opportunities"]:
-            related_to = random.choice(list(self.state["opportunities"].values()))
+            related_to = self._random_record("opportunities")
             related_to_id = related_to["id"]
             related_to_name = related_to["name"]
         elif self.state["accounts"]:
-            related_to = random.choice(list(self.state["accounts"].values()))
+            related_to = self._random_record("accounts")
             related_to_id = related_to["id"]
             related_to_name = related_to["name"]
         else:
             return
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         call_subjects = [
             "Discovery Call",
@@ -1405,7 +1779,7 @@ class SalesforceService(BaseService):
 
         subject = random.choice(call_subjects)
 
-        await asyncio.to_thread(
+        await self._call(
             client.log_activity,
             related_to_id=related_to_id,
             subject=subject,
@@ -1419,17 +1793,17 @@ class SalesforceService(BaseService):
     async def _handle_log_email(self):
         """Log an email activity."""
         if self.state["opportunities"]:
-            related_to = random.choice(list(self.state["opportunities"].values()))
+            related_to = self._random_record("opportunities")
             related_to_id = related_to["id"]
             related_to_name = related_to["name"]
         elif self.state["accounts"]:
-            related_to = random.choice(list(self.state["accounts"].values()))
+            related_to = self._random_record("accounts")
             related_to_id = related_to["id"]
             related_to_name = related_to["name"]
         else:
             return
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         email_subjects = [
             "Product Information",
@@ -1441,7 +1815,7 @@ class SalesforceService(BaseService):
 
         subject = random.choice(email_subjects)
 
-        await asyncio.to_thread(
+        await self._call(
             client.log_activity,
             related_to_id=related_to_id,
             subject=subject,
@@ -1455,13 +1829,13 @@ class SalesforceService(BaseService):
     async def _handle_log_meeting(self):
         """Log a meeting activity."""
         if self.state["opportunities"]:
-            related_to = random.choice(list(self.state["opportunities"].values()))
+            related_to = self._random_record("opportunities")
             related_to_id = related_to["id"]
             related_to_name = related_to["name"]
         else:
             return
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         meeting_subjects = [
             "Executive Business Review",
@@ -1473,7 +1847,7 @@ class SalesforceService(BaseService):
 
         subject = random.choice(meeting_subjects)
 
-        await asyncio.to_thread(
+        await self._call(
             client.log_activity,
             related_to_id=related_to_id,
             subject=subject,
@@ -1487,17 +1861,17 @@ class SalesforceService(BaseService):
     async def _handle_create_task(self):
         """Create a follow-up task."""
         if self.state["opportunities"]:
-            related_to = random.choice(list(self.state["opportunities"].values()))
+            related_to = self._random_record("opportunities")
             related_to_id = related_to["id"]
             related_to_name = related_to["name"]
         elif self.state["accounts"]:
-            related_to = random.choice(list(self.state["accounts"].values()))
+            related_to = self._random_record("accounts")
             related_to_id = related_to["id"]
             related_to_name = related_to["name"]
         else:
             return
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
         task_subjects = [
             "Follow up on proposal",
@@ -1509,7 +1883,7 @@ class SalesforceService(BaseService):
 
         subject = random.choice(task_subjects)
 
-        await asyncio.to_thread(
+        await self._call(
             client.log_activity,
             related_to_id=related_to_id,
             subject=subject,
@@ -1528,9 +1902,9 @@ class SalesforceService(BaseService):
         campaign_type = random.choice(campaign_types)
         campaign_name = f"Q{random.randint(1,4)} {datetime.now().year} {campaign_type}"
 
-        client = self.client_pool.get_random_client()
+        client = self.client_pool.get_next_client()
 
-        campaign = await asyncio.to_thread(
+        campaign = await self._call(
             client.create_portfolio,
             workspace_gid="",
             name=campaign_name,
@@ -1545,7 +1919,7 @@ class SalesforceService(BaseService):
                 "type": campaign_type,
                 "status": "In Progress",
                 "members": [],
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": self._now_iso(),
                 "created_by": client.user_name
             }
 
@@ -1556,14 +1930,14 @@ class SalesforceService(BaseService):
         if not self.state["campaigns"] or not self.state["contacts"]:
             return
 
-        campaign_id = random.choice(list(self.state["campaigns"].keys()))
+        campaign_id = random.choice(self._record_ids("campaigns"))
         campaign = self.state["campaigns"][campaign_id]
 
         # Add 1-5 contacts to campaign
         num_contacts = min(random.randint(1, 5), len(self.state["contacts"]))
-        contacts_to_add = random.sample(list(self.state["contacts"].values()), num_contacts)
+        contact_ids = random.sample(self._record_ids("contacts"), num_contacts)
 
-        for contact in contacts_to_add:
+        for contact in map(self.state["contacts"].__getitem__, contact_ids):
             if contact["id"] not in campaign["members"]:
                 campaign["members"].append(contact["id"])
 
@@ -1573,15 +1947,54 @@ class SalesforceService(BaseService):
 
     def _get_random_account(self) -> Optional[Dict[str, Any]]:
         """Get a random account from state."""
-        if not self.state["accounts"]:
-            return None
-        return random.choice(list(self.state["accounts"].values()))
+        return self._random_record("accounts")
 
     def _get_random_contact(self) -> Optional[Dict[str, Any]]:
         """Get a random contact from state."""
-        if not self.state["contacts"]:
+        return self._random_record("contacts")
+
+    def _record_ids(self, collection: str) -> List[str]:
+        """
+        Get the IDs of every record in a state collection, for random picks.
+
+        Activities only ever add records, and dicts keep insertion order, so the
+        cached list is topped up with the newest IDs instead of being rebuilt.
+        It is rebuilt when the collection object itself is replaced.
+
+        Args:
+            collection: State collection (accounts, contacts, ...)
+
+        Returns:
+            Cached list of record IDs - don't modify it
+        """
+        records = self.state[collection]
+        cached = self._record_id_lists.get(collection)
+        if cached is None or cached[0] is not records or len(cached[1]) > len(records):
+            record_ids = list(records)
+            self._record_id_lists[collection] = (records, record_ids)
+            return record_ids
+
+        record_ids = cached[1]
+        missing = len(records) - len(record_ids)
+        if missing:
+            newest = list(itertools.islice(reversed(records), missing))
+            record_ids.extend(reversed(newest))
+        return record_ids
+
+    def _random_record(self, collection: str) -> Optional[Dict[str, Any]]:
+        """
+        Pick a random record from a state collection.
+
+        Args:
+            collection: State collection (accounts, contacts, ...)
+
+        Returns:
+            Record data, or None if the collection is empty
+        """
+        record_ids = self._record_ids(collection)
+        if not record_ids:
             return None
-        return random.choice(list(self.state["contacts"].values()))
+        return self.state[collection][random.choice(record_ids)]
 
     def _get_random_user(self) -> Optional[Dict[str, Any]]:
         """Get a random Salesforce user for assignment."""
@@ -1589,68 +2002,153 @@ class SalesforceService(BaseService):
             return None
         return random.choice(self.state["users"])
 
-    def _get_open_opportunities(self) -> List[Dict[str, Any]]:
-        """Get all open (not closed) opportunities."""
-        return [o for o in self.state["opportunities"].values() if not o.get("is_closed", False)]
+    def _random_bucket_record(self, collection: str, bucket: str) -> Optional[Dict[str, Any]]:
+        """
+        Pick a random record from an eligibility bucket.
 
-    def _get_open_cases(self) -> List[Dict[str, Any]]:
-        """Get all open (not closed) cases."""
-        return [c for c in self.state["cases"].values() if c.get("status") != "Closed"]
+        Args:
+            collection: State collection holding the bucket's records
+            bucket: Bucket name (see _record_buckets)
+
+        Returns:
+            Record data, or None if the bucket is empty
+        """
+        record_ids = self._bucket_ids(bucket)
+        if not record_ids:
+            return None
+        return self.state[collection][record_ids.choice()]
+
+    def _record_buckets(self, collection: str, record: Dict[str, Any]) -> Tuple[str, ...]:
+        """
+        Get the eligibility buckets a record currently belongs to.
+
+        Args:
+            collection: State collection holding the record (leads, opportunities, ...)
+            record: Record data
+
+        Returns:
+            Bucket names counted by _bucket_count
+        """
+        if collection == "leads":
+            status = record.get("status")
+            if status == "Open - Not Contacted":
+                return ("new_leads",)
+            if status in self.QUALIFIED_LEAD_STATUSES:
+                return ("qualified_leads",)
+        elif collection == "opportunities":
+            # Won and lost deals are only counted for the job stats. Setup can
+            # roll a closed stage onto a record that is still marked open.
+            stage = record.get("stage")
+            closed = (("won_opportunities",) if stage == "Closed Won" else
+                      ("lost_opportunities",) if stage == "Closed Lost" else ())
+            if not record.get("is_closed", False):
+                if record.get("probability", 0) >= self.LATE_STAGE_PROBABILITY:
+                    return ("open_opportunities", "late_stage_opportunities") + closed
+                return ("open_opportunities",) + closed
+            return closed
+        elif collection == "accounts":
+            if record.get("type") == "Customer":
+                return ("customer_accounts",)
+        elif collection == "cases":
+            status = record.get("status")
+            if status != "Closed":
+                resolved = ("resolved_cases",) if status == "Resolved" else ()
+                if record.get("priority") in self.ESCALATABLE_PRIORITIES:
+                    return ("open_cases", "escalatable_cases") + resolved
+                return ("open_cases",) + resolved
+        return ()
+
+    def _track_record(self, collection: str, record: Dict[str, Any], delta: int):
+        """
+        Add a record to (delta=1) or remove it from (delta=-1) its buckets.
+
+        Call with -1 before changing a field that decides its buckets and with 1
+        afterwards, or with 1 once when a record is added to state.
+
+        Args:
+            collection: State collection holding the record
+            record: Record data
+            delta: 1 to add the record, -1 to remove it
+        """
+        if self._buckets is None:
+            return  # Buckets are rebuilt from state on next use
+        for bucket in self._record_buckets(collection, record):
+            if delta > 0:
+                self._buckets[bucket].add(record["id"])
+            else:
+                self._buckets[bucket].discard(record["id"])
+
+    def _bucket_ids(self, bucket: str) -> IndexedSet[str]:
+        """
+        Get the IDs of the records in an eligibility bucket.
+
+        Args:
+            bucket: Bucket name (see _record_buckets)
+
+        Returns:
+            Live set of record IDs - don't modify it
+        """
+        if self._buckets is None:
+            buckets = defaultdict(IndexedSet)
+            for collection in ("leads", "opportunities", "accounts", "cases"):
+                for record_id, record in self.state.get(collection, {}).items():
+                    for name in self._record_buckets(collection, record):
+                        buckets[name].add(record_id)
+            self._buckets = buckets
+        return self._buckets[bucket]
+
+    def _bucket_count(self, bucket: str) -> int:
+        """
+        Get the number of records in an eligibility bucket.
+
+        Args:
+            bucket: Bucket name (see _record_buckets)
+
+        Returns:
+            Number of records currently in the bucket
+        """
+        return len(self._bucket_ids(bucket))
+
+    @staticmethod
+    def _weighted_pick(population: Tuple[str, ...], cum_weights: Tuple[float, ...]) -> str:
+        """
+        Draw one item from a static weighted table.
+
+        Same draw as random.choices(population, cum_weights=cum_weights)[0],
+        without building a result list for a single pick.
+
+        Args:
+            population: Items to choose from
+            cum_weights: Cumulative weights, one per item
+
+        Returns:
+            The chosen item
+        """
+        total = cum_weights[-1]
+        return population[bisect.bisect(cum_weights, random.random() * total, 0, len(population) - 1)]
 
     def _select_account_segment(self) -> str:
         """Select an account segment with weighted probability."""
-        segments = list(ACCOUNT_SEGMENTS.keys())
-        weights = [ACCOUNT_SEGMENTS[s]["percentage"] for s in segments]
-        return random.choices(segments, weights=weights)[0]
+        return self._weighted_pick(self.ACCOUNT_SEGMENT_KEYS, self.ACCOUNT_SEGMENT_CUM_WEIGHTS)
 
     def _select_contact_role(self) -> str:
         """Select a contact role."""
-        roles = list(CONTACT_ROLES.keys())
-        # Weight decision makers and champions higher
-        weights = [3, 2, 3, 2, 1, 1]  # Adjust to match roles
-        return random.choices(roles, weights=weights[:len(roles)])[0]
+        return self._weighted_pick(self.CONTACT_ROLE_KEYS, self.CONTACT_ROLE_CUM_WEIGHTS)
 
     def _select_lead_source(self) -> str:
         """Select a lead source with weighted probability."""
-        all_sources = []
-        all_weights = []
-
-        for category, sources in LEAD_SOURCES.items():
-            for source, weight in sources.items():
-                all_sources.append(source)
-                all_weights.append(weight)
-
-        return random.choices(all_sources, weights=all_weights)[0]
+        return self._weighted_pick(self.LEAD_SOURCE_KEYS, self.LEAD_SOURCE_CUM_WEIGHTS)
 
     def _select_next_opportunity_stage(self, current_stage: str) -> Optional[Dict[str, Any]]:
         """Select the next stage in the sales pipeline."""
-        # Get sales process for B2B
-        process = SALES_PROCESS_TEMPLATES["b2b_enterprise"]
-        stages = process["stages"]
-
-        # Find current stage index
-        current_idx = None
-        for idx, stage in enumerate(stages):
-            if stage["name"] == current_stage:
-                current_idx = idx
-                break
-
-        if current_idx is None or current_idx >= len(stages) - 2:  # -2 to exclude closed stages
-            return None
-
-        # Return next stage (skip closed stages)
-        next_stage = stages[current_idx + 1]
-        if next_stage.get("is_closed"):
-            return None
-
-        return next_stage
+        return self.NEXT_OPPORTUNITY_STAGES.get(current_stage)
 
     def _generate_account_name(self, account_type: str) -> str:
         """
         Generate a realistic account name using LLM based on industry and account type.
 
         Uses Claude Haiku to generate creative, diverse account names that make sense
-        for the given industry context. Tracks generated names to avoid duplicates.
+        for the given industry context. Passes recent names to the LLM to avoid duplicates.
 
         Args:
             account_type: The type of account (e.g., "Hospital System", "SaaS Company")
@@ -1664,8 +2162,8 @@ class SalesforceService(BaseService):
             suffixes = ["Corp", "Inc", "LLC", "Group", "Partners"]
             return f"{random.choice(prefixes)} {account_type} {random.choice(suffixes)}"
 
-        # Get recently generated names for context (last 20 to keep prompt short)
-        recent_names = list(self._generated_account_names)[-20:] if self._generated_account_names else []
+        # Get recently generated names for context (bounded to keep the prompt short)
+        recent_names = list(self._generated_account_names)
 
         # Get industry description
         industry_name = self.industry_config.get("name", self.industry)
@@ -1695,7 +2193,7 @@ Bad Examples (too generic/repetitive):
 - "Premier Hospital System Inc"
 - "Advanced Data Center LLC"
 
-Recently used names to AVOID: {', '.join(recent_names[-10:]) if recent_names else 'None'}
+Recently used names to AVOID: {', '.join(recent_names) if recent_names else 'None'}
 
 Generate ONE unique company name (name only, no explanation):"""
 
@@ -1711,7 +2209,7 @@ Generate ONE unique company name (name only, no explanation):"""
                 generated_name = generated_name.split('\n')[0].strip()
 
             # Add to cache
-            self._generated_account_names.add(generated_name)
+            self._generated_account_names.append(generated_name)
 
             return generated_name
 
@@ -1721,7 +2219,7 @@ Generate ONE unique company name (name only, no explanation):"""
             prefixes = ["Global", "United", "Premier", "Advanced", "Innovative"]
             suffixes = ["Corp", "Inc", "LLC", "Group", "Partners"]
             fallback_name = f"{random.choice(prefixes)} {account_type} {random.choice(suffixes)}"
-            self._generated_account_names.add(fallback_name)
+            self._generated_account_names.append(fallback_name)
             return fallback_name
 
     def _generate_company_name(self) -> str:
@@ -1734,69 +2232,52 @@ Generate ONE unique company name (name only, no explanation):"""
 
     def _generate_case_subject(self, case_type: str) -> str:
         """Generate a realistic case subject."""
-        subjects = {
-            "Question": [
-                "How to configure user permissions",
-                "Need help with report generation",
-                "Question about billing cycle",
-                "Feature clarification needed"
-            ],
-            "Problem": [
-                "Unable to access dashboard",
-                "Error when saving records",
-                "Performance issues",
-                "Integration not working"
-            ],
-            "Feature Request": [
-                "Request: Add custom field support",
-                "Enhancement: Bulk update capability",
-                "New feature: Mobile app support",
-                "Improvement: Better search functionality"
-            ],
-            "Bug": [
-                "Bug: Data not syncing correctly",
-                "Issue: Incorrect calculations",
-                "Error: Null pointer exception",
-                "Defect: Missing validation"
-            ],
-            "Billing": [
-                "Billing inquiry for last invoice",
-                "Need to update payment method",
-                "Question about contract renewal",
-                "Dispute charge on account"
-            ]
-        }
-
-        return random.choice(subjects.get(case_type, ["General inquiry"]))
+        return random.choice(self.CASE_SUBJECTS.get(case_type, ("General inquiry",)))
 
     def _generate_first_name(self) -> str:
         """Generate a random first name."""
-        first_names = [
-            "John", "Jane", "Michael", "Sarah", "David", "Emily", "Robert", "Lisa",
-            "James", "Mary", "William", "Patricia", "Richard", "Jennifer", "Thomas",
-            "Linda", "Charles", "Elizabeth", "Joseph", "Barbara", "Christopher", "Susan",
-            "Daniel", "Jessica", "Matthew", "Karen", "Anthony", "Nancy", "Mark", "Betty",
-            "Paul", "Dorothy", "Steven", "Sandra", "Andrew", "Ashley", "Kenneth", "Kimberly"
-        ]
-        return random.choice(first_names)
+        return random.choice(self.FIRST_NAMES)
 
     def _generate_last_name(self) -> str:
         """Generate a random last name."""
-        last_names = [
-            "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
-            "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson",
-            "Thomas", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson",
-            "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker"
-        ]
-        return random.choice(last_names)
+        return random.choice(self.LAST_NAMES)
+
+    def _draw_names(self, count: int) -> List[Tuple[str, str]]:
+        """
+        Draw first and last names for a batch of people in two bulk draws.
+
+        Args:
+            count: Number of names needed
+
+        Returns:
+            List of (first_name, last_name) tuples
+        """
+        return list(zip(random.choices(self.FIRST_NAMES, k=count),
+                        random.choices(self.LAST_NAMES, k=count)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=EMAIL_DOMAIN_CACHE_SIZE)
+    def _email_domain(company: str) -> str:
+        """
+        Build the email domain for a company name.
+
+        Args:
+            company: Company or account name
+
+        Returns:
+            Domain such as "acmecorp.com"
+        """
+        return f"{company.lower().replace(' ', '')}.com"
 
     def _update_stats(self):
-        """Update job stats based on current state."""
-        # Calculate opportunity stats
-        opportunities_won = sum(1 for opp in self.state.get("opportunities", {}).values()
-                               if opp.get("stage_name") == "Closed Won")
-        opportunities_lost = sum(1 for opp in self.state.get("opportunities", {}).values()
-                                if opp.get("stage_name") == "Closed Lost")
+        """
+        Update job stats based on current state.
+
+        Only needed when the stats are written out - the job file saves call it,
+        not every activity. Won and lost deals come from the bucket counts.
+        """
+        opportunities_won = self._bucket_count("won_opportunities")
+        opportunities_lost = self._bucket_count("lost_opportunities")
 
         # Update stats
         self.state["stats"] = {
@@ -1814,17 +2295,19 @@ Generate ONE unique company name (name only, no explanation):"""
     def _log_activity(self, activity_type: str, status: str, details: str = None):
         """Log activity to state."""
         activity = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._now_iso(),
             "activity_type": activity_type,
             "status": status,
             "details": details
         }
 
-        self.state["activity_log"].append(activity)
-
-        # Keep only last 1000 activities
-        if len(self.state["activity_log"]) > 1000:
-            self.state["activity_log"] = self.state["activity_log"][-1000:]
+        # The log is a bounded deque that drops its oldest entry on append. State
+        # loaded from disk (or swapped in by the API server) holds a plain list.
+        activity_log = self.state.get("activity_log")
+        if not isinstance(activity_log, deque):
+            activity_log = deque(activity_log or (), maxlen=self.ACTIVITY_LOG_LIMIT)
+            self.state["activity_log"] = activity_log
+        activity_log.append(activity)
 
     # Override abstract methods that don't apply directly to Salesforce
 
@@ -1873,8 +2356,8 @@ Generate ONE unique company name (name only, no explanation):"""
         print("Deleting campaigns...")
         for campaign_id in list(self.state.get("campaigns", {}).keys()):
             try:
-                client = self.client_pool.get_random_client()
-                await asyncio.to_thread(client.delete_portfolio, campaign_id)
+                client = self.client_pool.get_next_client()
+                await self._call(client.delete_portfolio, campaign_id)
                 results["campaigns_deleted"] += 1
 
                 current_operation += 1
@@ -1890,8 +2373,8 @@ Generate ONE unique company name (name only, no explanation):"""
         print("Deleting opportunities...")
         for opp_id in list(self.state.get("opportunities", {}).keys()):
             try:
-                client = self.client_pool.get_random_client()
-                await asyncio.to_thread(client.delete_task, opp_id)
+                client = self.client_pool.get_next_client()
+                await self._call(client.delete_task, opp_id)
                 results["opportunities_deleted"] += 1
 
                 current_operation += 1
@@ -1907,7 +2390,7 @@ Generate ONE unique company name (name only, no explanation):"""
         print("Deleting cases...")
         for case_id in list(self.state.get("cases", {}).keys()):
             try:
-                client = self.client_pool.get_random_client()
+                client = self.client_pool.get_next_client()
                 # Cases don't have direct delete, so we'll skip
                 # In production, you'd mark as deleted or use API
                 current_operation += 1
@@ -1921,7 +2404,7 @@ Generate ONE unique company name (name only, no explanation):"""
         print("Deleting contacts...")
         for contact_id in list(self.state.get("contacts", {}).keys()):
             try:
-                client = self.client_pool.get_random_client()
+                client = self.client_pool.get_next_client()
                 # Contacts will be deleted when account is deleted
                 current_operation += 1
                 if progress_callback:
@@ -1934,8 +2417,8 @@ Generate ONE unique company name (name only, no explanation):"""
         print("Deleting accounts...")
         for account_id in list(self.state.get("accounts", {}).keys()):
             try:
-                client = self.client_pool.get_random_client()
-                await asyncio.to_thread(client.delete_project, account_id)
+                client = self.client_pool.get_next_client()
+                await self._call(client.delete_project, account_id)
                 results["accounts_deleted"] += 1
 
                 current_operation += 1
@@ -1951,7 +2434,7 @@ Generate ONE unique company name (name only, no explanation):"""
         print("Deleting leads...")
         for lead_id in list(self.state.get("leads", {}).keys()):
             try:
-                client = self.client_pool.get_random_client()
+                client = self.client_pool.get_next_client()
                 # Leads don't have direct delete method in our connection
                 # In production, you'd implement lead deletion
                 current_operation += 1
@@ -1964,6 +2447,9 @@ Generate ONE unique company name (name only, no explanation):"""
         # Mark as deleted
         self.deleted = True
 
+        # The cleanup service isn't used again, so release its client call threads
+        self._executor.shutdown(wait=False)
+
         print(f"✓ Cleanup completed:")
         print(f"  - Accounts deleted: {results['accounts_deleted']}")
         print(f"  - Opportunities deleted: {results['opportunities_deleted']}")
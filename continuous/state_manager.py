@@ -10,11 +10,36 @@ Maintains backward compatibility with legacy Asana-only job files.
 
 import json
 import os
+import tempfile
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_state(state: Dict[str, Any]) -> bytes:
+    """Serialize a job state to the bytes written to its JSON file."""
+    # default=list writes in-memory containers such as a deque activity_log as arrays
+    if orjson is not None:
+        return orjson.dumps(state, default=list, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(state, indent=2, default=list).encode("utf-8")
+
+
+def _load_state_file(path: Path) -> Dict[str, Any]:
+    """Read and parse a job state JSON file."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class StateManager:
     """
@@ -29,16 +54,37 @@ class StateManager:
     while sharing common lifecycle management (status, timestamps, logs).
     """
 
-    def __init__(self, state_dir: str = "."):
+    def __init__(self, state_dir: str = ".", activity_flush_size: int = 20,
+                 activity_flush_interval: float = 5.0, persist_activity_log: bool = True):
         """
         Initialize state manager.
 
         Args:
             state_dir: Directory where state files will be stored
+            activity_flush_size: Buffered activity entries that trigger a write to disk
+            activity_flush_interval: Seconds after which buffered activity entries are written
+            persist_activity_log: Whether activity entries are written to the job file
         """
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(exist_ok=True)
 
+        # Activity log entries are buffered per job and written in batches.
+        # Any save_state() call for the job also drains its buffer.
+        self.activity_flush_size = activity_flush_size
+        self.activity_flush_interval = activity_flush_interval
+        self.persist_activity_log = persist_activity_log
+        self._activity_buffer: Dict[str, List[Dict[str, Any]]] = {}
+        self._activity_last_flush: Dict[str, float] = {}
+        self._activity_lock = threading.Lock()
+
+        # In-process consumers of activity entries (called as listener(job_id, entry))
+        self._activity_listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+        # Per-job events set whenever the job's status or deletion marker changes,
+        # so running services don't have to re-read the job file to notice
+        self._status_events: Dict[str, threading.Event] = {}
+        self._status_events_lock = threading.Lock()
+
     def create_new_job(self, config: Dict[str, Any]) -> str:
         """
         Create a new job with initial state.
@@ -175,8 +221,7 @@ class StateManager:
             return None
 
         try:
-            with open(state_file, 'r') as f:
-                state = json.load(f)
+            state = _load_state_file(state_file)
             # Migrate legacy jobs to current format
             state = self._migrate_legacy_job(state)
             return state
@@ -195,9 +240,26 @@ class StateManager:
         state_file = self.state_dir / f"job_{job_id}.json"
         state["last_saved"] = datetime.now(timezone.utc).isoformat()
 
+        # Fold in any buffered activity entries so they are not lost by this write
+        pending = self._drain_activity_buffer(job_id)
+        if pending:
+            activity_log = state.setdefault("activity_log", [])
+            activity_log.extend(pending)
+            if len(activity_log) > 1000:
+                state["activity_log"] = activity_log[-1000:]
+
         try:
-            with open(state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            data = _dump_state(state)
+            # Write to a temporary file and swap it in, so readers in other
+            # threads never see a partially written job file
+            fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, prefix=f".job_{job_id}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, state_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
         except Exception as e:
             print(f"Error saving state for job {job_id}: {e}")
 
@@ -327,47 +389,138 @@ class StateManager:
         """
         state = self.load_state(job_id)
         if state:
-            now = datetime.now(timezone.utc).isoformat()
+            self._apply_add_comment(state, task_id, comment)
+            self.save_state(job_id, state)
 
-            # Update task comment count
-            for project in state["projects"]:
-                for task in project["tasks"]:
-                    if task["id"] == task_id:
-                        task["comment_count"] += 1
-                        task["last_comment_at"] = now
-                        break
+    def _apply_add_comment(self, state: Dict[str, Any], task_id: str, comment: Dict[str, Any]):
+        """Record a comment in an already-loaded state dict."""
+        now = datetime.now(timezone.utc).isoformat()
 
-            state["stats"]["comments_added"] += 1
+        # Update task comment count
+        for project in state["projects"]:
+            for task in project["tasks"]:
+                if task["id"] == task_id:
+                    task["comment_count"] += 1
+                    task["last_comment_at"] = now
+                    break
 
-            # Update initialization progress if plan exists
-            if "initialization_plan" in state:
-                state["initialization_plan"]["completed_comments"] += 1
+        state["stats"]["comments_added"] += 1
 
-            self.save_state(job_id, state)
+        # Update initialization progress if plan exists
+        if "initialization_plan" in state:
+            state["initialization_plan"]["completed_comments"] += 1
+
+    def has_activity_listeners(self) -> bool:
+        """
+        Check whether anything consumes activity log entries.
+
+        Callers can skip building activity details entirely when this is False.
+
+        Returns:
+            True if entries are persisted or an in-process listener is registered
+        """
+        return self.persist_activity_log or bool(self._activity_listeners)
+
+    def add_activity_listener(self, listener: Callable[[str, Dict[str, Any]], None]):
+        """
+        Register an in-process consumer of activity log entries.
+
+        Args:
+            listener: Callable invoked as listener(job_id, activity_entry)
+        """
+        self._activity_listeners.append(listener)
+
+    def remove_activity_listener(self, listener: Callable[[str, Dict[str, Any]], None]):
+        """
+        Unregister an activity log consumer.
+
+        Args:
+            listener: Previously registered listener
+        """
+        if listener in self._activity_listeners:
+            self._activity_listeners.remove(listener)
 
     def log_activity(self, job_id: str, action: str, details: Dict[str, Any]):
         """
         Log an activity to the activity log.
 
+        Entries are buffered in memory and written to disk once activity_flush_size
+        entries are pending, activity_flush_interval seconds have passed, or the job
+        state is saved for any other reason.
+
         Args:
             job_id: Job ID
             action: Type of action (e.g., 'comment_added', 'task_created')
             details: Details about the action
         """
+        if self._record_activity(job_id, action, details):
+            self.flush_activity_log(job_id)
+
+    def _record_activity(self, job_id: str, action: str, details: Dict[str, Any]) -> bool:
+        """
+        Hand an activity entry to listeners and the write buffer.
+
+        Returns:
+            True if the buffer for the job is due to be flushed
+        """
+        if not self.has_activity_listeners():
+            return False
+
+        activity_entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "action": action,
+            "details": details
+        }
+
+        for listener in list(self._activity_listeners):
+            try:
+                listener(job_id, activity_entry)
+            except Exception as e:
+                print(f"Error in activity listener for job {job_id}: {e}")
+
+        if not self.persist_activity_log:
+            return False
+
+        now = time.monotonic()
+        with self._activity_lock:
+            pending = self._activity_buffer.setdefault(job_id, [])
+            pending.append(activity_entry)
+            last_flush = self._activity_last_flush.setdefault(job_id, now)
+            return (len(pending) >= self.activity_flush_size or
+                    now - last_flush >= self.activity_flush_interval)
+
+    def flush_activity_log(self, job_id: str):
+        """
+        Write buffered activity entries for a job to disk.
+
+        Args:
+            job_id: Job ID
+        """
+        with self._activity_lock:
+            if not self._activity_buffer.get(job_id):
+                return
+
         state = self.load_state(job_id)
         if state:
-            activity_entry = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "action": action,
-                "details": details
-            }
-            state["activity_log"].append(activity_entry)
+            # save_state() drains the buffer into the activity log
+            self.save_state(job_id, state)
+        else:
+            # Job file is gone - nothing to write the entries into
+            self._drain_activity_buffer(job_id)
 
-            # Keep only last 1000 activities to prevent file from growing too large
-            if len(state["activity_log"]) > 1000:
-                state["activity_log"] = state["activity_log"][-1000:]
+    def _drain_activity_buffer(self, job_id: str) -> List[Dict[str, Any]]:
+        """
+        Remove and return buffered activity entries for a job.
 
-            self.save_state(job_id, state)
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Pending activity entries (oldest first)
+        """
+        with self._activity_lock:
+            self._activity_last_flush[job_id] = time.monotonic()
+            return self._activity_buffer.pop(job_id, [])
 
     def log_error(self, job_id: str, error_type: str, error_message: str):
         """
@@ -407,27 +560,63 @@ class StateManager:
         """
         state = self.load_state(job_id)
         if state:
-            now = datetime.now(timezone.utc).isoformat()
+            self._apply_increment_api_usage(state, api_type, count, tokens)
+            self.save_state(job_id, state)
 
-            # Check if we need to reset daily counters
-            last_reset = datetime.fromisoformat(state["api_usage"]["last_reset"])
-            current_time = datetime.now(timezone.utc)
+    def _apply_increment_api_usage(self, state: Dict[str, Any], api_type: str, count: int = 1,
+                                   tokens: int = 0):
+        """Increment API usage counters in an already-loaded state dict."""
+        now = datetime.now(timezone.utc).isoformat()
 
-            if current_time.date() > last_reset.date():
-                # New day - reset counters
-                state["api_usage"]["asana_calls_today"] = 0
-                state["api_usage"]["llm_calls_today"] = 0
-                state["api_usage"]["llm_tokens_today"] = 0
-                state["api_usage"]["last_reset"] = now
+        # Check if we need to reset daily counters
+        last_reset = datetime.fromisoformat(state["api_usage"]["last_reset"])
+        current_time = datetime.now(timezone.utc)
 
-            # Increment appropriate counter
-            if api_type == "asana":
-                state["api_usage"]["asana_calls_today"] += count
-            elif api_type == "llm":
-                state["api_usage"]["llm_calls_today"] += count
-                state["api_usage"]["llm_tokens_today"] += tokens
+        if current_time.date() > last_reset.date():
+            # New day - reset counters
+            state["api_usage"]["asana_calls_today"] = 0
+            state["api_usage"]["llm_calls_today"] = 0
+            state["api_usage"]["llm_tokens_today"] = 0
+            state["api_usage"]["last_reset"] = now
 
-            self.save_state(job_id, state)
+        # Increment appropriate counter
+        if api_type == "asana":
+            state["api_usage"]["asana_calls_today"] += count
+        elif api_type == "llm":
+            state["api_usage"]["llm_calls_today"] += count
+            state["api_usage"]["llm_tokens_today"] += tokens
+
+    def apply_batch(self, job_id: str, ops: List[Tuple[str, tuple]]):
+        """
+        Apply several queued updates with a single load and save of the job file.
+
+        Supported operations are "add_comment", "log_activity" and
+        "increment_api_usage", with the same arguments (minus job_id) as the
+        methods of the same name.
+
+        Args:
+            job_id: Job ID
+            ops: (operation name, args) tuples, applied in order
+        """
+        if not ops:
+            return
+
+        state = self.load_state(job_id)
+        if not state:
+            return
+
+        for name, args in ops:
+            if name == "log_activity":
+                # save_state() below drains the activity buffer
+                self._record_activity(job_id, *args)
+            elif name == "add_comment":
+                self._apply_add_comment(state, *args)
+            elif name == "increment_api_usage":
+                self._apply_increment_api_usage(state, *args)
+            else:
+                raise ValueError(f"Unsupported state operation: {name}")
+
+        self.save_state(job_id, state)
 
     def update_job_status(self, job_id: str, status: str):
         """
@@ -441,6 +630,25 @@ class StateManager:
         if state:
             state["status"] = status
             self.save_state(job_id, state)
+            self.status_changed_event(job_id).set()
+
+    def status_changed_event(self, job_id: str) -> threading.Event:
+        """
+        Get the event that is set whenever a job's status or deletion marker changes.
+
+        Services clear it once they have re-read the job file.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            threading.Event for the job
+        """
+        with self._status_events_lock:
+            event = self._status_events.get(job_id)
+            if event is None:
+                event = self._status_events[job_id] = threading.Event()
+            return event
 
     def update_next_activity_time(self, job_id: str, next_time: str):
         """
@@ -472,33 +680,32 @@ class StateManager:
 
         for state_file in self.state_dir.glob("job_*.json"):
             try:
-                with open(state_file, 'r') as f:
-                    state = json.load(f)
-
-                    # CRITICAL: Skip jobs marked for deletion (tombstone pattern)
-                    if state.get("_deleting"):
-                        continue
-
-                    # Migrate legacy jobs
-                    state = self._migrate_legacy_job(state)
-
-                    # Filter by connection type if specified
-                    if connection_type and state.get("connection_type") != connection_type:
-                        continue
-
-                    jobs.append({
-                        "job_id": state["job_id"],
-                        "job_name": state.get("job_name"),
-                        "connection_type": state.get("connection_type", "asana"),  # NEW
-                        "status": state["status"],
-                        "started_at": state["started_at"],
-                        "last_activity": state["last_activity"],
-                        "next_activity_time": state.get("next_activity_time"),
-                        "vendor": state["config"].get("vendor", "asana"),
-                        "industry": state["config"].get("industry", "Unknown"),
-                        "workspace_name": state["config"].get("workspace_name", "Unknown"),
-                        "stats": state["stats"]
-                    })
+                state = _load_state_file(state_file)
+
+                # CRITICAL: Skip jobs marked for deletion (tombstone pattern)
+                if state.get("_deleting"):
+                    continue
+
+                # Migrate legacy jobs
+                state = self._migrate_legacy_job(state)
+
+                # Filter by connection type if specified
+                if connection_type and state.get("connection_type") != connection_type:
+                    continue
+
+                jobs.append({
+                    "job_id": state["job_id"],
+                    "job_name": state.get("job_name"),
+                    "connection_type": state.get("connection_type", "asana"),  # NEW
+                    "status": state["status"],
+                    "started_at": state["started_at"],
+                    "last_activity": state["last_activity"],
+                    "next_activity_time": state.get("next_activity_time"),
+                    "vendor": state["config"].get("vendor", "asana"),
+                    "industry": state["config"].get("industry", "Unknown"),
+                    "workspace_name": state["config"].get("workspace_name", "Unknown"),
+                    "stats": state["stats"]
+                })
             except Exception as e:
                 print(f"Error loading {state_file}: {e}")
 
@@ -633,6 +840,7 @@ class StateManager:
         state["_deleting"] = True
         state["_deletion_timestamp"] = datetime.now(timezone.utc).isoformat()
         self.save_state(job_id, state)
+        self.status_changed_event(job_id).set()
         return True
 
     def delete_job(self, job_id: str) -> bool:
@@ -645,6 +853,10 @@ class StateManager:
         Returns:
             True if deleted, False if not found
         """
+        # Drop any activity entries still waiting to be written
+        self._drain_activity_buffer(job_id)
+        self.status_changed_event(job_id).set()
+
         state_file = self.state_dir / f"job_{job_id}.json"
         if state_file.exists():
             try:
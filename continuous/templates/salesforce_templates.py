@@ -18,6 +18,7 @@ Supports:
 """
 
 from typing import Dict, List, Any, Tuple
+import functools
 import random
 from datetime import datetime, timedelta
 
@@ -1440,10 +1441,13 @@ WIN_LOSS_REASONS = {
 # HELPER FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=None)
 def get_org_size_config(size: str) -> Dict[str, Any]:
     """
     Get configuration for an organization size.
 
+    Results are cached - treat the returned dictionary as read-only.
+
     Args:
         size: Organization size key ('startup', 'midsize', 'enterprise')
 
@@ -1458,10 +1462,13 @@ def get_org_size_config(size: str) -> Dict[str, Any]:
     return ORG_SIZE_TEMPLATES.get(size.lower(), ORG_SIZE_TEMPLATES['midsize'])
 
 
+@functools.lru_cache(maxsize=None)
 def get_industry_config(industry: str, org_size: str = "midsize") -> Dict[str, Any]:
     """
     Get comprehensive configuration for an industry and org size combination.
 
+    Results are cached - treat the returned dictionary as read-only.
+
     Args:
         industry: Industry key (e.g., 'healthcare', 'technology')
         org_size: Organization size ('startup', 'midsize', 'enterprise')
@@ -1485,6 +1492,23 @@ def get_industry_config(industry: str, org_size: str = "midsize") -> Dict[str, A
     return combined_config
 
 
+@functools.lru_cache(maxsize=None)
+def _sorted_account_type_shares(industry: str, org_size: str) -> Tuple[Tuple[str, float], ...]:
+    """
+    Get an industry's account type percentages, largest first.
+
+    Args:
+        industry: Industry key
+        org_size: Organization size
+
+    Returns:
+        Tuple of (account type, percentage) pairs sorted by percentage descending
+    """
+    account_types = get_industry_config(industry, org_size).get('account_types', {})
+    # Sort by percentage descending to allocate larger segments first
+    return tuple(sorted(account_types.items(), key=lambda x: x[1], reverse=True))
+
+
 def calculate_account_distribution(
     total_accounts: int,
     industry: str,
@@ -1508,19 +1532,15 @@ def calculate_account_distribution(
         >>> print(distribution)
         {'Hospital System': 250, 'Medical Practice': 300, ...}
     """
-    industry_config = get_industry_config(industry, org_size)
-    account_types = industry_config.get('account_types', {})
+    sorted_types = _sorted_account_type_shares(industry, org_size)
 
-    if not account_types:
+    if not sorted_types:
         # Default distribution if no industry-specific types
         return {"Prospect": int(total_accounts * 0.3), "Customer": int(total_accounts * 0.7)}
 
     distribution = {}
     remaining = total_accounts
 
-    # Sort by percentage descending to allocate larger segments first
-    sorted_types = sorted(account_types.items(), key=lambda x: x[1], reverse=True)
-
     for i, (account_type, percentage) in enumerate(sorted_types):
         if i == len(sorted_types) - 1:
             # Last type gets remaining accounts
@@ -1761,6 +1781,23 @@ def get_seasonal_multiplier(month: int, industry: str = "technology") -> float:
     return quarter_percentage * 4
 
 
+@functools.lru_cache(maxsize=None)
+def _stage_duration_ranges(sales_process: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Map each stage of a sales process to its duration range.
+
+    Results are cached - treat the returned dictionary as read-only.
+
+    Args:
+        sales_process: Sales process template key
+
+    Returns:
+        Dictionary mapping stage name to (min, max) days
+    """
+    process = SALES_PROCESS_TEMPLATES.get(sales_process, SALES_PROCESS_TEMPLATES['b2b_enterprise'])
+    return {stage['name']: tuple(stage['avg_duration_days']) for stage in process['stages']}
+
+
 def calculate_opportunity_stage_duration(
     stage_name: str,
     sales_process: str = "b2b_enterprise"
@@ -1780,15 +1817,12 @@ def calculate_opportunity_stage_duration(
         >>> print(days)
         22
     """
-    process = SALES_PROCESS_TEMPLATES.get(sales_process, SALES_PROCESS_TEMPLATES['b2b_enterprise'])
-
-    for stage in process['stages']:
-        if stage['name'] == stage_name:
-            duration_range = stage['avg_duration_days']
-            return random.randint(duration_range[0], duration_range[1])
+    duration_range = _stage_duration_ranges(sales_process).get(stage_name)
+    if duration_range is None:
+        # Default if stage not found
+        return random.randint(7, 30)
 
-    # Default if stage not found
-    return random.randint(7, 30)
+    return random.randint(duration_range[0], duration_range[1])
 
 
 def get_win_loss_reason(is_won: bool) -> str: